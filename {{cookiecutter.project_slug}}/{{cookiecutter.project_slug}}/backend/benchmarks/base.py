@@ -0,0 +1,133 @@
+import asyncio
+from dataclasses import dataclass, field
+import json
+import math
+import sys
+import time
+from typing import Any, Awaitable, Callable, Iterable, Mapping
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + self.errors
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: float) -> float:
+        return percentile(self.latencies, q)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "errors": self.errors,
+            "elapsed_s": round(self.elapsed, 6),
+            "rps": round(self.rps, 2),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+        }
+
+
+def percentile(values: Iterable[float], q: float) -> float:
+    """
+    Returns q-th percentile of the given values using nearest-rank method.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def run_concurrently(
+    name: str,
+    fun: Callable[[], Awaitable[Any]],
+    *,
+    requests: int,
+    concurrency: int,
+) -> BenchmarkResult:
+    """
+    Calls ``fun`` the given number of times keeping at most ``concurrency``
+    calls in flight and records the latency of every call.
+    """
+    result = BenchmarkResult(name=name)
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started_at = time.perf_counter()
+            try:
+                await fun()
+            except Exception:
+                result.errors += 1
+            else:
+                result.latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started_at
+
+    return result
+
+
+def timeit(fun: Callable[[], Any], *, number: int) -> float:
+    """
+    Returns average time of a single ``fun`` call in seconds.
+    """
+    started_at = time.perf_counter()
+    for _ in range(number):
+        fun()
+    return (time.perf_counter() - started_at) / number
+
+
+def write_report(report: Any) -> None:
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def find_regressions(
+    report: Iterable[Mapping[str, Any]],
+    baseline: Iterable[Mapping[str, Any]],
+    *,
+    max_throughput_drop: float,
+    max_latency_increase: float,
+) -> list[str]:
+    """
+    Compares ``BenchmarkResult.as_dict()`` rows with the baseline rows of the
+    same name. Thresholds are fractions of the baseline values, e.g. 0.1 for
+    10%. Rows missing in the baseline are skipped.
+    """
+    baseline_rows = {row["name"]: row for row in baseline}
+    regressions = []
+    for row in report:
+        if (baseline_row := baseline_rows.get(row["name"])) is None:
+            continue
+
+        name = row["name"]
+        if row["rps"] < baseline_row["rps"] * (1 - max_throughput_drop):
+            regressions.append(
+                f"{name}: rps dropped from {baseline_row['rps']} to {row['rps']}",
+            )
+        for key in ("p95_ms", "p99_ms"):
+            if row[key] > baseline_row[key] * (1 + max_latency_increase):
+                regressions.append(
+                    f"{name}: {key} increased from {baseline_row[key]} to {row[key]}",
+                )
+        if row["errors"] > baseline_row["errors"]:
+            regressions.append(
+                f"{name}: errors increased from {baseline_row['errors']} to "
+                f"{row['errors']}",
+            )
+
+    return regressions
@@ -0,0 +1,120 @@
+"""
+Compares throughput and latency of the tracing and scoped session middlewares
+implemented as pure ASGI middlewares with the ones wrapped into Starlette's
+``BaseHTTPMiddleware``. The baseline scoped session is kept inline as it was:
+a uuid4 per request registered in an ``async_scoped_session`` registry.
+
+Usage:
+
+    python -m benchmarks.bench_middleware --requests 20000 --concurrency 64
+"""
+import argparse
+import asyncio
+from contextvars import ContextVar
+from typing import Awaitable, Callable
+import uuid
+
+from fastapi import FastAPI, Request, Response
+import httpx
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from benchmarks.base import run_concurrently, write_report
+from src.infra.application.setup.sqlalchemy_scoped_session import (
+    ScopedSessionMiddleware,
+)
+from src.infra.application.setup.tracing import TracingMiddleware, trace_id
+
+
+CallNext = Callable[[Request], Awaitable[Response]]
+
+_legacy_session_id: ContextVar[str] = ContextVar("_legacy_session_id")
+legacy_scoped_session = async_scoped_session(
+    session_factory=async_sessionmaker(),
+    scopefunc=_legacy_session_id.get,
+)
+
+
+async def legacy_tracing_dispatch(request: Request, call_next: CallNext) -> Response:
+    trace_id.set(request.headers.get("x-trace-id") or uuid.uuid4().hex)
+    response = await call_next(request)
+    if trace_id_value := trace_id.get():
+        response.headers["X-Trace-ID"] = trace_id_value
+    return response
+
+
+async def legacy_scoped_session_dispatch(
+    request: Request,
+    call_next: CallNext,
+) -> Response:
+    reset_token = _legacy_session_id.set(uuid.uuid4().hex)
+    try:
+        return await call_next(request)
+    finally:
+        await legacy_scoped_session.remove()
+        _legacy_session_id.reset(reset_token)
+
+
+def create_app(*, legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "pass"}
+
+    if legacy:
+        app.add_middleware(BaseHTTPMiddleware, dispatch=legacy_tracing_dispatch)
+        app.add_middleware(
+            BaseHTTPMiddleware, dispatch=legacy_scoped_session_dispatch
+        )
+    else:
+        app.add_middleware(TracingMiddleware)
+        app.add_middleware(ScopedSessionMiddleware)
+
+    return app
+
+
+async def bench(*, requests: int, concurrency: int) -> list[dict]:
+    report = []
+    for name, legacy in (
+        ("BaseHTTPMiddleware", True),
+        ("ASGI middleware", False),
+    ):
+        app = create_app(legacy=legacy)
+        transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://bench",
+        ) as client:
+
+            async def call() -> None:
+                response = await client.get("/ping")
+                response.raise_for_status()
+
+            # warm up routing and middleware stack before measuring
+            await run_concurrently(name, call, requests=100, concurrency=1)
+            result = await run_concurrently(
+                name,
+                call,
+                requests=requests,
+                concurrency=concurrency,
+            )
+
+        report.append(result.as_dict())
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    write_report(
+        asyncio.run(bench(requests=args.requests, concurrency=args.concurrency))
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Compares row-by-row inserts and lookups with the bulk operations of
+GenericRepository. Requires migrated database at PG_DSN, every run is rolled
+back.
+
+Usage:
+
+    python -m benchmarks.bench_repository_bulk --rows 1000 10000 100000
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.base import write_report
+from src.config import get_config
+from src.infra.database.session import close_database, init_database, new_session
+from src.service.user.repository import UserRepository
+
+
+Bench = Callable[[AsyncSession, list[dict[str, Any]]], Awaitable[Any]]
+
+user_repo = UserRepository()
+
+
+def make_users(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "user_id": uuid.uuid4(),
+            "email": f"bench-{uuid.uuid4().hex}@example.com",
+            "password": b"password",
+        }
+        for _ in range(rows)
+    ]
+
+
+async def create_one_by_one(session: AsyncSession, users: list[dict]) -> None:
+    for user in users:
+        (await user_repo.create_record(session=session, **user)).unwrap()
+
+
+async def create_multi_row(session: AsyncSession, users: list[dict]) -> None:
+    created = await user_repo.create_records(
+        session=session,
+        records=users,
+        key="email",
+        copy_threshold=len(users) + 1,
+    )
+    assert not created.unwrap().conflicts
+
+
+async def create_copy(session: AsyncSession, users: list[dict]) -> None:
+    created = await user_repo.create_records(
+        session=session,
+        records=users,
+        key="email",
+        copy_threshold=1,
+    )
+    assert not created.unwrap().conflicts
+
+
+async def get_one_by_one(session: AsyncSession, users: list[dict]) -> None:
+    for user in users:
+        user_found = await user_repo.get_user_by_email(
+            session=session,
+            email=user["email"],
+        )
+        user_found.unwrap()
+
+
+async def get_bulk(session: AsyncSession, users: list[dict]) -> None:
+    users_found = await user_repo.get_users_by_emails(
+        session=session,
+        emails=[user["email"] for user in users],
+    )
+    assert len(users_found) == len(users)
+
+
+async def measure(name: str, bench: Bench, *, rows: int, seed: bool) -> dict:
+    users = make_users(rows)
+
+    async with new_session() as session:
+        try:
+            if seed:
+                await create_copy(session, users)
+                session.expunge_all()
+
+            started_at = time.perf_counter()
+            await bench(session, users)
+            elapsed = time.perf_counter() - started_at
+        finally:
+            await session.rollback()
+
+    return {
+        "name": name,
+        "rows": rows,
+        "elapsed_s": round(elapsed, 6),
+        "rows_per_s": round(rows / elapsed, 2),
+    }
+
+
+async def bench(*, rows: list[int], max_one_by_one_rows: int) -> list[dict]:
+    init_database(get_config())
+
+    report = []
+    for rows_count in rows:
+        for name, bench_fun, seed, one_by_one in (
+            ("create_record", create_one_by_one, False, True),
+            ("create_records multi-row", create_multi_row, False, False),
+            ("create_records copy", create_copy, False, False),
+            ("get_record", get_one_by_one, True, True),
+            ("get_records_by", get_bulk, True, False),
+        ):
+            if one_by_one and rows_count > max_one_by_one_rows:
+                continue
+
+            report.append(
+                await measure(name, bench_fun, rows=rows_count, seed=seed),
+            )
+
+    await close_database()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument(
+        "--max-one-by-one-rows",
+        type=int,
+        default=10_000,
+        help="skip row-by-row benchmarks above the given number of rows",
+    )
+    args = parser.parse_args()
+
+    write_report(
+        asyncio.run(
+            bench(rows=args.rows, max_one_by_one_rows=args.max_one_by_one_rows)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Compares per-call overhead of ``UserRepository.get_user_by_email`` with the
+statement built on every call, as it was before the statement cache, and with
+the cached one. Requires migrated database at PG_DSN for the round trip
+benchmark, every run is rolled back.
+
+Usage:
+
+    python -m benchmarks.bench_repository_statement --number 10000
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.base import timeit, write_report
+from src.infra.database.models import User
+from src.infra.database.repository import _get_select_statement
+from src.config import get_config
+from src.infra.database.session import close_database, init_database, new_session
+from src.service.user.repository import UserRepository
+
+
+user_repo = UserRepository()
+
+
+def build_statement(email: str) -> Any:
+    return select(User).where(User.email == email)
+
+
+def get_statement(email: str) -> Any:
+    return _get_select_statement(User, ("email",), (), False)
+
+
+async def get_user_by_email_uncached(session: AsyncSession, email: str) -> None:
+    query_result = await session.execute(build_statement(email))
+    assert query_result.scalars().first()
+
+
+async def get_user_by_email(session: AsyncSession, email: str) -> None:
+    (await user_repo.get_user_by_email(session=session, email=email)).unwrap()
+
+
+def measure_statement(
+    name: str,
+    get_query: Callable[[str], Any],
+    *,
+    number: int,
+) -> dict:
+    """
+    Measures the statement construction and cache key generation only,
+    which is what SQLAlchemy does before it finds the compiled statement.
+    """
+
+    def call() -> None:
+        get_query("user@example.com")._generate_cache_key()
+
+    return {
+        "name": name,
+        "number": number,
+        "per_call_us": round(timeit(call, number=number) * 1e6, 3),
+    }
+
+
+async def measure_round_trip(
+    name: str,
+    fun: Callable[[AsyncSession, str], Awaitable[None]],
+    *,
+    number: int,
+) -> dict:
+    email = f"bench-{uuid.uuid4().hex}@example.com"
+
+    async with new_session() as session:
+        try:
+            created = await user_repo.create_user(
+                session=session,
+                user_id=uuid.uuid4(),
+                email=email,
+                password=b"password",
+            )
+            created.unwrap()
+
+            # warm up caches and the connection
+            await fun(session, email)
+
+            started_at = time.perf_counter()
+            for _ in range(number):
+                await fun(session, email)
+            elapsed = time.perf_counter() - started_at
+        finally:
+            await session.rollback()
+
+    return {
+        "name": name,
+        "number": number,
+        "per_call_us": round(elapsed / number * 1e6, 3),
+    }
+
+
+async def bench(*, number: int, round_trip: bool) -> list[dict]:
+    report = [
+        measure_statement("statement uncached", build_statement, number=number),
+        measure_statement("statement cached", get_statement, number=number),
+    ]
+
+    if round_trip:
+        init_database(get_config())
+        for name, fun in (
+            ("get_user_by_email uncached", get_user_by_email_uncached),
+            ("get_user_by_email cached", get_user_by_email),
+        ):
+            report.append(await measure_round_trip(name, fun, number=number))
+
+        await close_database()
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument(
+        "--no-round-trip",
+        dest="round_trip",
+        action="store_false",
+        help="skip benchmarks which require database",
+    )
+    args = parser.parse_args()
+
+    write_report(asyncio.run(bench(number=args.number, round_trip=args.round_trip)))
+
+
+if __name__ == "__main__":
+    main()
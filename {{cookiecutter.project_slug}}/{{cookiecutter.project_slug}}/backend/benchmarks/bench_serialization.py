@@ -0,0 +1,154 @@
+"""
+Compares the cost of turning a route result into response body per endpoint:
+validation against ``response_model`` followed by ``JSONResponse`` or
+``ORJSONResponse``, as FastAPI does for returned models, and ``ModelResponse``
+which serializes the already validated model in one pass. The health probe is
+also compared with the former ``jsonable_encoder`` path.
+
+Usage:
+
+    python -m benchmarks.bench_serialization --number 10000
+"""
+import argparse
+import asyncio
+from datetime import UTC, datetime
+import time
+from typing import Any, Awaitable, Callable
+import uuid
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from benchmarks.base import write_report
+from src.api.rest.v1.user.dto import UserDto
+from src.infra.application.response import ListResponse, ModelResponse, Response
+from src.service.health_check.dto import CheckComponentType, CheckResult, HealthOut
+from src.service.user.dto import UserOutDto
+
+
+Render = Callable[[], Awaitable[Any]]
+
+
+def make_user() -> UserOutDto:
+    return UserOutDto(user_id=uuid.uuid4(), email="user@example.com")
+
+
+def make_health(checks: int) -> HealthOut:
+    return HealthOut(
+        status="pass",
+        version="0.0.1",
+        checks={
+            f"component:{i}": [
+                CheckResult(
+                    component_id=f"component:{i}",
+                    component_type=CheckComponentType.datastore,
+                    observed_value=i,
+                    observed_unit="ms",
+                    status="pass",
+                    time=datetime.now(UTC).isoformat(),
+                )
+            ]
+            for i in range(checks)
+        },
+    )
+
+
+def response_model_path(
+    response_model: Any,
+    content: Any,
+    response_class: type[JSONResponse],
+) -> Render:
+    field = create_response_field(name="response", type_=response_model)
+
+    async def render() -> Any:
+        return response_class(
+            await serialize_response(field=field, response_content=content),
+        )
+
+    return render
+
+
+def model_response_path(content: Any) -> Render:
+    async def render() -> Any:
+        return ModelResponse(content)
+
+    return render
+
+
+def jsonable_encoder_path(content: Any) -> Render:
+    async def render() -> Any:
+        return JSONResponse(jsonable_encoder(content))
+
+    return render
+
+
+def get_endpoints(page_size: int) -> dict[str, tuple[Any, Any]]:
+    return {
+        "GET /api/1/users/me": (
+            Response[UserDto],
+            Response(result=make_user()),
+        ),
+        f"GET /api/1/users/?limit={page_size}": (
+            ListResponse[UserDto],
+            ListResponse(
+                result=[make_user() for _ in range(page_size)],
+                next_cursor="cursor",
+            ),
+        ),
+        "GET /api/0/health/ready": (
+            HealthOut,
+            make_health(checks=8),
+        ),
+    }
+
+
+async def measure(endpoint: str, name: str, render: Render, *, number: int) -> dict:
+    await render()
+
+    started_at = time.perf_counter()
+    for _ in range(number):
+        await render()
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        "endpoint": endpoint,
+        "name": name,
+        "number": number,
+        "per_call_us": round(elapsed / number * 1e6, 3),
+    }
+
+
+async def bench(*, number: int, page_size: int) -> list[dict]:
+    report = []
+    for endpoint, (response_model, content) in get_endpoints(page_size).items():
+        paths = {
+            "response_model + JSONResponse": response_model_path(
+                response_model, content, JSONResponse
+            ),
+            "response_model + ORJSONResponse": response_model_path(
+                response_model, content, ORJSONResponse
+            ),
+            "ModelResponse": model_response_path(content),
+        }
+        if isinstance(content, HealthOut):
+            paths["jsonable_encoder + JSONResponse"] = jsonable_encoder_path(content)
+
+        for name, render in paths.items():
+            report.append(await measure(endpoint, name, render, number=number))
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+
+    write_report(asyncio.run(bench(number=args.number, page_size=args.page_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Compares throughput and latency of the app served by a single uvicorn process,
+as ``src.main.run_app`` does, and by gunicorn with uvicorn workers configured
+by ``src.gunicorn_conf``. The load is generated by several client processes,
+so that the client is not the bottleneck. Requires migrated database at PG_DSN
+for the probes which touch it.
+
+Usage:
+
+    python -m benchmarks.bench_server --workers 4 --requests 20000 --concurrency 64
+"""
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.base import BenchmarkResult, run_concurrently, write_report
+
+
+def get_server_commands(*, host: str, port: int, workers: int) -> dict[str, list]:
+    return {
+        "uvicorn": [
+            sys.executable,
+            *("-m", "uvicorn", "--factory", "src.main:create_app"),
+            *("--host", host, "--port", str(port)),
+        ],
+        f"gunicorn --workers {workers}": [
+            sys.executable,
+            *("-m", "gunicorn", "--config", "python:src.gunicorn_conf"),
+            *("--bind", f"{host}:{port}", "--workers", str(workers)),
+        ],
+    }
+
+
+def wait_until_ready(url: str, *, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+
+    raise TimeoutError(f"server is not ready at {url}")
+
+
+def load(name: str, url: str, requests: int, concurrency: int) -> BenchmarkResult:
+    async def run() -> BenchmarkResult:
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=concurrency),
+        ) as client:
+
+            async def request() -> None:
+                (await client.get(url)).raise_for_status()
+
+            return await run_concurrently(
+                name,
+                request,
+                requests=requests,
+                concurrency=concurrency,
+            )
+
+    return asyncio.run(run())
+
+
+def bench_server(
+    name: str,
+    command: list,
+    url: str,
+    *,
+    requests: int,
+    concurrency: int,
+    clients: int,
+) -> BenchmarkResult:
+    server = subprocess.Popen(
+        command,
+        env={**os.environ, "DEBUG": "false"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(url)
+
+        with ProcessPoolExecutor(max_workers=clients) as executor:
+            client_results = list(
+                executor.map(
+                    load,
+                    [name] * clients,
+                    [url] * clients,
+                    [requests // clients] * clients,
+                    [max(concurrency // clients, 1)] * clients,
+                )
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+    result = BenchmarkResult(name=name)
+    for client_result in client_results:
+        result.latencies.extend(client_result.latencies)
+        result.errors += client_result.errors
+        result.elapsed = max(result.elapsed, client_result.elapsed)
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--path", default="/api/0/health/live")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    host = "127.0.0.1"
+    url = f"http://{host}:{args.port}{args.path}"
+    commands = get_server_commands(host=host, port=args.port, workers=args.workers)
+
+    write_report(
+        [
+            bench_server(
+                name,
+                command,
+                url,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                clients=args.clients,
+            ).as_dict()
+            for name, command in commands.items()
+        ]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Reports where the startup time goes: the ``-X importtime`` breakdown of
+creating the app, grouped by top level package, and the time from spawning
+``uvicorn`` till it answers the first request.
+
+Usage:
+
+    python -m benchmarks.bench_startup --runs 5 --top 15
+"""
+import argparse
+from collections import defaultdict
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.base import write_report
+
+
+CREATE_APP = "from src.main import create_app; create_app()"
+
+
+def get_import_times(*, top: int) -> dict:
+    """
+    Returns the import time of creating the app, the self time of every
+    module is attributed to its top level package.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CREATE_APP],
+        env={**os.environ, "DEBUG": "false"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+
+    self_time_us: dict[str, int] = defaultdict(int)
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        self_time_us[module.strip().split(".")[0]] += int(self_us)
+
+    packages = sorted(self_time_us.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "total_ms": round(sum(self_time_us.values()) / 1000, 3),
+        "packages": [
+            {"package": package, "self_ms": round(self_us / 1000, 3)}
+            for package, self_us in packages[:top]
+        ],
+    }
+
+
+def get_time_to_first_request(*, port: int, path: str, timeout: float = 30.0) -> float:
+    url = f"http://127.0.0.1:{port}{path}"
+
+    started_at = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            *("-m", "uvicorn", "--factory", "src.main:create_app"),
+            *("--host", "127.0.0.1", "--port", str(port)),
+        ],
+        env={**os.environ, "DEBUG": "false"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started_at < timeout:
+            try:
+                if httpx.get(url).status_code == 200:
+                    return time.perf_counter() - started_at
+            except httpx.TransportError:
+                pass
+            time.sleep(0.01)
+    finally:
+        server.terminate()
+        server.wait()
+
+    raise TimeoutError(f"server is not ready at {url}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--path", default="/api/0/health/live")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    times_to_first_request = [
+        get_time_to_first_request(port=args.port, path=args.path)
+        for _ in range(args.runs)
+    ]
+
+    write_report(
+        {
+            "time_to_first_request_s": {
+                "min": round(min(times_to_first_request), 3),
+                "median": round(statistics.median(times_to_first_request), 3),
+            },
+            "import_time": get_import_times(top=args.top),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+End-to-end load test: seeds users, drives a weighted mix of the auth, user and
+health routes at fixed concurrency and reports throughput and latency
+percentiles per route. The app is served in-process by default, pass
+``--base-url`` to load a running server instead, it has to use the same
+database as PG_DSN. Requires migrated database at PG_DSN, the seeded and the
+created users are deleted at the end.
+
+All the requests come from one address, so the login throttle is disabled
+in-process. A server loaded with ``--base-url`` has to run with
+``LOGIN_THROTTLE_IP_RATE=0`` and ``LOGIN_THROTTLE_EMAIL_RATE=0``, otherwise the
+auth routes measure rejected attempts instead of bcrypt.
+
+The report can be saved with ``--output`` and compared with a saved one with
+``--baseline``, the exit code is 1 when any route regressed over the
+thresholds.
+
+Usage:
+
+    python -m benchmarks.load_test --users 100 --requests 5000 --concurrency 32
+    python -m benchmarks.load_test --output baseline.json
+    python -m benchmarks.load_test --baseline baseline.json --max-latency-increase 0.2
+"""
+import argparse
+import asyncio
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from functools import partial
+import itertools
+import json
+import random
+import sys
+import time
+from typing import Awaitable, Callable
+import uuid
+
+import httpx
+from sqlalchemy import delete
+
+from benchmarks.base import BenchmarkResult, find_regressions, write_report
+from src.config import get_config
+from src.infra.application.factory import app_factory
+from src.infra.database.models import User
+from src.infra.database.session import close_database, init_database, new_session
+from src.service.auth.password import get_password_hasher
+from src.service.auth.throttle import create_login_throttle, get_login_throttle
+from src.service.user.repository import UserRepository
+
+
+PASSWORD = "load-test-password"
+
+DEFAULT_MIX = {
+    "POST /api/1/auth/token": 1,
+    "GET /api/1/users/me": 5,
+    "POST /api/1/users/": 1,
+    "GET /api/0/health/live": 2,
+    "GET /api/0/health/ready": 1,
+}
+
+
+@dataclass
+class VirtualUser:
+    email: str
+    token: str = ""
+
+
+Scenario = Callable[[httpx.AsyncClient, VirtualUser], Awaitable[httpx.Response]]
+
+
+def get_email(prefix: str) -> str:
+    return f"{prefix}{uuid.uuid4().hex}@example.com"
+
+
+async def get_token(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    return await client.post(
+        "/api/1/auth/token",
+        json={"email": user.email, "password": PASSWORD},
+    )
+
+
+async def get_me(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    return await client.get(
+        "/api/1/users/me",
+        headers={"Authorization": f"Bearer {user.token}"},
+    )
+
+
+def create_user(prefix: str) -> Scenario:
+    async def scenario(client: httpx.AsyncClient, _: VirtualUser) -> httpx.Response:
+        return await client.post(
+            "/api/1/users/",
+            json={"email": get_email(prefix), "password": PASSWORD},
+        )
+
+    return scenario
+
+
+def get_probe(path: str) -> Scenario:
+    async def scenario(client: httpx.AsyncClient, _: VirtualUser) -> httpx.Response:
+        return await client.get(path)
+
+    return scenario
+
+
+def get_scenarios(prefix: str) -> dict[str, Scenario]:
+    return {
+        "POST /api/1/auth/token": get_token,
+        "GET /api/1/users/me": get_me,
+        "POST /api/1/users/": create_user(prefix),
+        "GET /api/0/health/live": get_probe("/api/0/health/live"),
+        "GET /api/0/health/ready": get_probe("/api/0/health/ready"),
+    }
+
+
+async def seed_users(*, users: int, prefix: str) -> list[VirtualUser]:
+    """
+    Inserts users in a single statement, they share one password hash, so
+    seeding does not cost a bcrypt round per user.
+    """
+    hashed_password = await get_password_hasher().hash_password(password=PASSWORD)
+    records = [
+        {
+            "user_id": uuid.uuid4(),
+            "email": get_email(prefix),
+            "password": hashed_password,
+        }
+        for _ in range(users)
+    ]
+
+    async with new_session() as session:
+        created = await UserRepository().create_records(
+            session=session,
+            records=records,
+            key="email",
+        )
+        assert not created.unwrap().conflicts
+        await session.commit()
+
+    return [VirtualUser(email=record["email"]) for record in records]
+
+
+async def delete_users(*, prefix: str) -> None:
+    async with new_session() as session:
+        await session.execute(delete(User).where(User.email.startswith(prefix)))
+        await session.commit()
+
+
+async def login(client: httpx.AsyncClient, users: list[VirtualUser]) -> None:
+    for user in users:
+        response = (await get_token(client, user)).raise_for_status()
+        user.token = response.json()["result"]["access_token"]
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    users: list[VirtualUser],
+    scenarios: dict[str, Scenario],
+    schedule: list[str],
+    *,
+    concurrency: int,
+) -> list[BenchmarkResult]:
+    """
+    Runs the scheduled scenarios keeping at most ``concurrency`` requests in
+    flight, every worker acts as one of the logged in users. A request fails
+    on a transport error or a non-2xx response.
+    """
+    results = {name: BenchmarkResult(name=name) for name in scenarios}
+    total = BenchmarkResult(name="total")
+    remaining = iter(schedule)
+
+    async def worker(user: VirtualUser) -> None:
+        for name in remaining:
+            started_at = time.perf_counter()
+            try:
+                (await scenarios[name](client, user)).raise_for_status()
+            except httpx.HTTPError:
+                results[name].errors += 1
+                total.errors += 1
+            else:
+                latency = time.perf_counter() - started_at
+                results[name].latencies.append(latency)
+                total.latencies.append(latency)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(worker(user) for user, _ in zip(itertools.cycle(users), range(concurrency)))
+    )
+    elapsed = time.perf_counter() - started_at
+
+    for result in (*results.values(), total):
+        result.elapsed = elapsed
+
+    return [result for result in results.values() if result.requests] + [total]
+
+
+async def load_test(args: argparse.Namespace) -> list[dict]:
+    config = get_config().model_copy(
+        update={
+            "log_level": "warning",
+            "debug": False,
+            "login_throttle_ip_rate": 0,
+            "login_throttle_email_rate": 0,
+        },
+    )
+    mix = json.loads(args.mix) if args.mix else DEFAULT_MIX
+    prefix = f"load-{uuid.uuid4().hex[:8]}-"
+    scenarios = {name: get_scenarios(prefix)[name] for name in mix}
+
+    async with AsyncExitStack() as stack:
+        if args.base_url:
+            init_database(config)
+            stack.push_async_callback(close_database)
+            client_props = {"base_url": args.base_url}
+        else:
+            app = app_factory(config)
+            # the routes read the global config, override the throttle of it
+            app.dependency_overrides[get_login_throttle] = partial(
+                create_login_throttle,
+                config,
+            )
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client_props = {
+                "base_url": "http://load-test",
+                "transport": httpx.ASGITransport(app=app),  # type: ignore[arg-type]
+            }
+
+        stack.push_async_callback(delete_users, prefix=prefix)
+        users = await seed_users(users=args.users, prefix=prefix)
+
+        client = await stack.enter_async_context(
+            httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=args.concurrency),
+                timeout=args.timeout,
+                **client_props,
+            )
+        )
+        await login(client, users[: args.concurrency])
+
+        schedule = random.Random(args.seed).choices(
+            list(mix),
+            weights=list(mix.values()),
+            k=args.requests,
+        )
+        results = await drive(
+            client,
+            users[: args.concurrency],
+            scenarios,
+            schedule,
+            concurrency=args.concurrency,
+        )
+
+    return [result.as_dict() for result in results]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mix",
+        help="route weights as JSON, e.g. '{\"GET /api/1/users/me\": 1}'",
+    )
+    parser.add_argument("--base-url")
+    parser.add_argument("--output", help="file to save the report to")
+    parser.add_argument("--baseline", help="report to compare with")
+    parser.add_argument("--max-throughput-drop", type=float, default=0.1)
+    parser.add_argument("--max-latency-increase", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.mix and (unknown := set(json.loads(args.mix)) - set(DEFAULT_MIX)):
+        parser.error(f"unknown routes in --mix: {sorted(unknown)}")
+
+    report = asyncio.run(load_test(args))
+    write_report(report)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = find_regressions(
+                report,
+                json.load(baseline),
+                max_throughput_drop=args.max_throughput_drop,
+                max_latency_increase=args.max_latency_increase,
+            )
+        for regression in regressions:
+            sys.stderr.write(f"regression: {regression}\n")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,17 @@
 import logging
 
 from fastapi import APIRouter, Depends, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 
 from src.config import config
-from src.service.health_check.checks import pg, sentry, uptime
+from src.infra.application.response import ModelResponse
+from src.service.health_check.checks import pg, password_hasher, sentry, uptime
 from src.service.health_check.dto import HealthOut
-from src.service.health_check.service import HealthCheckService, Probe, ProbeResult
+from src.service.health_check.service import (
+    Probe,
+    ProbeCache,
+    ProbeResult,
+    get_probe_cache,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -17,21 +21,20 @@ class HealthCheckRouter(APIRouter):
     def __init__(self, *probes: Probe):
         super().__init__()
 
+        self.probes = list(probes)
         for probe in probes:
             self.add_probe_route(probe)
 
     def add_probe_route(self, probe: Probe):
         async def handle_request(
-            health_check: HealthCheckService = Depends(),
+            probe_cache: ProbeCache = Depends(get_probe_cache),
         ):
-            probe_result: ProbeResult = await health_check.run_probe(probe)
-            return JSONResponse(
-                content=jsonable_encoder(
-                    HealthOut(
-                        status=probe_result.status.name,
-                        version=config.app_version,
-                        checks=probe_result.checks,
-                    )
+            probe_result: ProbeResult = await probe_cache.run_probe(probe)
+            return ModelResponse(
+                content=HealthOut(
+                    status=probe_result.status.name,
+                    version=config.app_version,
+                    checks=probe_result.checks,
                 ),
                 status_code=probe_result.status.code,
                 media_type="application/health+json",
@@ -63,9 +66,25 @@ health_check_router = HealthCheckRouter(
     ),
     Probe(
         name="ready",
+        cache_ttl=config.health_check_cache_ttl,
         checks=[
-            pg.PgCheck(component_id="pg:online"),
+            pg.PgCheck(component_id="pg:responseTime"),
+            pg.PgPoolCheck(component_id="pg:connections", measurement="connections"),
+            pg.PgPoolCheck(component_id="pg:waiters", measurement="waiters"),
+            pg.PgPoolCheck(component_id="pg:waitTime", measurement="waitTime"),
             sentry.SentryCheck(component_id="sentry:configured"),
+            password_hasher.PasswordHasherCheck(
+                component_id="password_hasher:queueDepth",
+                measurement="queueDepth",
+            ),
+            password_hasher.PasswordHasherCheck(
+                component_id="password_hasher:waitTime",
+                measurement="waitTime",
+            ),
+            password_hasher.PasswordHasherCheck(
+                component_id="password_hasher:rejected",
+                measurement="rejected",
+            ),
         ],
     ),
 )
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from src.infra.metrics import render_metrics
+
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get(
+    "",
+    response_class=Response,
+    summary="Prometheus metrics",
+    responses={
+        200: {
+            "content": {CONTENT_TYPE_LATEST: {}},
+            "description": "Metrics of all workers in text exposition format",
+        },
+    },
+)
+async def get_metrics() -> Response:
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
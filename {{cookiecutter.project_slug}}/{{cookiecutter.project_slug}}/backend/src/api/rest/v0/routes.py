@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from src.api.rest.v0.health_check.routes import health_check_router
+from src.api.rest.v0.metrics.routes import metrics_router
 
 
 api_v0_router = APIRouter()
@@ -8,3 +9,4 @@ api_v0_router = APIRouter()
 api_v0_router.include_router(
     health_check_router, tags=["Telemetry"], prefix="/health"
 )
+api_v0_router.include_router(metrics_router, tags=["Telemetry"], prefix="/metrics")
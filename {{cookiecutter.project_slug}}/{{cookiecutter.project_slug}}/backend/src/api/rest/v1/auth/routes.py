@@ -1,10 +1,10 @@
 import logging
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.security import OAuth2PasswordRequestForm
 
 from src.api.rest.v1.auth.dto import AccessTokenDto, CreateAccessTokenDto
-from src.infra.application.response import Response
+from src.infra.application.response import ModelResponse, Response
 from src.infra.database.session import AsyncSession, get_session
 from src.service.auth.dto import AccessTokenInDto
 from src.service.auth.service import AuthService
@@ -22,6 +22,7 @@ logger = logging.getLogger(__name__)
     summary="Create a new access token for user",
 )
 async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     auth_service: AuthService = Depends(),
     session: AsyncSession = Depends(get_session),
@@ -32,9 +33,10 @@ async def login(
             email=form_data.username,
             password=form_data.password,
         ),
+        client_ip=request.client.host if request.client else None,
     )
 
-    return token_claim.unwrap()
+    return ModelResponse(token_claim.unwrap())
 
 
 @auth_router.post(
@@ -43,6 +45,7 @@ async def login(
     summary="Create a new access token for user",
 )
 async def get_jwt_token(
+    request: Request,
     data_in: CreateAccessTokenDto,
     auth_service: AuthService = Depends(),
     session: AsyncSession = Depends(get_session),
@@ -50,6 +53,7 @@ async def get_jwt_token(
     token_claim = await auth_service.authenticate_user(
         session=session,
         access_token_in=AccessTokenInDto(**data_in.model_dump()),
+        client_ip=request.client.host if request.client else None,
     )
 
-    return Response(result=token_claim.unwrap())
+    return ModelResponse(Response(result=token_claim.unwrap()))
@@ -0,0 +1,140 @@
+"""
+Module parses the body of the user import as it arrives, one line at a time,
+so the memory used does not depend on the size of the upload.
+
+NDJSON rows are objects with ``email`` and ``password``, CSV starts with a
+header naming the ``email`` and ``password`` columns. A CSV record must fit
+one line.
+"""
+import csv
+from typing import AsyncIterable, AsyncIterator, Callable
+
+from pydantic import TypeAdapter, ValidationError
+
+from src.api.rest.v1.user.dto import CreateUserDto
+from src.service.user.dto import UserImportRowInDto, UserInDto
+
+
+# built once, so every row is validated by the compiled schema as is
+_create_user_adapter = TypeAdapter(CreateUserDto)
+
+RowParser = Callable[
+    [AsyncIterable[bytes], int],
+    AsyncIterator[UserImportRowInDto],
+]
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+    *,
+    max_line_size: int,
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Yields the lines of the chunked body with their numbers, starting at 1.
+    A line longer than ``max_line_size`` bytes is yielded as ``None`` and is
+    not kept in memory.
+    """
+    line_no = 0
+    buffer = bytearray()
+    too_long = False
+
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            line_no += 1
+            if too_long or len(buffer) + end - start > max_line_size:
+                yield line_no, None
+            else:
+                buffer += chunk[start:end]
+                yield line_no, bytes(buffer)
+
+            buffer.clear()
+            too_long = False
+            start = end + 1
+
+        if not too_long:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_size:
+                buffer.clear()
+                too_long = True
+
+    if buffer or too_long:
+        yield line_no + 1, None if too_long else bytes(buffer)
+
+
+def _get_error(err: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc']) or 'row'}: {error['msg']}"
+        for error in err.errors(include_url=False)
+    )
+
+
+def _get_row(line_no: int, data_in: CreateUserDto) -> UserImportRowInDto:
+    return UserImportRowInDto(
+        line=line_no,
+        user_in=UserInDto(**data_in.model_dump()),
+    )
+
+
+def _get_too_long_row(line_no: int, max_line_size: int) -> UserImportRowInDto:
+    return UserImportRowInDto(
+        line=line_no,
+        error=f"line is longer than {max_line_size} bytes",
+    )
+
+
+async def parse_ndjson(
+    chunks: AsyncIterable[bytes],
+    max_line_size: int,
+) -> AsyncIterator[UserImportRowInDto]:
+    async for line_no, line in iter_lines(chunks, max_line_size=max_line_size):
+        if line is None:
+            yield _get_too_long_row(line_no, max_line_size)
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            data_in = _create_user_adapter.validate_json(line)
+        except ValidationError as err:
+            yield UserImportRowInDto(line=line_no, error=_get_error(err))
+        else:
+            yield _get_row(line_no, data_in)
+
+
+async def parse_csv(
+    chunks: AsyncIterable[bytes],
+    max_line_size: int,
+) -> AsyncIterator[UserImportRowInDto]:
+    header: list[str] | None = None
+    async for line_no, line in iter_lines(chunks, max_line_size=max_line_size):
+        if line is None:
+            yield _get_too_long_row(line_no, max_line_size)
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            values = next(csv.reader([line.decode().rstrip("\r")]))
+        except (UnicodeDecodeError, csv.Error) as err:
+            yield UserImportRowInDto(line=line_no, error=str(err))
+            continue
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        try:
+            data_in = _create_user_adapter.validate_python(dict(zip(header, values)))
+        except ValidationError as err:
+            yield UserImportRowInDto(line=line_no, error=_get_error(err))
+        else:
+            yield _get_row(line_no, data_in)
+
+
+parsers: dict[str, RowParser] = {
+    "application/x-ndjson": parse_ndjson,
+    "text/csv": parse_csv,
+}
@@ -1,14 +1,23 @@
 import logging
+from typing import AsyncIterable, AsyncIterator
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.rest.v1.user.dto import CreateUserDto, UserDto
-from src.infra.application.response import Response
+from src.api.rest.v1.user.parser import parsers
+from src.config import config
+from src.infra.application.exception import UnsupportedMediaTypeError
+from src.infra.application.response import (
+    DuplexStreamingResponse,
+    ListResponse,
+    ModelResponse,
+    Response,
+)
 from src.infra.database.session import get_session
-from src.service.auth.dependency import check_jwt_token
+from src.service.auth.dependency import check_admin_jwt_token, check_jwt_token
 from src.service.auth.dto import JWTPayloadDto
-from src.service.user.dto import UserInDto
+from src.service.user.dto import UserImportRowOutDto, UserInDto
 from src.service.user.service import UserService
 
 
@@ -34,7 +43,53 @@ async def create_user(
         user_in=UserInDto(**data_in.model_dump()),
     )
 
-    return Response(result=new_user.unwrap())
+    return ModelResponse(
+        Response(result=new_user.unwrap()),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+async def _render_ndjson(
+    rows_out: AsyncIterable[UserImportRowOutDto],
+) -> AsyncIterator[bytes]:
+    async for row_out in rows_out:
+        yield row_out.model_dump_json(exclude_none=True).encode() + b"\n"
+
+
+@user_router.post(
+    "/import",
+    summary="Import users from NDJSON or CSV body",
+    description=(
+        "Accepts `application/x-ndjson` rows of `{\"email\": ..., "
+        "\"password\": ...}` or `text/csv` with the `email,password` header. "
+        "The body is processed as it arrives and the result of every row is "
+        "streamed back as NDJSON with the line number and the status: "
+        "`created`, `conflict`, `invalid` or `error`."
+    ),
+    response_class=DuplexStreamingResponse,
+)
+async def import_users(
+    request: Request,
+    jwt_payload: JWTPayloadDto = Depends(check_admin_jwt_token),
+    user_service: UserService = Depends(),
+    session: AsyncSession = Depends(get_session),
+):
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if (parse := parsers.get(media_type)) is None:
+        raise UnsupportedMediaTypeError(
+            f"expected one of the media types: {', '.join(parsers)}",
+        )
+
+    rows_out = user_service.import_users(
+        session=session,
+        rows=parse(request.stream(), config.user_import_max_line_size),
+        batch_size=config.user_import_batch_size,
+    )
+
+    return DuplexStreamingResponse(
+        _render_ndjson(rows_out),
+        media_type="application/x-ndjson",
+    )
 
 
 @user_router.get(
@@ -51,4 +106,35 @@ async def get_user_me(
         session=session,
         user_id=jwt_payload.user_id,
     )
-    return Response(result=user_found.unwrap())
+    return ModelResponse(Response(result=user_found.unwrap()))
+
+
+@user_router.get(
+    "/",
+    response_model=ListResponse[UserDto],
+    summary="List users",
+)
+async def get_users(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = Query(
+        default=None,
+        description="The next_cursor value of the previous page",
+    ),
+    jwt_payload: JWTPayloadDto = Depends(check_admin_jwt_token),
+    user_service: UserService = Depends(),
+    session: AsyncSession = Depends(get_session),
+):
+    users_page = (
+        await user_service.get_users(
+            session=session,
+            limit=limit,
+            cursor=cursor,
+        )
+    ).unwrap()
+
+    return ModelResponse(
+        ListResponse(
+            result=users_page.users,
+            next_cursor=users_page.next_cursor,
+        )
+    )
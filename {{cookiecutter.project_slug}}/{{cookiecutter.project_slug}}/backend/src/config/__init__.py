@@ -1,17 +1,29 @@
 from functools import lru_cache
-from typing import Final
+from typing import Any, Final, cast
 
 from dotenv import find_dotenv, load_dotenv
 
 from src.config.config import AppConfig
 
 
-load_dotenv(find_dotenv())
-
-
 @lru_cache
 def get_config() -> AppConfig:
+    load_dotenv(find_dotenv())
     return AppConfig()  # type: ignore[call-arg]
 
 
-config: Final[AppConfig] = get_config()
+class _LazyConfig:
+    """
+    Proxies the config built on first attribute access rather than on import,
+    so importing the modules which do not read the config, e.g. by alembic
+    migrations with an explicit URL, requires no environment.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_config())
+
+
+config: Final[AppConfig] = cast(AppConfig, _LazyConfig())
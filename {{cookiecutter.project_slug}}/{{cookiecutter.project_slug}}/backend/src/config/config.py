@@ -1,4 +1,5 @@
 import logging
+import os
 import secrets
 from typing import Self
 from typing import Literal
@@ -11,6 +12,7 @@ from src.config.environment import Environment
 
 
 _AnyLogLevel = Literal["debug", "info", "warning", "error", "critical"]
+_AnyLogOverflowPolicy = Literal["block", "drop_debug", "drop_oldest"]
 
 
 logger = logging.getLogger(__name__)
@@ -33,19 +35,73 @@ class AppConfig(BaseSettings):
 
     log_buffer_size: int = 1024
     log_flush_interval: int | float = 0.1
+    log_overflow_policy: _AnyLogOverflowPolicy = "drop_oldest"
     log_format: str = (
         "%(asctime)s %(levelname)s:%(funcName)s:%(lineno)d %(trace_id)s %(message)s"
     )
     log_level: _AnyLogLevel = "debug" if debug else "info"
+    log_renderer: Literal["text", "json"] = "text"
+    # share of records to pass per logger and level, see SamplingFilter
+    log_sampling_rates: dict[str, float] = Field(default_factory=dict)
+
+    # 0 for one worker per CPU available to the process
+    server_workers: int = 0
+    server_preload: bool = True
+    server_max_requests: int = 10_000
+    server_max_requests_jitter: int = 1_000
+    server_timeout: int = 60
+    server_graceful_timeout: int = 30
+    # addresses of the reverse proxies trusted to set X-Forwarded-For and
+    # X-Forwarded-Proto, "*" trusts any
+    server_forwarded_allow_ips: list[str] = Field(
+        default_factory=lambda: ["127.0.0.1"],
+    )
+
+    pre_flight_timeout: float = 300.0
+    pre_flight_attempt_timeout: float = 5.0
+    pre_flight_initial_wait: float = 0.05
+    pre_flight_max_wait: float = 5.0
 
     trace_header_name: str = "X-Trace-ID"
 
+    default_response_class: Literal["json", "orjson"] = "orjson"
+
+    metrics_sample_interval: float = 5.0
+
+    health_check_cache_ttl: float = 1.0
+    health_check_max_stale: float = 10.0
+    health_check_timeout: float = 2.0
+    health_check_pg_warn_response_time: float = 0.1
+    health_check_pg_fail_response_time: float = 1.0
+
     pg_dsn: URL | None = None
 
     @field_validator("pg_dsn", mode="before")
     def coerce_pg_dsn_to_yarl_url(cls, value: str | None) -> URL | None:  # noqa: N805
         return URL(value) if value else None
 
+    pg_pool_size: int = 5
+    pg_pool_max_overflow: int = 10
+    pg_pool_timeout: float = 30.0
+    pg_pool_recycle: int = -1
+    pg_pool_pre_ping: bool = False
+    pg_statement_cache_size: int = 100
+    pg_prepared_statement_cache_size: int = 100
+    pg_command_timeout: float | None = None
+    pg_server_settings: dict[str, str] = Field(default_factory=dict)
+
+    pg_replica_dsns: list[URL] = Field(default_factory=list)
+
+    @field_validator("pg_replica_dsns", mode="before")
+    def coerce_pg_replica_dsns_to_yarl_urls(
+        cls,  # noqa: N805
+        value: list[str],
+    ) -> list[URL]:
+        return [URL(dsn) for dsn in value]
+
+    pg_replica_retry_interval: float = 30.0
+    pg_replica_sticky_ttl: float = 5.0
+
     cors_origins: list[AnyHttpUrl] = Field(default_factory=list)
     cors_methods: list[str]
     cors_headers: list[str]
@@ -62,6 +118,11 @@ class AppConfig(BaseSettings):
         for prop, value in dict(self).items():
             if isinstance(value, URL):
                 value = value.with_password("***")
+            elif isinstance(value, list):
+                value = [
+                    item.with_password("***") if isinstance(item, URL) else item
+                    for item in value
+                ]
 
             new_config[prop] = value
 
@@ -70,3 +131,26 @@ class AppConfig(BaseSettings):
     jwt_exp: int = 5
     jwt_algorithm: str = "HS256"
     jwt_secret: str = secret_key
+    jwt_cache_max_size: int = 4096
+
+    cache_backend: Literal["memory", "postgres"] = "memory"
+    cache_max_size: int = 10_000
+    user_cache_ttl: float = 60.0
+
+    rate_limit_backend: Literal["memory", "postgres"] = "memory"
+    rate_limit_max_size: int = 100_000
+    # token buckets of login attempts: refill per second and capacity,
+    # 0 rate disables the bucket
+    login_throttle_ip_rate: float = 0.5
+    login_throttle_ip_burst: int = 30
+    login_throttle_email_rate: float = 0.05
+    login_throttle_email_burst: int = 10
+
+    password_hasher_executor: Literal["thread", "process"] = "thread"
+    password_hasher_max_workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+    )
+    password_hasher_queue_size: int = 64
+
+    user_import_batch_size: int = 1000
+    user_import_max_line_size: int = 64 * 1024
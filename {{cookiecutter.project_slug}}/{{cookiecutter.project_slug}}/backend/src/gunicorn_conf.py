@@ -0,0 +1,80 @@
+"""
+Gunicorn settings of the production server, e.g.
+
+    gunicorn --config python:src.gunicorn_conf
+
+The app is imported once in the master process and the workers are forked
+from it, so the worker start is fast and the memory of the imported modules
+is shared. The state which must not be shared across processes, i.e. the
+database engines, is created by every worker on the app startup.
+
+The workers are started once the pre-flight check has found the dependencies
+ready, a failed check stops the server.
+"""
+import asyncio
+import glob
+import os
+
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+from prometheus_client import multiprocess
+
+from src.config import config as app_config
+from src.infra.application.pre_flight_check import pre_flight_check
+from src.infra.application.setup.logging import shutdown_logging
+
+
+def get_workers_count() -> int:
+    if app_config.server_workers:
+        return app_config.server_workers
+
+    return len(os.sched_getaffinity(0))
+
+
+wsgi_app = "src.main:create_app()"
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = f"{app_config.app_host.host}:{app_config.app_host.port}"
+workers = get_workers_count()
+preload_app = app_config.server_preload
+
+# workers are restarted after the given number of requests to bound the
+# effect of leaks, the jitter keeps them from restarting at once
+max_requests = app_config.server_max_requests
+max_requests_jitter = app_config.server_max_requests_jitter
+
+timeout = app_config.server_timeout
+# time given to the workers to finish the requests in flight on shutdown or
+# restart, the lifespan shutdown runs within it as well
+graceful_timeout = app_config.server_graceful_timeout
+
+# the uvicorn worker takes the client address from X-Forwarded-For of these
+# proxies only, so the login throttle does not see every client as the proxy
+forwarded_allow_ips = ",".join(app_config.server_forwarded_allow_ips)
+
+
+def on_starting(server: Arbiter) -> None:
+    """
+    Removes the metrics left by the previous run.
+    """
+    if multiproc_dir := os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        for path in glob.glob(os.path.join(multiproc_dir, "*.db")):
+            os.remove(path)
+
+
+def when_ready(server: Arbiter) -> None:
+    """
+    Waits for the dependencies before the workers are spawned.
+    """
+    asyncio.run(pre_flight_check())
+
+
+def worker_exit(server: Arbiter, worker: Worker) -> None:
+    shutdown_logging()
+
+
+def child_exit(server: Arbiter, worker: Worker) -> None:
+    """
+    Drops the live gauges of the exited worker from the metrics.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
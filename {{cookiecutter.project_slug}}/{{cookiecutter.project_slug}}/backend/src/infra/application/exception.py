@@ -22,6 +22,10 @@ class BadRequestError(AppError):
     status_code = status.HTTP_400_BAD_REQUEST
 
 
+class AlreadyExistsError(BadRequestError):
+    ...
+
+
 class UnauthorizedError(AppError):
     status_code = status.HTTP_401_UNAUTHORIZED
 
@@ -32,3 +36,15 @@ class ForbiddenError(AppError):
 
 class NotFoundError(AppError):
     status_code = status.HTTP_404_NOT_FOUND
+
+
+class UnsupportedMediaTypeError(AppError):
+    status_code = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+class TooManyRequestsError(AppError):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+
+
+class ServiceUnavailableError(AppError):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -0,0 +1,166 @@
+"""
+Module implements executor to run blocking calls off the event loop.
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import logging
+import multiprocessing
+import time
+from typing import Any, Callable, Literal, TypeVar
+
+from src.infra.application.exception import ServiceUnavailableError
+
+
+logger = logging.getLogger(__name__)
+
+
+R = TypeVar("R")
+
+ExecutorKind = Literal["thread", "process"]
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    max_workers: int
+    max_queue_size: int
+    in_flight: int
+    queue_depth: int
+    completed: int
+    rejected: int
+    wait_time_avg: float
+    wait_time_max: float
+
+
+def _timed_call(
+    fun: Callable[..., R],
+    *args: Any,
+) -> tuple[float, R]:
+    """
+    Returns the moment the call is actually started along with the call
+    result. Monotonic clock is system-wide, so the value is comparable between
+    processes.
+    """
+    return time.monotonic(), fun(*args)
+
+
+class BoundedExecutor:
+    """
+    Runs blocking calls in a thread or process pool.
+
+    At most ``max_workers`` calls are running and ``max_queue_size`` calls are
+    waiting for a free worker, any call above that is rejected with
+    ``ServiceUnavailableError`` instead of growing the queue unbounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        kind: ExecutorKind,
+        max_workers: int,
+        max_queue_size: int,
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        """
+        The pool is created on first use, so every forked worker gets its own.
+        """
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    def _create_executor(self) -> Executor:
+        if self.kind == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=self.name,
+        )
+
+    async def run(self, fun: Callable[..., R], *args: Any) -> R:
+        if self._in_flight >= self.max_workers + self.max_queue_size:
+            self._rejected += 1
+            logger.warning(
+                "executor is saturated, call rejected: name=%s stats=%s",
+                self.name,
+                self.stats(),
+            )
+            raise ServiceUnavailableError(
+                "service is overloaded, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        loop = asyncio.get_running_loop()
+
+        submitted_at = time.monotonic()
+        future = loop.run_in_executor(
+            self.executor,
+            _timed_call,
+            fun,
+            *args,
+        )
+
+        self._in_flight += 1
+        future.add_done_callback(
+            functools.partial(self._on_call_done, submitted_at=submitted_at),
+        )
+
+        # A running call cannot be interrupted, so the cancellation of the
+        # caller must not release the slot before the pool actually does.
+        _, result = await asyncio.shield(future)
+        return result
+
+    def _on_call_done(
+        self,
+        future: "asyncio.Future[tuple[float, Any]]",
+        *,
+        submitted_at: float,
+    ) -> None:
+        self._in_flight -= 1
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        started_at, _ = future.result()
+        wait_time = max(started_at - submitted_at, 0.0)
+
+        self._completed += 1
+        self._wait_time_total += wait_time
+        self._wait_time_max = max(self._wait_time_max, wait_time)
+
+    def stats(self) -> ExecutorStats:
+        return ExecutorStats(
+            max_workers=self.max_workers,
+            max_queue_size=self.max_queue_size,
+            in_flight=self._in_flight,
+            queue_depth=max(self._in_flight - self.max_workers, 0),
+            completed=self._completed,
+            rejected=self._rejected,
+            wait_time_avg=(
+                self._wait_time_total / self._completed if self._completed else 0.0
+            ),
+            wait_time_max=self._wait_time_max,
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -1,22 +1,72 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from functools import partial
 import logging
+from typing import AsyncIterator
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.types import ASGIApp
 
+from src.api.rest.v0.health_check.routes import health_check_router
 from src.api.rest.v0.routes import api_v0_router
 from src.api.rest.v1.routes import api_v1_router
 from src.config import AppConfig
 from src.infra.application.setup.cors import setup_cors_middleware
-from src.infra.application.setup.logging import setup_logging
+from src.infra.application.setup.logging import setup_logging, shutdown_logging
+from src.infra.application.setup.metrics import MetricsSampler, setup_metrics
 from src.infra.application.setup.sentry import setup_sentry
 from src.infra.application.setup.sqlalchemy_scoped_session import (
     setup_sqlalchemy_scoped_session,
 )
 from src.infra.application.setup.tracing import setup_tracing_middleware
+from src.infra.database.session import close_database, init_database
+from src.service.auth.password import get_password_hasher
+from src.service.health_check.service import get_probe_cache
 
 
 logger = logging.getLogger(__name__)
 
+_default_response_classes = {
+    "json": JSONResponse,
+    "orjson": ORJSONResponse,
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI, *, config: AppConfig) -> AsyncIterator[None]:
+    logger.info("create database engines")
+    database = init_database(config)
+
+    logger.info("start health probes refresher")
+    probes_refresher = asyncio.create_task(
+        get_probe_cache().refresh_forever(health_check_router.probes),
+    )
+    logger.info("start metrics sampler")
+    metrics_sampler = asyncio.create_task(
+        MetricsSampler(
+            database.engines,
+            interval=config.metrics_sample_interval,
+        ).sample_forever(),
+    )
+
+    yield
+
+    logger.info("stop metrics sampler and health probes refresher")
+    for task in (metrics_sampler, probes_refresher):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    logger.info("dispose database engines")
+    await close_database()
+
+    logger.info("flush logs")
+    shutdown_logging()
+
+    logger.info("shutdown password hasher executor")
+    get_password_hasher().executor.shutdown()
+
 
 def app_factory(config: AppConfig) -> ASGIApp:
     setup_logging(config)
@@ -28,6 +78,10 @@ def app_factory(config: AppConfig) -> ASGIApp:
         "docs_url": config.docs_url,
         "openapi_url": config.openapi_url,
         "redoc_url": None,
+        "lifespan": partial(lifespan, config=config),
+        "default_response_class": _default_response_classes[
+            config.default_response_class
+        ],
     }
 
     if config.environment.is_deployed:
@@ -59,6 +113,7 @@ def app_factory(config: AppConfig) -> ASGIApp:
 
     setup_cors_middleware(app, config)
     setup_tracing_middleware(app, config)
+    setup_metrics(app, config)
     setup_sqlalchemy_scoped_session(app)
 
     app.include_router(
@@ -2,47 +2,103 @@
 Module performs pre-flight check application dependencies.
 """
 import asyncio
+from dataclasses import dataclass
+from functools import partial
 import logging
-from typing import Final
+from typing import Awaitable, Callable
 
-from sqlalchemy import text
 from tenacity import (
-    after_log,
-    before_log,
-    retry,
-    stop_after_attempt,
-    wait_fixed,
+    AsyncRetrying,
+    before_sleep_log,
+    retry_if_exception,
+    stop_after_delay,
+    wait_random_exponential,
 )
 
-from src.infra.database.session import async_session_factory
+from src.config import AppConfig, get_config
+from src.infra.database.ping import is_retryable_error, ping
+from src.infra.database.session import Database, close_database, init_database
 
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.StreamHandler())
 logger.setLevel(logging.INFO)
 
-max_tries: Final[int] = 60 * 5
-wait_seconds: Final[int] = 1
 
+def _always_retryable(exc: BaseException) -> bool:
+    return True
 
-@retry(
-    stop=stop_after_attempt(max_tries),
-    wait=wait_fixed(wait_seconds),
-    before=before_log(logger, logging.INFO),
-    after=after_log(logger, logging.WARNING),
-)
-async def wait_for_deps() -> None:
+
+@dataclass(frozen=True)
+class Dependency:
+    name: str
+    ping: Callable[[], Awaitable[None]]
+    is_retryable: Callable[[BaseException], bool] = _always_retryable
+
+
+def get_dependencies(database: Database) -> list[Dependency]:
+    return [
+        Dependency(
+            name=f"pg:{name}",
+            ping=partial(ping, engine),
+            is_retryable=is_retryable_error,
+        )
+        for name, engine in database.engines.items()
+    ]
+
+
+async def wait_for_dependency(dependency: Dependency, config: AppConfig) -> None:
+    """
+    Pings the dependency until it answers. The waits between attempts grow
+    exponentially from ``pre_flight_initial_wait`` up to
+    ``pre_flight_max_wait`` and are randomized, so the instances started
+    together do not retry in lockstep. Gives up on the first non-retryable
+    error or after ``pre_flight_timeout`` seconds.
+    """
+    retrying = AsyncRetrying(
+        stop=stop_after_delay(config.pre_flight_timeout),
+        wait=wait_random_exponential(
+            multiplier=config.pre_flight_initial_wait,
+            max=config.pre_flight_max_wait,
+        ),
+        retry=retry_if_exception(dependency.is_retryable),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+
+    async for attempt in retrying:
+        with attempt:
+            await asyncio.wait_for(
+                dependency.ping(),
+                timeout=config.pre_flight_attempt_timeout,
+            )
+
+    logger.info("dependency [%s] is ready", dependency.name)
+
+
+async def wait_for_deps(dependencies: list[Dependency], config: AppConfig) -> None:
+    """
+    Waits for all the dependencies in parallel, the first failure cancels
+    the rest.
+    """
     try:
-        async with async_session_factory() as session:
-            await session.execute(text("select true"))
-    except Exception as exc:
-        logger.error(exc)
-        raise exc
+        async with asyncio.TaskGroup() as task_group:
+            for dependency in dependencies:
+                task_group.create_task(wait_for_dependency(dependency, config))
+    except ExceptionGroup as exc_group:
+        for exc in exc_group.exceptions:
+            logger.error("pre-flight check failed: %r", exc)
+        raise
 
 
 async def pre_flight_check() -> None:
     logger.info("service pre-flight check")
-    await wait_for_deps()
+    config = get_config()
+    database = init_database(config)
+    try:
+        await wait_for_deps(get_dependencies(database), config)
+    finally:
+        await close_database()
     logger.info("service pre-flight check finished")
 
 
@@ -1,6 +1,8 @@
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
 
 
 T = TypeVar("T", bound=BaseModel)
@@ -12,3 +14,38 @@ class Response(BaseModel, Generic[T]):
 
 class ListResponse(BaseModel, Generic[T]):
     result: list[T]
+    next_cursor: str | None = None
+
+
+class ModelResponse(JSONResponse):
+    """
+    Renders an already validated model straight to JSON by pydantic.
+
+    FastAPI returns response instances as is, so a route returning
+    ``ModelResponse`` skips validation and serialization against its
+    ``response_model``, which is then used for the documentation only. The
+    model must not expose more fields than the ``response_model`` does.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+
+        return super().render(content)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streams the response while the route is still reading the request body.
+
+    ``StreamingResponse`` listens for the client disconnect by reading the
+    request messages, so it would steal the body chunks from a route reading
+    ``request.stream()`` in its iterator. This one leaves the messages to the
+    route, a disconnected client fails the ``send()`` instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
@@ -1,42 +1,79 @@
-import asyncio
 import atexit
+from collections import deque
 from contextlib import suppress
+import copy
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 import logging
 import logging.handlers
+import os
+import random
 import sys
 import threading
-import time
-from types import MappingProxyType
-from typing import Any, Callable, Final
+from typing import Any, Callable, Final, Literal, Mapping
+
+import orjson
 
 from src.config import AppConfig
 from src.infra.application.setup.tracing import get_trace_id
 
 
-F = Callable[..., Any]
+LogOverflowPolicy = Literal["block", "drop_debug", "drop_oldest"]
 
 
 def setup_logging(config: AppConfig) -> None:
+    global _log_pipeline
+
     log_level = logging.getLevelName(config.log_level.upper())
     log_format = config.log_format
 
-    stream_handler = _create_logging_handler(log_format)
-    buffered_handler = _wrap_logging_handler(
+    if _log_pipeline is not None:
+        _log_pipeline.stop()
+        logging.getLogger().removeHandler(_log_pipeline.handler)
+
+    stream_handler = _create_logging_handler(
+        log_format,
+        renderer=config.log_renderer,
+    )
+    _log_pipeline = LogPipeline(
         stream_handler,
-        loop=asyncio.get_running_loop(),
-        buffer_size=config.log_buffer_size,
+        queue=LogQueue(
+            max_size=config.log_buffer_size,
+            overflow_policy=config.log_overflow_policy,
+        ),
         flush_interval=config.log_flush_interval,
     )
+    if config.log_sampling_rates:
+        _log_pipeline.queue_handler.addFilter(
+            SamplingFilter(config.log_sampling_rates),
+        )
 
     logging.basicConfig(
         format=log_format,
         level=log_level,
         handlers=[
-            buffered_handler,
+            _log_pipeline.queue_handler,
         ],
     )
 
+    _log_pipeline.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Writes out the queued records and switches logging to synchronous
+    writes, so no record is lost on exit.
+    """
+    if _log_pipeline is not None:
+        _log_pipeline.stop()
+
+
+def get_log_queue_stats() -> "LogQueueStats | None":
+    if _log_pipeline is None:
+        return None
+
+    return _log_pipeline.queue.stats()
+
 
 _trace_id_record_attr: Final[str] = "trace_id"
 _trace_id_record_default_value: Final[str] = "-"
@@ -50,106 +87,349 @@ class TraceIdFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Used to attach Trace ID value to the log record via ``name``
-        attribute.
+        attribute, unless the record already has one.
         """
-        setattr(record, self.name, get_trace_id(self.default_value))
+        if not hasattr(record, self.name):
+            setattr(record, self.name, get_trace_id(self.default_value))
         return True
 
 
-class BufferedHandler(logging.handlers.MemoryHandler):
+class JsonFormatter(logging.Formatter):
+    """
+    Renders the record as a single line JSON object including the trace id
+    and the fields given via ``extra``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            _trace_id_record_attr: getattr(
+                record,
+                _trace_id_record_attr,
+                _trace_id_record_default_value,
+            ),
+        }
+
+        for attr, value in record.__dict__.items():
+            if attr not in _log_record_attrs:
+                log_entry[attr] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            log_entry["stack_info"] = record.stack_info
+
+        return orjson.dumps(log_entry, default=str).decode()
+
+
+_log_record_attrs: Final = frozenset(
+    (
+        *vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)),
+        "message",
+        "asctime",
+        _trace_id_record_attr,
+    )
+)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Passes only the given share of records per logger and level, WARNING and
+    above always pass.
+
+    Rates are keyed by ``<logger>`` or ``<logger>:<level>``, e.g.
+    ``{"src.service": 0.1, "src.service.user.service:info": 0.01}``, and
+    apply to the child loggers as well, the most specific key wins.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float],
+        *,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
+        super().__init__()
+        self.rates = {key.lower(): rate for key, rate in rates.items()}
+        self.sample = sample
+
+        self._resolved_rates: dict[tuple[str, int], float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rate = self._get_rate(record.name, record.levelno)
+        return rate >= 1.0 or self.sample() < rate
+
+    def _get_rate(self, logger_name: str, levelno: int) -> float:
+        key = (logger_name, levelno)
+        if (rate := self._resolved_rates.get(key)) is None:
+            rate = self._resolved_rates[key] = self._find_rate(
+                logger_name.lower(),
+                logging.getLevelName(levelno).lower(),
+            )
+
+        return rate
+
+    def _find_rate(self, logger_name: str, level_name: str) -> float:
+        name_parts = logger_name.split(".")
+        for i in range(len(name_parts), 0, -1):
+            name = ".".join(name_parts[:i])
+            for rate_key in (f"{name}:{level_name}", name):
+                if rate_key in self.rates:
+                    return self.rates[rate_key]
+
+        return 1.0
+
+
+@dataclass(frozen=True)
+class LogQueueStats:
+    size: int
+    max_size: int
+    dropped: int
+
+
+class LogQueue:
+    """
+    Bounded hand-off of log records from the logging callers to the writer
+    thread.
+
+    Appends to and pops from a deque are atomic, so neither side takes a lock
+    unless the queue is full. Then the overflow policy applies:
+
+    - ``block``: the caller waits until the writer drains the queue;
+    - ``drop_debug``: DEBUG records are dropped, others wait as with block;
+    - ``drop_oldest``: the oldest queued record is dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        overflow_policy: LogOverflowPolicy = "drop_oldest",
+    ) -> None:
+        self.max_size = max(max_size, 1)
+        self.overflow_policy = overflow_policy
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Empties the queue and recreates the locks, which might be held by
+        another thread at the time of fork.
+        """
+        self._records: deque[logging.LogRecord] = deque()
+        self._dropped = 0
+        self._ready = threading.Event()
+        self._not_full = threading.Condition()
+
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        """
+        Called by ``QueueHandler``. Despite the name, which is kept for
+        compatibility with ``queue.Queue``, it blocks with ``block`` policy.
+        """
+        if len(self._records) >= self.max_size and not self._make_room(record):
+            return
+
+        self._records.append(record)
+
+        # Wake the writer up before the flush interval to not overflow.
+        if len(self._records) >= self.max_size // 2 and not self._ready.is_set():
+            self._ready.set()
+
+    def wait(self, timeout: float) -> None:
+        """
+        Waits until the queue is half full or the timeout expires.
+        """
+        self._ready.wait(timeout)
+        self._ready.clear()
+
+    def wakeup(self) -> None:
+        self._ready.set()
+
+    def drain(self) -> list[logging.LogRecord]:
+        records = []
+        with suppress(IndexError):
+            for _ in range(len(self._records)):
+                records.append(self._records.popleft())
+
+        with self._not_full:
+            self._not_full.notify_all()
+
+        return records
+
+    def stats(self) -> LogQueueStats:
+        return LogQueueStats(
+            size=len(self._records),
+            max_size=self.max_size,
+            dropped=self._dropped,
+        )
+
+    def _make_room(self, record: logging.LogRecord) -> bool:
+        """
+        Applies the overflow policy, returns False if the record is dropped.
+        """
+        with self._not_full:
+            if self.overflow_policy == "drop_oldest":
+                with suppress(IndexError):
+                    self._records.popleft()
+                    self._dropped += 1
+                return True
+
+            if (
+                self.overflow_policy == "drop_debug"
+                and record.levelno <= logging.DEBUG
+            ):
+                self._dropped += 1
+                return False
+
+            while len(self._records) >= self.max_size:
+                self._ready.set()
+                self._not_full.wait(timeout=0.1)
+
+            return True
+
+
+class TraceIdQueueHandler(logging.handlers.QueueHandler):
     """
     Used to resolve value of trace_id contextvar on emit. Otherwise the log
     record may contains stale value of the contextvar.
     """
 
-    def emit(self, record: logging.LogRecord) -> None:
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Interpolates the message, as the arguments may change before the
+        writer gets to the record, and renders the exception to
+        ``exc_text``, so the writer may format it either way.
+        """
+        record = copy.copy(record)
         setattr(record, _trace_id_record_attr, get_trace_id())
-        return super().emit(record)
 
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(
+                    record.exc_info,
+                )
+            record.exc_info = None
 
-def _safe_flush_handler(
-    handler: logging.handlers.MemoryHandler,
-) -> None:
-    with suppress(Exception):
-        if handler.buffer:
-            handler.flush()
+        return record
 
 
-def _create_logging_handler(
-    log_format: str,
-) -> logging.Handler:
-    handler = logging.StreamHandler(stream=sys.stdout)
+class LogPipeline:
+    """
+    Queues log records of the callers and writes them to the stream of the
+    given handler in batches on a dedicated thread, every ``flush_interval``
+    seconds or as soon as the queue is half full.
+    """
 
-    formatter = logging.Formatter(log_format)
-    handler.setFormatter(formatter)
+    def __init__(
+        self,
+        handler: logging.StreamHandler,
+        *,
+        queue: LogQueue,
+        flush_interval: float,
+    ) -> None:
+        self.handler = handler
+        self.queue = queue
+        self.flush_interval = flush_interval
 
-    return handler
+        self.queue_handler = TraceIdQueueHandler(queue)  # type: ignore[arg-type]
 
+        self._stopping = threading.Event()
+        self._thread = self._create_thread()
 
-def _wrap_logging_handler(
-    handler: logging.Handler,
-    *,
-    loop: asyncio.AbstractEventLoop,
-    buffer_size: int,
-    flush_interval: float | int,
-) -> logging.Handler:
-    buffered_handler = BufferedHandler(
-        buffer_size,
-        target=handler,
-        flushLevel=logging.CRITICAL,
-    )
+    def start(self) -> None:
+        self._thread.start()
+        atexit.register(self.stop)
+        os.register_at_fork(after_in_child=self._restart_in_child)
 
-    _run_in_thread(
-        _threaded_flush_handler,
-        args=(
-            buffered_handler,
-            flush_interval,
-            loop,
-        ),
-        deattach=True,
-    )
+    def stop(self) -> None:
+        """
+        Replaces the queue handler with the target one, then stops the writer
+        and writes out what is left in the queue.
+        """
+        if self._stopping.is_set():
+            return
 
-    atexit.register(
-        _safe_flush_handler,
-        buffered_handler,
-    )
+        root_logger = logging.getLogger()
+        if self.queue_handler in root_logger.handlers:
+            # the records logged later, e.g. by the server on exit, are not
+            # prepared by the queue handler and miss the trace id
+            self.handler.addFilter(TraceIdFilter())
+            root_logger.removeHandler(self.queue_handler)
+            root_logger.addHandler(self.handler)
+
+        self._stopping.set()
+        self.queue.wakeup()
+        if self._thread.is_alive():
+            self._thread.join()
+
+        self._write(self.queue.drain())
+        atexit.unregister(self.stop)
+
+    def _create_thread(self) -> threading.Thread:
+        return threading.Thread(target=self._run, name="log_writer", daemon=True)
 
-    return buffered_handler
+    def _restart_in_child(self) -> None:
+        """
+        Threads do not survive fork, e.g. of gunicorn workers from the
+        preloaded app, so the child process starts a writer of its own. The
+        records queued before fork are left to the parent.
+        """
+        if self._stopping.is_set():
+            return
+
+        self.queue.reset()
+        self._thread = self._create_thread()
+        self._thread.start()
 
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.queue.wait(self.flush_interval)
+            self._write(self.queue.drain())
 
-def _threaded_flush_handler(
-    handler: logging.handlers.MemoryHandler,
-    flush_interval: int | float,
-    loop: asyncio.AbstractEventLoop,
-) -> None:
-    def has_target() -> bool:
-        return bool(handler.target)
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        if not records:
+            return
 
-    def has_no_target() -> bool:
-        return False
+        handler = self.handler
+        lines = []
+        for record in records:
+            if not handler.filter(record):
+                continue
+            try:
+                lines.append(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
 
-    is_target = has_no_target
-    if isinstance(handler, logging.handlers.MemoryHandler):
-        is_target = has_target
+        handler.acquire()
+        try:
+            handler.stream.write("".join(lines))
+            handler.stream.flush()
+        except Exception:
+            handler.handleError(records[-1])
+        finally:
+            handler.release()
 
-    while not loop.is_closed() and is_target():
-        _safe_flush_handler(handler)
-        time.sleep(flush_interval)
 
+_log_pipeline: LogPipeline | None = None
 
-def _run_in_thread(
-    fun: F,
+
+def _create_logging_handler(
+    log_format: str,
     *,
-    args: Any = (),
-    kwargs: Any = MappingProxyType({}),
-    deattach: bool = True,
-) -> threading.Thread:
-    thread = threading.Thread(
-        target=fun,
-        name=fun.__name__,
-        args=args,
-        kwargs=kwargs,
-        daemon=deattach,
-    )
-    thread.start()
-    return thread
+    renderer: Literal["text", "json"] = "text",
+) -> logging.StreamHandler:
+    handler = logging.StreamHandler(stream=sys.stdout)
+
+    formatter = JsonFormatter() if renderer == "json" else logging.Formatter(log_format)
+    handler.setFormatter(formatter)
+
+    return handler
@@ -0,0 +1,114 @@
+import asyncio
+from dataclasses import dataclass
+import logging
+import time
+from typing import Final, Mapping
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import AppConfig
+from src.infra import metrics
+from src.infra.application.setup.logging import get_log_queue_stats
+from src.infra.database.pool import get_pool_stats
+
+
+logger = logging.getLogger(__name__)
+
+_UNMATCHED_ROUTE: Final = "<unmatched>"
+
+
+@dataclass
+class MetricsMiddleware:
+    app: ASGIApp
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Counts the request and its duration by the route template, not the
+        path, so the number of series does not depend on the path params.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started_at = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # the router sets the matched route to the scope on the way in
+            route = scope.get("route")
+            labels = (
+                scope["method"],
+                getattr(route, "path", _UNMATCHED_ROUTE),
+                str(status_code),
+            )
+            metrics.http_requests_total.labels(*labels).inc()
+            metrics.http_request_duration_seconds.labels(*labels).observe(
+                time.perf_counter() - started_at,
+            )
+
+
+class MetricsSampler:
+    """
+    Copies the stats the app keeps anyway, i.e. of the database pools and
+    the log queue, to the metrics of this process.
+    """
+
+    def __init__(self, engines: Mapping[str, AsyncEngine], *, interval: float) -> None:
+        self.engines = engines
+        self.interval = interval
+
+        self._pool_timeouts = dict.fromkeys(engines, 0)
+        self._log_records_dropped = 0
+
+    def sample(self) -> None:
+        for name, async_engine in self.engines.items():
+            if (pool_stats := get_pool_stats(async_engine)) is None:
+                continue
+
+            metrics.db_pool_connections.labels(name, "checked_in").set(
+                pool_stats.checked_in,
+            )
+            metrics.db_pool_connections.labels(name, "checked_out").set(
+                pool_stats.checked_out,
+            )
+            metrics.db_pool_waiters.labels(name).set(pool_stats.waiters)
+            metrics.db_pool_timeouts_total.labels(name).inc(
+                pool_stats.timeouts - self._pool_timeouts[name],
+            )
+            self._pool_timeouts[name] = pool_stats.timeouts
+
+        if (log_queue_stats := get_log_queue_stats()) is not None:
+            metrics.log_queue_size.set(log_queue_stats.size)
+            metrics.log_records_dropped_total.inc(
+                log_queue_stats.dropped - self._log_records_dropped,
+            )
+            self._log_records_dropped = log_queue_stats.dropped
+
+    async def sample_forever(self) -> None:
+        while True:
+            try:
+                self.sample()
+            except Exception:
+                logger.exception("failed to sample metrics")
+
+            await asyncio.sleep(self.interval)
+
+
+def setup_metrics(app: FastAPI, config: AppConfig) -> None:
+    logger.info(
+        "enable metrics sampled every [%s] seconds",
+        config.metrics_sample_interval,
+    )
+
+    app.add_middleware(MetricsMiddleware)
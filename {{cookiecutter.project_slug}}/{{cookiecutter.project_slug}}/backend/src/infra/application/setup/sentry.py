@@ -1,7 +1,6 @@
 import logging
 
 from fastapi import FastAPI
-import sentry_sdk
 
 from src.config import AppConfig
 
@@ -11,6 +10,9 @@ logger = logging.getLogger(__name__)
 
 def setup_sentry(app: FastAPI, config: AppConfig) -> None:
     if config.sentry_dsn:
+        # imported only when enabled, as it takes a while
+        import sentry_sdk
+
         logger.info(
             "use sentry_dsn [%s]",
             config.sentry_dsn.with_password("***"),
@@ -1,33 +1,23 @@
-from typing import Awaitable, Callable
-import uuid
+from dataclasses import dataclass
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from src.infra.database.session import (
-    reset_scoped_session,
-    scoped_session,
-    set_scoped_session,
-)
+from src.infra.database.session import session_scope
 
 
+@dataclass
 class ScopedSessionMiddleware:
-    async def __call__(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        session_id = uuid.uuid4().hex
-        reset_token = set_scoped_session(session_id=session_id)
-        try:
-            return await call_next(request)
-        finally:
-            await scoped_session.remove()
-            reset_scoped_session(token=reset_token)
+    app: ASGIApp
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        async with session_scope():
+            await self.app(scope, receive, send)
 
 
 def setup_sqlalchemy_scoped_session(app: FastAPI) -> None:
-    app.add_middleware(
-        BaseHTTPMiddleware,
-        dispatch=ScopedSessionMiddleware(),
-    )
+    app.add_middleware(ScopedSessionMiddleware)
@@ -2,12 +2,12 @@ from contextvars import ContextVar
 from dataclasses import dataclass, field
 import logging
 import logging.handlers
-from typing import Awaitable, Callable, Final, cast
+from typing import Callable, Final, cast
 from uuid import uuid4
 
-from fastapi import FastAPI, Request, Response
-from starlette.datastructures import MutableHeaders
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.config import AppConfig
 
@@ -34,42 +34,43 @@ def get_trace_id(
 
 @dataclass
 class TracingMiddleware:
+    app: ASGIApp
     header_name: str = field(default=_TRACE_ID_HEADER_NAME)
     generator: Callable[[], str] = field(default=_get_uuid4_hex)
 
-    async def __call__(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Loads Trace Id from incoming headers or generate new one otherwise.
+        The value is attached to the response headers on response start.
         """
-        headers = MutableHeaders(request.headers)
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
 
         trace_id_value = self._get_header_value_or_generate_new(
             header_name=self.header_name,
-            headers=headers,
+            headers=Headers(scope=scope),
         )
+        # The value is not reset on exit: unhandled errors are logged by the
+        # outer ServerErrorMiddleware and the server, and they should still
+        # see the trace id. Every request runs in its own context anyway.
         trace_id.set(trace_id_value)
 
-        async def tracing_middleware(
-            request: Request,
-            call_next: Callable[[Request], Awaitable[Response]],
-        ) -> Response:
-            response = await call_next(request)
-            if trace_id_value := trace_id.get():
-                response.headers[self.header_name] = trace_id_value
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                if trace_id_value := trace_id.get():
+                    headers = MutableHeaders(scope=message)
+                    headers[self.header_name] = trace_id_value
 
-            return response
+            await send(message)
 
-        return await tracing_middleware(request, call_next)
+        await self.app(scope, receive, send_with_trace_id)
 
     def _get_header_value_or_generate_new(
         self,
         *,
         header_name: str,
-        headers: MutableHeaders,
+        headers: Headers,
     ) -> str:
         header_value = headers.get(header_name.lower())
 
@@ -86,8 +87,6 @@ def setup_tracing_middleware(app: FastAPI, config: AppConfig) -> None:
     )
 
     app.add_middleware(
-        BaseHTTPMiddleware,
-        dispatch=TracingMiddleware(
-            header_name=config.trace_header_name,
-        ),
+        TracingMiddleware,
+        header_name=config.trace_header_name,
     )
@@ -0,0 +1,116 @@
+"""
+Module provides storages for the service caches.
+
+``MemoryCacheBackend`` keeps the entries in the process, so every worker has
+its own copy and an invalidation reaches the worker which made it only.
+``PgCacheBackend`` keeps them in an UNLOGGED table of the primary, shared by
+all the workers. Writes to an unlogged table skip WAL, so they are cheap, and
+the table is emptied after a crash, which is fine for a cache.
+"""
+import abc
+from datetime import timedelta
+import itertools
+import time
+from typing import Callable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import AppConfig
+from src.infra.cache.lru import LRUCache
+from src.infra.database.models import CacheEntry
+from src.infra.database.session import get_database
+
+
+class CacheBackend(abc.ABC):
+    @abc.abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: bytes, *, ttl: float) -> None:
+        ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.clock = clock
+        self._entries: LRUCache[str, bytes] = LRUCache(max_size=max_size, clock=clock)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, *, ttl: float) -> None:
+        self._entries.set(key, value, expires_at=self.clock() + ttl)
+
+    async def delete(self, key: str) -> None:
+        self._entries.delete(key)
+
+
+class PgCacheBackend(CacheBackend):
+    """
+    Stores entries in the ``cacheentry`` table, the expiration times are
+    computed by the database, so the clocks of the workers do not matter.
+    Expired entries are purged on every ``purge_every`` sets.
+    """
+
+    def __init__(
+        self,
+        get_engine: Callable[[], AsyncEngine],
+        *,
+        purge_every: int = 1000,
+    ) -> None:
+        self.get_engine = get_engine
+        self.purge_every = purge_every
+
+        self._sets = itertools.count(1)
+
+    async def get(self, key: str) -> bytes | None:
+        select_query = select(CacheEntry.value).where(
+            CacheEntry.key == key,
+            CacheEntry.expires_at > func.now(),
+        )
+        async with self.get_engine().connect() as connection:
+            return await connection.scalar(select_query)
+
+    async def set(self, key: str, value: bytes, *, ttl: float) -> None:
+        insert_query = pg_insert(CacheEntry).values(
+            key=key,
+            value=value,
+            expires_at=func.now() + timedelta(seconds=ttl),
+        )
+        upsert_query = insert_query.on_conflict_do_update(
+            index_elements=[CacheEntry.key],
+            set_={
+                "value": insert_query.excluded.value,
+                "expires_at": insert_query.excluded.expires_at,
+            },
+        )
+
+        async with self.get_engine().begin() as connection:
+            await connection.execute(upsert_query)
+            if next(self._sets) % self.purge_every == 0:
+                await connection.execute(
+                    delete(CacheEntry).where(CacheEntry.expires_at <= func.now()),
+                )
+
+    async def delete(self, key: str) -> None:
+        async with self.get_engine().begin() as connection:
+            await connection.execute(delete(CacheEntry).where(CacheEntry.key == key))
+
+
+def create_cache_backend(config: AppConfig) -> CacheBackend:
+    if config.cache_backend == "postgres":
+        return PgCacheBackend(lambda: get_database().engine)
+
+    return MemoryCacheBackend(max_size=config.cache_max_size)
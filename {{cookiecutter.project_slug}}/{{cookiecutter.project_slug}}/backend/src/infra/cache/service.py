@@ -0,0 +1,157 @@
+"""
+Module caches results of service methods.
+
+Decorate a method with ``@cached(get_cache, key=...)`` to cache its success
+results, failures are never cached. Writes invalidate the entries they change
+via ``ServiceCache.delete()``.
+"""
+import asyncio
+from functools import wraps
+import logging
+from typing import Any, Awaitable, Callable, Concatenate, Generic, ParamSpec, TypeVar
+
+from pydantic import BaseModel
+
+from src.infra import metrics
+from src.infra.application.result import Result
+from src.infra.cache.backend import CacheBackend
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+S = TypeVar("S")
+P = ParamSpec("P")
+
+Load = Callable[[], Awaitable[Result[T, Any]]]
+
+
+class ServiceCache(Generic[T]):
+    """
+    Caches models of type ``model`` in the backend for ``ttl`` seconds.
+
+    Concurrent misses of the same key are coalesced: the first caller loads
+    the value and the rest wait for its result, so a popular key missing in
+    the cache is loaded once instead of once per request. Backend errors are
+    logged and treated as misses, the cache never fails a request.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        name: str,
+        model: type[T],
+        ttl: float,
+    ) -> None:
+        self.backend = backend
+        self.name = name
+        self.model = model
+        self.ttl = ttl
+
+        self._loads: dict[str, asyncio.Future[Result[T, Any]]] = {}
+
+    def _get_backend_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    async def get(self, key: str) -> T | None:
+        try:
+            value = await self.backend.get(self._get_backend_key(key))
+        except Exception:
+            logger.exception("unable to get %s from cache %s", key, self.name)
+            metrics.cache_errors_total.labels(cache=self.name).inc()
+            return None
+
+        return None if value is None else self.model.model_validate_json(value)
+
+    async def set(self, key: str, value: T) -> None:
+        try:
+            await self.backend.set(
+                self._get_backend_key(key),
+                value.model_dump_json().encode(),
+                ttl=self.ttl,
+            )
+        except Exception:
+            logger.exception("unable to set %s in cache %s", key, self.name)
+            metrics.cache_errors_total.labels(cache=self.name).inc()
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.backend.delete(self._get_backend_key(key))
+        except Exception:
+            logger.exception("unable to delete %s from cache %s", key, self.name)
+            metrics.cache_errors_total.labels(cache=self.name).inc()
+
+    async def get_or_load(self, key: str, load: Load[T]) -> Result[T, Any]:
+        if self.ttl <= 0:
+            return await load()
+
+        if (value := await self.get(key)) is not None:
+            metrics.cache_requests_total.labels(cache=self.name, result="hit").inc()
+            return Result.ok(value)
+
+        while (in_flight := self._loads.get(key)) is not None:
+            metrics.cache_requests_total.labels(
+                cache=self.name,
+                result="coalesced",
+            ).inc()
+            try:
+                # shielded, so a cancelled waiter does not cancel the load
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # the loading caller has been cancelled, load on our own
+
+        metrics.cache_requests_total.labels(cache=self.name, result="miss").inc()
+        in_flight = asyncio.get_running_loop().create_future()
+        self._loads[key] = in_flight
+        try:
+            result = await load()
+            match result:
+                case Result(value, None):
+                    await self.set(key, value)
+        except Exception as exc:
+            in_flight.set_exception(exc)
+            # retrieved, so asyncio does not warn when nobody waits for it
+            in_flight.exception()
+            raise
+        except BaseException:
+            in_flight.cancel()
+            raise
+        else:
+            in_flight.set_result(result)
+        finally:
+            del self._loads[key]
+
+        return result
+
+
+class cached:  # noqa: N801
+    """
+    Caches success results of a service method. ``key`` gets the keyword
+    arguments of the call and returns the cache key, e.g.
+    ``key=lambda user_id, **_: str(user_id)``.
+    """
+
+    def __init__(
+        self,
+        get_cache: Callable[[], ServiceCache[T]],
+        *,
+        key: Callable[..., str],
+    ) -> None:
+        self.get_cache = get_cache
+        self.key = key
+
+    def __call__(
+        self,
+        fun: Callable[Concatenate[S, P], Awaitable[Result]],
+    ) -> Callable[Concatenate[S, P], Awaitable[Result]]:
+        @wraps(fun)
+        async def wrapped(service: S, *args: P.args, **kwargs: P.kwargs) -> Result:
+            return await self.get_cache().get_or_load(
+                self.key(**kwargs),
+                lambda: fun(service, *args, **kwargs),
+            )
+
+        return wrapped
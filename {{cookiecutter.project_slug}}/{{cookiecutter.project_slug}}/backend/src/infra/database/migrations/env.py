@@ -6,7 +6,7 @@ from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
-from src.config import config as app_config
+from src.config import get_config
 from src.infra.database.declarative_base import metadata
 from src.infra.database.models import *  # noqa: F403
 
@@ -24,7 +24,7 @@ target_metadata = metadata
 
 
 if not config.get_main_option("sqlalchemy.url"):
-    config.set_main_option("sqlalchemy.url", str(app_config.pg_dsn))
+    config.set_main_option("sqlalchemy.url", str(get_config().pg_dsn))
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,30 @@
+"""add is_admin column to user table
+
+Revision ID: 8166d58afb87
+Revises: 17c33d2e56fe
+Create Date: 2026-10-18 09:12:31.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "8166d58afb87"
+down_revision: Union[str, None] = "17c33d2e56fe"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user",
+        sa.Column(
+            "is_admin", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user", "is_admin")
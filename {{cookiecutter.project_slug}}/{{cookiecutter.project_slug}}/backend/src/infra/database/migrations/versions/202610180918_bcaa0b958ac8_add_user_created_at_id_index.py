@@ -0,0 +1,37 @@
+"""add user created_at id index
+
+Revision ID: bcaa0b958ac8
+Revises: 8166d58afb87
+Create Date: 2026-10-18 09:18:02.671940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "bcaa0b958ac8"
+down_revision: Union[str, None] = "8166d58afb87"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # build the index without locking writes to the table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_user_created_at_id"),
+            "user",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_user_created_at_id"),
+            table_name="user",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,33 @@
+"""add cacheentry table
+
+Revision ID: 5d2c4e8f1a3b
+Revises: bcaa0b958ac8
+Create Date: 2026-10-18 10:02:44.118206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "5d2c4e8f1a3b"
+down_revision: Union[str, None] = "bcaa0b958ac8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # the cache is not worth WAL, an unlogged table is emptied after a crash
+    op.create_table(
+        "cacheentry",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("value", sa.LargeBinary(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key", name=op.f("pk_cacheentry")),
+        prefixes=["UNLOGGED"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cacheentry")
@@ -0,0 +1,34 @@
+"""add ratelimitbucket table
+
+Revision ID: 9e4f7a2b6c1d
+Revises: 5d2c4e8f1a3b
+Create Date: 2026-10-18 11:45:12.503871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "9e4f7a2b6c1d"
+down_revision: Union[str, None] = "5d2c4e8f1a3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # buckets lost in a crash are full ones, not worth WAL
+    op.create_table(
+        "ratelimitbucket",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key", name=op.f("pk_ratelimitbucket")),
+        prefixes=["UNLOGGED"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ratelimitbucket")
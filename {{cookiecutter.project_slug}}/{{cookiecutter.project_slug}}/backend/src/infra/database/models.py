@@ -2,12 +2,16 @@ from datetime import datetime
 import uuid
 
 from sqlalchemy import (
+    Boolean,
     DateTime,
+    Float,
     Identity,
+    Index,
     Integer,
     LargeBinary,
     String,
     UUID,
+    false,
     func,
 )
 from sqlalchemy.orm import Mapped, mapped_column
@@ -23,6 +27,35 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
+    is_admin: Mapped[bool] = mapped_column(
+        Boolean, server_default=false(), nullable=False
+    )
+
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
+
+
+class CacheEntry(Base):
+    key: Mapped[str] = mapped_column(String(), primary_key=True)
+    value: Mapped[bytes] = mapped_column(LargeBinary(), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    __table_args__ = ({"prefixes": ["UNLOGGED"]},)
+
+
+class RateLimitBucket(Base):
+    key: Mapped[str] = mapped_column(String(), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    # the bucket is full again and equal to a missing one since then
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    __table_args__ = ({"prefixes": ["UNLOGGED"]},)
 
 
 __all__ = [model for model in locals() if isinstance(model, Base)]
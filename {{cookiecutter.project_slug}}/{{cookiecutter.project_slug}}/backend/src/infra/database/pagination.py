@@ -0,0 +1,54 @@
+"""
+Module implements opaque cursors for keyset pagination.
+
+The cursor holds values of the keyset columns of the last record of a page,
+the next page starts right after it, so the cost of the page does not depend
+on how far it is.
+"""
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import json
+from typing import Any, Generic, Sequence
+from uuid import UUID
+
+from src.infra.database.declarative_base import OrmModel
+
+
+@dataclass(frozen=True)
+class Page(Generic[OrmModel]):
+    records: list[OrmModel] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps(
+        [_encode_value(value) for value in values],
+        separators=(",", ":"),
+    )
+    return urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    Returns raw JSON values of the cursor, raises ValueError if the cursor is
+    malformed.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(urlsafe_b64decode(cursor + padding))
+    except (TypeError, ValueError) as err:
+        raise ValueError("malformed cursor") from err
+
+    if not isinstance(values, list):
+        raise ValueError("malformed cursor")
+
+    return values
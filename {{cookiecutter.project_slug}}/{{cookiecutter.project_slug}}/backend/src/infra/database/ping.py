@@ -0,0 +1,41 @@
+"""
+Checks whether the database accepts queries, shared by the pre-flight check
+and the readiness probe.
+"""
+from typing import Final
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+# invalid authorization specification, invalid password, unknown database
+_NON_RETRYABLE_SQLSTATES: Final = frozenset(("28000", "28P01", "3D000"))
+
+
+async def ping(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("select true"))
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    Returns False for the errors which retrying does not fix, i.e. failed
+    authentication and unknown database. SQLAlchemy and its asyncpg adapter
+    wrap the driver errors, so the whole chain is inspected.
+    """
+    pending: list[BaseException | None] = [exc]
+    seen: set[int] = set()
+    while pending:
+        error = pending.pop()
+        if error is None or id(error) in seen:
+            continue
+        seen.add(id(error))
+
+        if getattr(error, "sqlstate", None) in _NON_RETRYABLE_SQLSTATES:
+            return False
+
+        pending.extend(
+            (error.__cause__, error.__context__, getattr(error, "orig", None)),
+        )
+
+    return True
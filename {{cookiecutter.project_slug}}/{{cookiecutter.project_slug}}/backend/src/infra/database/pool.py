@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool which tracks how many callers are waiting for a connection and
+    how long they wait.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.waiters = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        self.waiters += 1
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiters -= 1
+
+        wait_time = time.perf_counter() - started_at
+        self.checkouts += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+        return connection
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    waiters: int
+    checkouts: int
+    timeouts: int
+    wait_time_avg: float
+    wait_time_max: float
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    """
+    Returns live stats of the engine pool or None if the engine does not use
+    a queue pool, e.g. NullPool.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+
+    waiters = checkouts = timeouts = 0
+    wait_time_avg = wait_time_max = 0.0
+    if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        waiters = pool.waiters
+        checkouts = pool.checkouts
+        timeouts = pool.timeouts
+        wait_time_max = pool.wait_time_max
+        if pool.checkouts:
+            wait_time_avg = pool.wait_time_total / pool.checkouts
+
+    return PoolStats(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        waiters=waiters,
+        checkouts=checkouts,
+        timeouts=timeouts,
+        wait_time_avg=wait_time_avg,
+        wait_time_max=wait_time_max,
+    )
@@ -1,13 +1,92 @@
 import abc
-from typing import Any, Generic, Type, final
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Generic, Iterable, Mapping, Sequence, Type, final
 
-from sqlalchemy import insert, select
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    Select,
+    any_,
+    bindparam,
+    column,
+    insert,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.dml import ReturningInsert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infra.application.exception import BadRequestError, NotFoundError
+from src.infra.application.exception import (
+    AlreadyExistsError,
+    BadRequestError,
+    NotFoundError,
+)
 from src.infra.application.result import Result
 from src.infra.database.declarative_base import OrmModel
+from src.infra.database.pagination import Page, decode_cursor, encode_cursor
+
+
+# Statements of get_record and create_record are built once per model and set
+# of props with bound parameters in place of values, so the calls skip the
+# statement construction and always hit the compiled cache of SQLAlchemy and
+# the prepared statement cache of asyncpg.
+_STATEMENT_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _get_select_statement(
+    orm_model: Type[OrmModel],
+    prop_names: tuple[str, ...],
+    null_prop_names: tuple[str, ...],
+    with_for_update: bool,
+) -> Select[tuple[OrmModel]]:
+    select_query = select(orm_model)
+
+    criteria = [
+        getattr(orm_model, prop_name) == bindparam(prop_name)
+        for prop_name in prop_names
+    ]
+    # NULL never equals to a bound parameter, so it is compared with IS NULL
+    criteria.extend(
+        getattr(orm_model, prop_name).is_(None) for prop_name in null_prop_names
+    )
+    if criteria:
+        select_query = select_query.where(*criteria)
+
+    if with_for_update:
+        select_query = select_query.with_for_update()
+
+    return select_query
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _get_insert_statement(
+    orm_model: Type[OrmModel],
+    prop_names: tuple[str, ...],
+    conflict_prop_names: tuple[str, ...] | None = None,
+) -> ReturningInsert[tuple[OrmModel]]:
+    values = {prop_name: bindparam(prop_name) for prop_name in prop_names}
+    if conflict_prop_names is None:
+        return insert(orm_model).values(values).returning(orm_model)
+
+    return (
+        pg_insert(orm_model)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=list(conflict_prop_names))
+        .returning(orm_model)
+    )
+
+
+@dataclass(frozen=True)
+class BulkCreateResult(Generic[OrmModel]):
+    created: list[OrmModel] = field(default_factory=list)
+    # indexes of the given records skipped due to unique conflicts
+    conflicts: list[int] = field(default_factory=list)
 
 
 class GenericRepository(abc.ABC, Generic[OrmModel]):
@@ -27,20 +106,19 @@ class GenericRepository(abc.ABC, Generic[OrmModel]):
         with_for_update: bool = False,
         **props: Any,
     ) -> Result[OrmModel, NotFoundError]:
-        orm_model = self.orm_model
-        select_query = select(orm_model)
-
-        or_criteria = [
-            (getattr(orm_model, prop_name) == prop_value)
+        params = {
+            prop_name: prop_value
             for prop_name, prop_value in props.items()
-        ]
-        if or_criteria:
-            select_query = select_query.where(*or_criteria)
-
-        if with_for_update:
-            select_query = select_query.with_for_update()
+            if prop_value is not None
+        }
+        select_query = _get_select_statement(
+            self.orm_model,
+            tuple(sorted(params)),
+            tuple(sorted(props.keys() - params.keys())),
+            with_for_update,
+        )
 
-        query_result = await session.execute(select_query)
+        query_result = await session.execute(select_query, params)
         record_found = query_result.scalars().first()
 
         if not record_found:
@@ -55,23 +133,244 @@ class GenericRepository(abc.ABC, Generic[OrmModel]):
         session: AsyncSession,
         **props: Any,
     ) -> Result[OrmModel, BadRequestError]:
-        orm_model = self.orm_model
+        insert_query = _get_insert_statement(
+            self.orm_model,
+            tuple(sorted(props)),
+        )
 
-        insert_query = (
-            insert(orm_model)
-            .values(
-                **props,
+        try:
+            query_result = await session.execute(insert_query, props)
+        except IntegrityError as err:
+            return Result.fail(
+                BadRequestError(str(err)),
             )
-            .returning(orm_model)
+
+        return Result.ok(
+            query_result.scalars().one(),
+        )
+
+    @final
+    async def create_record_if_absent(
+        self,
+        *,
+        session: AsyncSession,
+        conflict_prop_names: Sequence[str],
+        **props: Any,
+    ) -> Result[OrmModel, AlreadyExistsError | BadRequestError]:
+        """
+        Inserts the record unless it conflicts with an existing one on the
+        unique ``conflict_prop_names``, in a single statement, so there is no
+        need to look the existing record up, let alone lock it, beforehand.
+        The conflicts on other constraints fail with ``BadRequestError``.
+        """
+        insert_query = _get_insert_statement(
+            self.orm_model,
+            tuple(sorted(props)),
+            tuple(conflict_prop_names),
         )
 
         try:
-            query_result = await session.execute(insert_query)
+            query_result = await session.execute(insert_query, props)
+        except IntegrityError as err:
+            return Result.fail(
+                BadRequestError(str(err)),
+            )
+
+        record_created = query_result.scalars().first()
+        if record_created is None:
+            return Result.fail(AlreadyExistsError())
+
+        return Result.ok(record_created)
+
+    @final
+    async def get_records_by(
+        self,
+        *,
+        session: AsyncSession,
+        prop_name: str,
+        values: Iterable[Any],
+    ) -> dict[Any, OrmModel]:
+        """
+        Returns records having ``prop_name`` equal to any of the given values
+        mapped by the value. Values are sent as a single array parameter, so
+        the statement text does not depend on the number of values.
+        """
+        orm_model = self.orm_model
+        prop = getattr(orm_model, prop_name)
+
+        values = list(values)
+        if not values:
+            return {}
+
+        select_query = select(orm_model).where(
+            prop == any_(bindparam(prop_name, values, type_=ARRAY(prop.type)))
+        )
+
+        query_result = await session.execute(select_query)
+        return {
+            getattr(record, prop_name): record
+            for record in query_result.scalars().all()
+        }
+
+    @final
+    async def create_records(
+        self,
+        *,
+        session: AsyncSession,
+        records: Sequence[Mapping[str, Any]],
+        key: str,
+        copy_threshold: int = 10_000,
+    ) -> Result[BulkCreateResult[OrmModel], BadRequestError]:
+        """
+        Inserts records in a single statement skipping the ones conflicting
+        with existing records. The conflicts are reported by indexes of the
+        given records, ``key`` is the unique prop used to match them.
+
+        Records are loaded via COPY into a temporary table when there are at
+        least ``copy_threshold`` of them. All records must have same props.
+        """
+        if not records:
+            return Result.ok(BulkCreateResult())
+
+        try:
+            if len(records) >= copy_threshold:
+                created = await self._copy_records(session=session, records=records)
+            else:
+                created = await self._insert_records(session=session, records=records)
         except IntegrityError as err:
             return Result.fail(
                 BadRequestError(str(err)),
             )
 
+        created_keys = {getattr(record, key) for record in created}
+        conflicts = []
+        for index, record in enumerate(records):
+            if record[key] in created_keys:
+                created_keys.remove(record[key])
+            else:
+                conflicts.append(index)
+
         return Result.ok(
-            query_result.scalars().one(),
+            BulkCreateResult(created=created, conflicts=conflicts),
+        )
+
+    async def _insert_records(
+        self,
+        *,
+        session: AsyncSession,
+        records: Sequence[Mapping[str, Any]],
+    ) -> list[OrmModel]:
+        orm_model = self.orm_model
+
+        insert_query = (
+            pg_insert(orm_model)
+            .on_conflict_do_nothing()
+            .returning(orm_model)
+        )
+
+        query_result = await session.execute(insert_query, list(records))
+        return list(query_result.scalars().all())
+
+    async def _copy_records(
+        self,
+        *,
+        session: AsyncSession,
+        records: Sequence[Mapping[str, Any]],
+    ) -> list[OrmModel]:
+        orm_model = self.orm_model
+        table_name = orm_model.__table__.name
+        columns = list(records[0])
+
+        connection = await session.connection()
+        quote = connection.dialect.identifier_preparer.quote
+        tmp_table_name = f"_copy_{table_name}"
+
+        # The temporary table inherits column types, but no constraints
+        await session.execute(
+            text(
+                f"create temporary table {quote(tmp_table_name)} on commit drop"
+                f" as select {', '.join(quote(c) for c in columns)}"
+                f" from {quote(table_name)} with no data"
+            )
         )
+
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            tmp_table_name,
+            records=[tuple(record[c] for c in columns) for record in records],
+            columns=columns,
+        )
+
+        insert_query = (
+            pg_insert(orm_model.__table__)
+            .from_select(
+                columns,
+                select(*(column(c) for c in columns)).select_from(
+                    table(tmp_table_name)
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(*orm_model.__table__.columns)
+        )
+
+        query_result = await session.execute(
+            select(orm_model).from_statement(insert_query)
+        )
+        created = list(query_result.scalars().all())
+
+        await session.execute(text(f"drop table {quote(tmp_table_name)}"))
+
+        return created
+
+    @final
+    async def get_records_page(
+        self,
+        *,
+        session: AsyncSession,
+        keyset: Sequence[str],
+        limit: int,
+        cursor: str | None = None,
+    ) -> Result[Page[OrmModel], BadRequestError]:
+        """
+        Returns a page of records ordered by the ``keyset`` props, which must
+        be unique together and covered by an index. The page starts right
+        after the record the ``cursor`` points to.
+        """
+        orm_model = self.orm_model
+        props = [getattr(orm_model, prop_name) for prop_name in keyset]
+
+        select_query = select(orm_model).order_by(*props).limit(limit + 1)
+
+        if cursor:
+            try:
+                after = self._decode_keyset(cursor, props)
+            except ValueError:
+                return Result.fail(BadRequestError("invalid cursor"))
+
+            select_query = select_query.where(tuple_(*props) > tuple_(*after))
+
+        query_result = await session.execute(select_query)
+        records = list(query_result.scalars().all())
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = encode_cursor(
+                [getattr(records[-1], prop_name) for prop_name in keyset]
+            )
+
+        return Result.ok(Page(records=records, next_cursor=next_cursor))
+
+    @staticmethod
+    def _decode_keyset(cursor: str, props: Sequence[Any]) -> list[Any]:
+        values = decode_cursor(cursor)
+        if len(values) != len(props):
+            raise ValueError("cursor does not match keyset")
+
+        try:
+            return [
+                TypeAdapter(prop.type.python_type).validate_python(value)
+                for prop, value in zip(props, values)
+            ]
+        except ValidationError as err:
+            raise ValueError("cursor does not match keyset") from err
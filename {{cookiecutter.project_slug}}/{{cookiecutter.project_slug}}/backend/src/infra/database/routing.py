@@ -0,0 +1,180 @@
+"""
+Module routes read-only statements of a session to read replicas.
+
+A statement goes to a replica when it is a plain SELECT, it is executed
+outside of the ``primary_only()`` scope, e.g. ``@transactional()``, and
+neither the session nor the current trace has written anything recently.
+Everything else goes to the primary, the bind of the session.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import time
+from typing import Any, Callable, Iterator, Sequence
+
+from sqlalchemy import Engine, Select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Mapper, Session
+
+from src.infra.application.setup.tracing import trace_id
+from src.infra.cache.lru import LRUCache
+
+
+logger = logging.getLogger(__name__)
+
+_primary_only: ContextVar[bool] = ContextVar("_primary_only", default=False)
+
+_STICKY = "routing_sticky"
+_REPLICA = "routing_replica"
+
+
+@contextmanager
+def primary_only() -> Iterator[None]:
+    """
+    Routes every statement executed within the scope to the primary.
+    """
+    reset_token = _primary_only.set(True)
+    try:
+        yield
+    finally:
+        _primary_only.reset(reset_token)
+
+
+class ReplicaSet:
+    """
+    Picks replicas in round robin order, skipping the ones that failed to
+    connect during the last ``retry_interval`` seconds.
+
+    Remembers traces which wrote to the primary during the last
+    ``sticky_ttl`` seconds, their reads are not routed to replicas to not
+    miss own writes due to the replication lag.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        *,
+        retry_interval: float,
+        sticky_ttl: float,
+        sticky_max_size: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.engines = list(engines)
+        self.retry_interval = retry_interval
+        self.sticky_ttl = sticky_ttl
+        self.clock = clock
+
+        self._next = 0
+        self._down_until: dict[Engine, float] = {}
+        self._sticky_traces: LRUCache[str, bool] = LRUCache(
+            max_size=sticky_max_size,
+            clock=clock,
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> Engine | None:
+        now = self.clock()
+        for _ in range(len(self.engines)):
+            engine = self.engines[self._next % len(self.engines)].sync_engine
+            self._next += 1
+
+            if self._down_until.get(engine, 0.0) <= now:
+                return engine
+
+        return None
+
+    def mark_down(self, engine: Engine) -> None:
+        self._down_until[engine] = self.clock() + self.retry_interval
+
+    def stick(self, trace_id_value: str) -> None:
+        self._sticky_traces.set(
+            trace_id_value,
+            True,
+            expires_at=self.clock() + self.sticky_ttl,
+        )
+
+    def is_sticky(self, trace_id_value: str) -> bool:
+        return self._sticky_traces.get(trace_id_value) is not None
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+
+class RoutingSession(Session):
+    """
+    Session which sends read-only statements to the given replica set.
+
+    A session uses at most one replica, so it holds at most one replica
+    connection. If the replica fails to connect, the session falls back to
+    the primary.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica_set: ReplicaSet | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica_set = replica_set
+
+    def get_bind(
+        self,
+        mapper: Mapper[Any] | type[Any] | None = None,
+        *,
+        clause: Any = None,
+        bind: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        primary = super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+        replica_set = self.replica_set
+        if bind is not None or not replica_set:
+            return primary
+
+        trace_id_value = trace_id.get()
+
+        is_read_only = (
+            not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        )
+        if not is_read_only:
+            self.info[_STICKY] = True
+            if trace_id_value is not None:
+                replica_set.stick(trace_id_value)
+            return primary
+
+        if (
+            _primary_only.get()
+            or self.info.get(_STICKY)
+            or (trace_id_value is not None and replica_set.is_sticky(trace_id_value))
+        ):
+            return primary
+
+        return self._get_replica(replica_set) or primary
+
+    def _get_replica(self, replica_set: ReplicaSet) -> Engine | None:
+        if (replica := self.info.get(_REPLICA)) is not None:
+            return replica
+
+        replica = replica_set.choose()
+        if replica is None:
+            return None
+
+        try:
+            # Connect eagerly, so the failure is not raised by the statement.
+            self.connection(bind_arguments={"bind": replica})
+        except Exception:
+            logger.warning(
+                "unable to connect to replica %s, fall back to primary",
+                replica.url.render_as_string(hide_password=True),
+                exc_info=True,
+            )
+            replica_set.mark_down(replica)
+            return None
+
+        self.info[_REPLICA] = replica
+        return replica
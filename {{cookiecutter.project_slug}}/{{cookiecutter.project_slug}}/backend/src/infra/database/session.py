@@ -1,46 +1,194 @@
-from contextvars import ContextVar, Token
-from typing import Any, AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import time
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, cast
 
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
-    async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
+from yarl import URL
 
-from src.config import config
+from src.config import AppConfig
+from src.infra import metrics
+from src.infra.database.pool import InstrumentedAsyncAdaptedQueuePool
+from src.infra.database.routing import ReplicaSet, RoutingSession
 
 
-_scoped_session: ContextVar[str] = ContextVar("_scoped_session")
+@dataclass(slots=True)
+class _SessionScope:
+    session: AsyncSession | None = None
+    created_at: float = 0.0
 
 
-def get_scoped_session() -> str:
-    return _scoped_session.get()
+_session_scope: ContextVar[_SessionScope] = ContextVar("_session_scope")
 
 
-def set_scoped_session(*, session_id: str) -> Token:
-    return _scoped_session.set(session_id)
+class ScopedSession:
+    """
+    Proxies the session of the current scope, e.g. request.
 
+    The session is created on first use only, so the scope costs nothing when
+    database is never touched.
+    """
 
-def reset_scoped_session(*, token: Token) -> None:
-    _scoped_session.reset(token)
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self.session_factory = session_factory
 
+    def __call__(self) -> AsyncSession:
+        try:
+            scope = _session_scope.get()
+        except LookupError:
+            raise RuntimeError(
+                "no session scope is active, use session_scope() to enter one"
+            ) from None
 
-engine = create_async_engine(str(config.pg_dsn), echo=config.debug)
-async_session_factory = async_sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-)
-scoped_session = async_scoped_session(
-    session_factory=async_session_factory,
-    scopefunc=get_scoped_session,
-)
+        if scope.session is None:
+            scope.session = self.session_factory()
+            scope.created_at = time.perf_counter()
+
+        return scope.session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self(), name)
+
+    async def remove(self) -> None:
+        """
+        Closes the session of the current scope if it has been created.
+        """
+        scope = _session_scope.get(None)
+        if scope is None or scope.session is None:
+            return
+
+        session, scope.session = scope.session, None
+        try:
+            await session.close()
+        finally:
+            metrics.db_session_lifetime_seconds.observe(
+                time.perf_counter() - scope.created_at,
+            )
+
+
+def create_engine(config: AppConfig, dsn: URL | None = None) -> AsyncEngine:
+    """
+    Creates engine for the given DSN, the primary one by default.
+    """
+    return create_async_engine(
+        str(dsn or config.pg_dsn),
+        echo=config.debug,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=config.pg_pool_size,
+        max_overflow=config.pg_pool_max_overflow,
+        pool_timeout=config.pg_pool_timeout,
+        pool_recycle=config.pg_pool_recycle,
+        pool_pre_ping=config.pg_pool_pre_ping,
+        connect_args={
+            "statement_cache_size": config.pg_statement_cache_size,
+            "prepared_statement_cache_size": config.pg_prepared_statement_cache_size,
+            "command_timeout": config.pg_command_timeout,
+            "server_settings": config.pg_server_settings,
+        },
+    )
+
+
+@dataclass(frozen=True)
+class Database:
+    engine: AsyncEngine
+    replica_set: ReplicaSet
+    session_factory: async_sessionmaker[AsyncSession]
+
+    @property
+    def engines(self) -> dict[str, AsyncEngine]:
+        return {
+            "primary": self.engine,
+            **{
+                f"replica:{i}": replica_engine
+                for i, replica_engine in enumerate(self.replica_set.engines)
+            },
+        }
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        await self.replica_set.dispose()
+
+
+def create_database(config: AppConfig) -> Database:
+    engine = create_engine(config)
+    replica_set = ReplicaSet(
+        [create_engine(config, dsn) for dsn in config.pg_replica_dsns],
+        retry_interval=config.pg_replica_retry_interval,
+        sticky_ttl=config.pg_replica_sticky_ttl,
+    )
+    session_factory = async_sessionmaker(
+        bind=engine,
+        sync_session_class=RoutingSession,
+        replica_set=replica_set,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    return Database(
+        engine=engine,
+        replica_set=replica_set,
+        session_factory=session_factory,
+    )
+
+
+_database: Database | None = None
+
+
+def init_database(config: AppConfig) -> Database:
+    """
+    Creates the engines and the session factory of the process, called on
+    the app startup. Nothing is created on import, so importing the app, e.g.
+    by alembic or pytest, costs no engine, and a forked worker never inherits
+    the pools of its parent.
+    """
+    global _database
+
+    _database = create_database(config)
+    return _database
+
+
+def get_database() -> Database:
+    if _database is None:
+        raise RuntimeError("database is not initialized, call init_database() first")
+
+    return _database
+
+
+async def close_database() -> None:
+    global _database
+
+    if _database is not None:
+        database, _database = _database, None
+        await database.dispose()
+
+
+def new_session() -> AsyncSession:
+    return get_database().session_factory()
+
+
+scoped_session = ScopedSession(new_session)
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[None]:
+    """
+    Enters a new session scope, the session created within the scope is
+    closed on exit.
+    """
+    reset_token = _session_scope.set(_SessionScope())
+    try:
+        yield
+    finally:
+        await scoped_session.remove()
+        _session_scope.reset(reset_token)
 
 
-async def get_session() -> AsyncGenerator[
-    async_scoped_session[AsyncSession],
-    Any,
-]:
-    yield scoped_session
+async def get_session() -> AsyncGenerator[AsyncSession, Any]:
+    yield cast(AsyncSession, scoped_session)
@@ -3,6 +3,7 @@ from typing import Awaitable, Callable, ParamSpec
 
 from src.infra.application.exception import AppError
 from src.infra.application.result import Result
+from src.infra.database.routing import primary_only
 from src.infra.database.session import scoped_session
 
 
@@ -16,7 +17,8 @@ class transactional:  # noqa: N801
     ) -> Callable[P, Awaitable[Result]]:
         @wraps(fun)
         async def wrapped(*args: P.args, **kwargs: P.kwargs) -> Result:
-            result = await fun(*args, **kwargs)
+            with primary_only():
+                result = await fun(*args, **kwargs)
 
             match result:
                 case Result(_, None):
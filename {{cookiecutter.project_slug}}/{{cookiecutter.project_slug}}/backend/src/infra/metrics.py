@@ -0,0 +1,102 @@
+"""
+Prometheus metrics of the app.
+
+With multiple workers every worker is a separate process with its own
+metrics, so set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory shared by
+the workers before they start. Then the metrics are written to mmap-backed
+files in that directory and ``render_metrics`` aggregates the files of all
+workers, whichever worker serves the scrape.
+"""
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+http_requests_total = Counter(
+    "http_requests_total",
+    "Number of handled HTTP requests.",
+    ["method", "route", "status"],
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+db_pool_connections = Gauge(
+    "db_pool_connections",
+    "Number of connections of the pool by state.",
+    ["engine", "state"],
+    multiprocess_mode="livesum",
+)
+db_pool_waiters = Gauge(
+    "db_pool_waiters",
+    "Number of callers waiting for a connection of the pool.",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+db_pool_timeouts_total = Counter(
+    "db_pool_timeouts_total",
+    "Number of callers which have not got a connection in time.",
+    ["engine"],
+)
+db_session_lifetime_seconds = Histogram(
+    "db_session_lifetime_seconds",
+    "Time from the first use of the session of a scope till it is closed.",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+log_queue_size = Gauge(
+    "log_queue_size",
+    "Number of log records waiting to be written.",
+    multiprocess_mode="livesum",
+)
+log_records_dropped_total = Counter(
+    "log_records_dropped_total",
+    "Number of log records dropped due to the log queue overflow.",
+)
+
+cache_requests_total = Counter(
+    "cache_requests_total",
+    "Number of service cache lookups by result: hit, miss or coalesced with "
+    "an in-flight load.",
+    ["cache", "result"],
+)
+cache_errors_total = Counter(
+    "cache_errors_total",
+    "Number of failed service cache backend calls.",
+    ["cache"],
+)
+
+rate_limit_rejected_total = Counter(
+    "rate_limit_rejected_total",
+    "Number of attempts rejected by the rate limiters.",
+    ["limiter"],
+)
+rate_limit_errors_total = Counter(
+    "rate_limit_errors_total",
+    "Number of failed rate limiter backend calls, the attempts are allowed.",
+    ["limiter"],
+)
+
+
+def render_metrics() -> bytes:
+    """
+    Renders the metrics of all workers in multiprocess mode and the metrics
+    of this process otherwise.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
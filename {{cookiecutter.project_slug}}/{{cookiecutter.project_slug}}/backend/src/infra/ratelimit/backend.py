@@ -0,0 +1,132 @@
+"""
+Module provides storages for the token buckets of the rate limiters.
+
+``MemoryRateLimitBackend`` keeps the buckets in the process, so every worker
+limits on its own and a client gets up to the limit times the number of
+workers. ``PgRateLimitBackend`` keeps them in an UNLOGGED table of the primary,
+shared by all the workers.
+"""
+import abc
+import itertools
+import time
+from typing import Callable
+
+from sqlalchemy import ColumnElement, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import AppConfig
+from src.infra.cache.lru import LRUCache
+from src.infra.database.models import RateLimitBucket
+from src.infra.database.session import get_database
+
+
+class RateLimitBackend(abc.ABC):
+    @abc.abstractmethod
+    async def acquire(self, key: str, *, rate: float, burst: int) -> float:
+        """
+        Takes a token of the bucket ``key``, which holds up to ``burst`` tokens
+        and is refilled at ``rate`` tokens per second. Returns ``0`` on
+        success and the number of seconds until a token is available if the
+        bucket is empty. A full bucket may be forgotten.
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.clock = clock
+        # (tokens, updated at) by key, the least recently used are evicted
+        self._buckets: LRUCache[str, tuple[float, float]] = LRUCache(
+            max_size=max_size,
+            clock=clock,
+        )
+
+    async def acquire(self, key: str, *, rate: float, burst: int) -> float:
+        now = self.clock()
+        tokens, updated_at = self._buckets.get(key) or (float(burst), now)
+        tokens = min(float(burst), tokens + (now - updated_at) * rate)
+        if tokens < 1:
+            return (1 - tokens) / rate
+
+        tokens -= 1
+        self._buckets.set(
+            key,
+            (tokens, now),
+            expires_at=now + (burst - tokens) / rate,
+        )
+        return 0.0
+
+
+def _seconds(value: ColumnElement[float] | float) -> ColumnElement:
+    return func.make_interval(0, 0, 0, 0, 0, 0, value)
+
+
+class PgRateLimitBackend(RateLimitBackend):
+    """
+    Stores buckets in the ``ratelimitbucket`` table. A token is taken by a
+    single upsert, which updates the row only if the refilled bucket has a
+    token, so concurrent workers never take the same token. The refill is
+    computed by the database, so the clocks of the workers do not matter.
+    Full buckets are purged on every ``purge_every`` acquisitions.
+    """
+
+    def __init__(
+        self,
+        get_engine: Callable[[], AsyncEngine],
+        *,
+        purge_every: int = 1000,
+    ) -> None:
+        self.get_engine = get_engine
+        self.purge_every = purge_every
+
+        self._acquisitions = itertools.count(1)
+
+    async def acquire(self, key: str, *, rate: float, burst: int) -> float:
+        elapsed = func.extract("epoch", func.now() - RateLimitBucket.updated_at)
+        tokens = func.least(float(burst), RateLimitBucket.tokens + elapsed * rate)
+
+        insert_query = pg_insert(RateLimitBucket).values(
+            key=key,
+            tokens=burst - 1,
+            updated_at=func.now(),
+            expires_at=func.now() + _seconds(1 / rate),
+        )
+        upsert_query = insert_query.on_conflict_do_update(
+            index_elements=[RateLimitBucket.key],
+            set_={
+                "tokens": tokens - 1,
+                "updated_at": func.now(),
+                "expires_at": func.now() + _seconds((burst - tokens + 1) / rate),
+            },
+            # an empty bucket is left as is and no row is returned
+            where=tokens >= 1,
+        ).returning(RateLimitBucket.key)
+
+        async with self.get_engine().begin() as connection:
+            if next(self._acquisitions) % self.purge_every == 0:
+                await connection.execute(
+                    delete(RateLimitBucket).where(
+                        RateLimitBucket.expires_at <= func.now(),
+                    ),
+                )
+
+            if await connection.scalar(upsert_query) is not None:
+                return 0.0
+
+            tokens_left = await connection.scalar(
+                select(tokens).where(RateLimitBucket.key == key),
+            )
+
+        return (1 - (tokens_left or 0.0)) / rate
+
+
+def create_rate_limit_backend(config: AppConfig) -> RateLimitBackend:
+    if config.rate_limit_backend == "postgres":
+        return PgRateLimitBackend(lambda: get_database().engine)
+
+    return MemoryRateLimitBackend(max_size=config.rate_limit_max_size)
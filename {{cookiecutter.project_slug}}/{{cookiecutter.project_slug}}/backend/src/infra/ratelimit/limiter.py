@@ -0,0 +1,56 @@
+import logging
+
+from src.infra import metrics
+from src.infra.ratelimit.backend import RateLimitBackend
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket limiter: every key gets a bucket of ``burst`` tokens refilled
+    at ``rate`` tokens per second and every attempt takes a token, so a key is
+    allowed bursts of ``burst`` attempts and ``rate`` attempts per second in
+    the long run. ``rate <= 0`` disables the limiter.
+
+    Backend errors are logged and the attempt is allowed, the limiter never
+    fails a request on its own.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        *,
+        name: str,
+        rate: float,
+        burst: int,
+    ) -> None:
+        self.backend = backend
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+
+    async def acquire(self, key: str) -> float:
+        """
+        Returns ``0`` if the attempt is allowed and the number of seconds to
+        wait before the next one otherwise.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        try:
+            retry_after = await self.backend.acquire(
+                f"{self.name}:{key}",
+                rate=self.rate,
+                burst=self.burst,
+            )
+        except Exception:
+            logger.exception("unable to acquire %s of rate limiter %s", key, self.name)
+            metrics.rate_limit_errors_total.labels(limiter=self.name).inc()
+            return 0.0
+
+        if retry_after > 0:
+            metrics.rate_limit_rejected_total.labels(limiter=self.name).inc()
+
+        return retry_after
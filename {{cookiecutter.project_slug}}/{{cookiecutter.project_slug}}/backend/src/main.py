@@ -1,11 +1,9 @@
 import asyncio
 
 from starlette.types import ASGIApp
-import uvicorn
 
 from src.config import AppConfig, get_config
 from src.infra.application.factory import app_factory
-from src.infra.application.pre_flight_check import pre_flight_check
 
 
 def create_app() -> ASGIApp:
@@ -15,6 +13,11 @@ def create_app() -> ASGIApp:
 
 
 async def run_app() -> None:
+    # imported here, as the app is usually served by a server importing it
+    import uvicorn
+
+    from src.infra.application.pre_flight_check import pre_flight_check
+
     await pre_flight_check()
 
     config: AppConfig = get_config()
@@ -25,6 +28,8 @@ async def run_app() -> None:
         port=int(config.app_host.port),  # type: ignore[arg-type]
         reload=config.environment.is_debug,
         factory=True,
+        proxy_headers=True,
+        forwarded_allow_ips=config.server_forwarded_allow_ips,
     )
 
 
@@ -1,6 +1,7 @@
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
+from src.infra.application.exception import ForbiddenError
 from src.service.auth.dto import JWTPayloadDto
 from src.service.auth.service import AuthService
 
@@ -17,3 +18,13 @@ async def check_jwt_token(
     )
 
     return jwt_payload.unwrap()
+
+
+async def check_admin_jwt_token(
+    *,
+    jwt_payload: JWTPayloadDto = Depends(check_jwt_token),
+) -> JWTPayloadDto:
+    if not jwt_payload.is_admin:
+        raise ForbiddenError("admin access is required")
+
+    return jwt_payload
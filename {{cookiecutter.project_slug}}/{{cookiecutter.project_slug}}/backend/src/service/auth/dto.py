@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class AccessTokenInDto(BaseModel):
@@ -9,7 +9,10 @@ class AccessTokenInDto(BaseModel):
 
 
 class JWTPayloadDto(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: UUID
+    is_admin: bool = False
 
 
 class AccessTokenOutDto(BaseModel):
@@ -1,6 +1,6 @@
 from fastapi import status
 
-from src.infra.application.exception import BadRequestError
+from src.infra.application.exception import BadRequestError, TooManyRequestsError
 
 
 class AuthServiceError(BadRequestError):
@@ -13,3 +13,7 @@ class InvalidCredentialError(AuthServiceError):
 
 class InvalidTokenError(InvalidCredentialError):
     status_code = status.HTTP_401_UNAUTHORIZED
+
+
+class TooManyLoginAttemptsError(TooManyRequestsError):
+    ...
@@ -0,0 +1,80 @@
+import asyncio
+from functools import lru_cache
+from typing import Sequence
+
+import bcrypt
+
+from src.config import config
+from src.infra.application.executor import BoundedExecutor
+
+
+def _hash_password(password: bytes) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _check_password(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    Hashes and verifies passwords in the bounded executor, so bcrypt does not
+    stall the event loop.
+    """
+
+    def __init__(self, executor: BoundedExecutor):
+        self.executor = executor
+
+    async def hash_password(self, *, password: str) -> bytes:
+        return await self.executor.run(_hash_password, password.encode())
+
+    async def hash_passwords(self, *, passwords: Sequence[str]) -> list[bytes]:
+        """
+        Hashes the passwords in parallel by ``max_workers`` tasks, each taking
+        the next password once its previous one is hashed, so the queue of the
+        executor is left to the other callers, e.g. logins.
+
+        The first failure, e.g. ``ServiceUnavailableError``, cancels the tasks
+        and is raised as is, the passwords left are not submitted at all.
+        """
+        hashed_passwords = [b""] * len(passwords)
+        indexes = iter(range(len(passwords)))
+
+        async def hash_next_passwords() -> None:
+            for index in indexes:
+                hashed_passwords[index] = await self.hash_password(
+                    password=passwords[index],
+                )
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(min(self.executor.max_workers, len(passwords))):
+                    task_group.create_task(hash_next_passwords())
+        except ExceptionGroup as err:
+            raise err.exceptions[0] from None
+
+        return hashed_passwords
+
+    async def check_password(
+        self,
+        *,
+        password: str,
+        hashed_password: bytes,
+    ) -> bool:
+        return await self.executor.run(
+            _check_password,
+            password.encode(),
+            hashed_password,
+        )
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    return PasswordHasher(
+        BoundedExecutor(
+            name="password_hasher",
+            kind=config.password_hasher_executor,
+            max_workers=config.password_hasher_max_workers,
+            max_queue_size=config.password_hasher_queue_size,
+        )
+    )
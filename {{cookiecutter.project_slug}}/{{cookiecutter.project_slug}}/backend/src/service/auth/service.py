@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
+import hashlib
 import logging
-from typing import cast
+import math
+from typing import Sequence, cast
 
-import bcrypt
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 import jwt
@@ -11,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.config import config
 from src.infra.application.exception import NotFoundError
 from src.infra.application.result import Result
+from src.infra.cache.lru import LRUCache
 from src.infra.database.models import User
 from src.service.auth.dto import (
     AccessTokenInDto,
@@ -20,7 +23,10 @@ from src.service.auth.dto import (
 from src.service.auth.exception import (
     InvalidCredentialError,
     InvalidTokenError,
+    TooManyLoginAttemptsError,
 )
+from src.service.auth.password import PasswordHasher, get_password_hasher
+from src.service.auth.throttle import LoginThrottle, get_login_throttle
 from src.service.user.repository import UserRepository
 
 
@@ -28,9 +34,24 @@ logger = logging.getLogger(__name__)
 oauth2_scheme = OAuth2PasswordBearer("/api/1/auth/token")
 
 
+@lru_cache
+def get_jwt_cache() -> LRUCache[bytes, JWTPayloadDto]:
+    """
+    Returns cache of verified JWT payloads keyed by the token digest.
+    """
+    return LRUCache(max_size=config.jwt_cache_max_size)
+
+
 class AuthService:
-    def __init__(self, user_repo: UserRepository = Depends()):
+    def __init__(
+        self,
+        user_repo: UserRepository = Depends(),
+        password_hasher: PasswordHasher = Depends(get_password_hasher),
+        login_throttle: LoginThrottle = Depends(get_login_throttle),
+    ):
         self.user_repo = user_repo
+        self.password_hasher = password_hasher
+        self.login_throttle = login_throttle
 
     @staticmethod
     async def check_jwt_token(
@@ -41,6 +62,11 @@ class AuthService:
             logger.debug("no jwt token is given, abort mission")
             return Result.fail(InvalidTokenError())
 
+        jwt_cache = get_jwt_cache()
+        cache_key = hashlib.sha256(token.encode()).digest()
+        if (cached_payload := jwt_cache.get(cache_key)) is not None:
+            return Result.ok(cached_payload)
+
         try:
             jwt_payload = jwt.decode(
                 token,
@@ -54,17 +80,23 @@ class AuthService:
             logger.error("invalid jwt token is given: %s", str(err))
             return Result.fail(InvalidTokenError(str(err)))
 
-        return Result.ok(
-            JWTPayloadDto(
-                user_id=jwt_payload["sub"],
-            )
+        payload = JWTPayloadDto(
+            user_id=jwt_payload["sub"],
+            is_admin=jwt_payload.get("adm", False),
         )
 
+        # Tokens without expiration are verified on every call.
+        if expires_at := jwt_payload.get("exp"):
+            jwt_cache.set(cache_key, payload, expires_at=float(expires_at))
+
+        return Result.ok(payload)
+
     def create_access_token(self, *, user: User) -> str:
         expires_in = timedelta(minutes=config.jwt_exp)
 
         jwt_payload = {
             "sub": str(user.user_id),
+            "adm": user.is_admin,
             "exp": datetime.utcnow() + expires_in,
         }
 
@@ -79,11 +111,31 @@ class AuthService:
         *,
         session: AsyncSession,
         access_token_in: AccessTokenInDto,
-    ) -> Result[AccessTokenOutDto, InvalidCredentialError]:
+        client_ip: str | None = None,
+    ) -> Result[
+        AccessTokenOutDto,
+        InvalidCredentialError | TooManyLoginAttemptsError,
+    ]:
         logger.info(
             "trying to authenticate user by email: email=%s",
             access_token_in.email,
         )
+        retry_after = await self.login_throttle.acquire(
+            client_ip=client_ip,
+            email=access_token_in.email,
+        )
+        if retry_after > 0:
+            logger.info(
+                "too many login attempts: email=%s client_ip=%s",
+                access_token_in.email,
+                client_ip,
+            )
+            return Result.fail(
+                TooManyLoginAttemptsError(
+                    headers={"Retry-After": str(math.ceil(retry_after))},
+                ),
+            )
+
         user_or_err = await self.user_repo.get_user_by_email(
             session=session,
             email=access_token_in.email,
@@ -96,7 +148,7 @@ class AuthService:
         user_found = cast(User, user_or_err.value)
         logger.info("user found: user_id=%s", user_found.user_id)
 
-        if not self.check_password(
+        if not await self.check_password(
             password=access_token_in.password,
             hashed_password=user_found.password,
         ):
@@ -116,19 +168,27 @@ class AuthService:
             )
         )
 
-    def check_password(
+    async def check_password(
         self,
         *,
         password: str,
         hashed_password: bytes,
     ) -> bool:
-        password_bytes = bytes(password, "utf-8")
-        return bcrypt.checkpw(password_bytes, hashed_password)
+        return await self.password_hasher.check_password(
+            password=password,
+            hashed_password=hashed_password,
+        )
 
-    def hash_password(
+    async def hash_password(
         self,
         *,
         password: str,
     ) -> bytes:
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode(), salt)
+        return await self.password_hasher.hash_password(password=password)
+
+    async def hash_passwords(
+        self,
+        *,
+        passwords: Sequence[str],
+    ) -> list[bytes]:
+        return await self.password_hasher.hash_passwords(passwords=passwords)
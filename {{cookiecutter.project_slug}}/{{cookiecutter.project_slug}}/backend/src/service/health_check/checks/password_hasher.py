@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Literal
+
+from src.infra.application.executor import ExecutorStats
+from src.service.auth.password import get_password_hasher
+from src.service.health_check.dto import CheckResult
+from src.service.health_check.service import Check, healthy_status, warn_status
+
+
+_Measurement = Literal["queueDepth", "waitTime", "rejected"]
+
+
+@dataclass
+class PasswordHasherCheck(Check):
+    """
+    Reports a single measurement of the password hashing executor. The status
+    is ``warn`` when calls were rejected since the previous check.
+    """
+
+    measurement: _Measurement = "queueDepth"
+    _last_rejected: int = field(default=0, init=False, repr=False)
+
+    async def __call__(self) -> CheckResult:
+        stats = get_password_hasher().executor.stats()
+
+        check_result = healthy_status
+        if stats.rejected > self._last_rejected:
+            check_result = warn_status
+        self._last_rejected = stats.rejected
+
+        observed_value, observed_unit = self._get_observed_value(stats)
+
+        return CheckResult(
+            component_id=self.component_id,
+            component_type=self.component_type,
+            observed_value=observed_value,
+            observed_unit=observed_unit,
+            status=check_result.name,
+            time=datetime.now(UTC).isoformat(),
+        )
+
+    def _get_observed_value(
+        self,
+        stats: ExecutorStats,
+    ) -> tuple[int | float, str | None]:
+        match self.measurement:
+            case "waitTime":
+                return round(stats.wait_time_avg * 1000, 3), "ms"
+            case "rejected":
+                return stats.rejected, None
+            case _:
+                return stats.queue_depth, None
@@ -1,36 +1,113 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+import time
+from typing import Literal
 
-from sqlalchemy import text
-
-from src.infra.database.session import async_session_factory
+from src.config import config
+from src.infra.database.pool import PoolStats, get_pool_stats
+from src.infra.database.ping import ping
+from src.infra.database.session import get_database
 from src.service.health_check.dto import CheckComponentType, CheckResult
 from src.service.health_check.service import (
     Check,
     ProbeResultStatus,
     fail_status,
     healthy_status,
+    warn_status,
 )
 
 
+_PoolMeasurement = Literal["connections", "waiters", "waitTime"]
+
+
 @dataclass
 class PgCheck(Check):
+    """
+    Reports the response time of a trivial query in ms. The status is
+    ``warn`` or ``fail`` when it exceeds the given thresholds in seconds.
+    """
+
     component_type: CheckComponentType = CheckComponentType.datastore
+    warn_response_time: float = config.health_check_pg_warn_response_time
+    fail_response_time: float = config.health_check_pg_fail_response_time
 
     async def __call__(self) -> CheckResult:
         check_result: ProbeResultStatus
 
+        started_at = time.perf_counter()
         try:
-            async with async_session_factory() as session:
-                await session.execute(text("select true"))
+            await ping(get_database().engine)
         except:  # noqa: E722
+            return CheckResult(
+                component_id=self.component_id,
+                component_type=self.component_type,
+                status=fail_status.name,
+                time=datetime.now(UTC).isoformat(),
+            )
+
+        response_time = time.perf_counter() - started_at
+        if response_time >= self.fail_response_time:
             check_result = fail_status
+        elif response_time >= self.warn_response_time:
+            check_result = warn_status
         else:
             check_result = healthy_status
 
         return CheckResult(
             component_id=self.component_id,
             component_type=self.component_type,
+            observed_value=round(response_time * 1000, 3),
+            observed_unit="ms",
+            status=check_result.name,
+            time=datetime.now(UTC).isoformat(),
+        )
+
+
+@dataclass
+class PgPoolCheck(Check):
+    """
+    Reports a single measurement of the connection pool. The status is
+    ``warn`` when checkouts timed out since the previous check.
+    """
+
+    component_type: CheckComponentType = CheckComponentType.datastore
+    measurement: _PoolMeasurement = "connections"
+    _last_timeouts: int = field(default=0, init=False, repr=False)
+
+    async def __call__(self) -> CheckResult:
+        stats = get_pool_stats(get_database().engine)
+        if stats is None:
+            return CheckResult(
+                component_id=self.component_id,
+                component_type=self.component_type,
+                status=healthy_status.name,
+                time=datetime.now(UTC).isoformat(),
+            )
+
+        check_result = healthy_status
+        if stats.timeouts > self._last_timeouts:
+            check_result = warn_status
+        self._last_timeouts = stats.timeouts
+
+        observed_value, observed_unit = self._get_observed_value(stats)
+
+        return CheckResult(
+            component_id=self.component_id,
+            component_type=self.component_type,
+            observed_value=observed_value,
+            observed_unit=observed_unit,
             status=check_result.name,
             time=datetime.now(UTC).isoformat(),
         )
+
+    def _get_observed_value(
+        self,
+        stats: PoolStats,
+    ) -> tuple[int | float, str | None]:
+        match self.measurement:
+            case "waiters":
+                return stats.waiters, None
+            case "waitTime":
+                return round(stats.wait_time_avg * 1000, 3), "ms"
+            case _:
+                return stats.checked_out, None
@@ -120,6 +120,10 @@ class CheckResult(Base):
         default=None,
         description="The date-time, in ISO8601 format, at which the request was processed",
     )
+    output: str | None = Field(
+        default=None,
+        description="Raw error output in case of fail or warn status",
+    )
 
     @field_validator("time")
     def validate_time_iso_8061(cls, v: str) -> str:  # noqa: N805
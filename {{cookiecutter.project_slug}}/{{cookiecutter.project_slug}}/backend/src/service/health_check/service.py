@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
 import asyncio
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
 from itertools import chain, groupby
 import logging
+import time
+from typing import Callable, Sequence
 
+from src.config import config
 from src.service.health_check.dto import (
     CheckResult,
     CheckComponentType,
@@ -17,6 +22,8 @@ logger = logging.getLogger(__name__)
 class Check(ABC):
     component_id: str
     component_type: CheckComponentType = CheckComponentType.component
+    # seconds to wait for the check, it fails if it takes longer
+    timeout: float = config.health_check_timeout
 
     @abstractmethod
     async def __call__(self) -> CheckResult:
@@ -27,6 +34,8 @@ class Check(ABC):
 class Probe:
     name: str
     checks: list[Check]
+    # seconds ProbeCache keeps the result for, no caching if not set
+    cache_ttl: float | None = None
 
 
 @dataclass(frozen=True)
@@ -48,7 +57,7 @@ fail_status = ProbeResultStatus(code=503, name="fail")
 
 class HealthCheckService:
     async def run_probe(self, probe: Probe) -> ProbeResult:
-        checks = [check() for check in probe.checks]
+        checks = [self.run_check(check) for check in probe.checks]
         check_results: list[CheckResult] = await asyncio.gather(*checks)
 
         checks_by_component = {}
@@ -65,14 +74,130 @@ class HealthCheckService:
             checks=checks_by_component,
         )
 
+    async def run_check(self, check: Check) -> CheckResult:
+        try:
+            return await asyncio.wait_for(check(), timeout=check.timeout)
+        except TimeoutError:
+            logger.warning(
+                "check %s timed out after %ss",
+                check.component_id,
+                check.timeout,
+            )
+            return CheckResult(
+                component_id=check.component_id,
+                component_type=check.component_type,
+                status=fail_status.name,
+                time=datetime.now(UTC).isoformat(),
+                output=f"timed out after {check.timeout}s",
+            )
+
     async def get_probe_result_status(
         self,
         checks: dict[str, list[CheckResult]],
     ) -> ProbeResultStatus:
+        probe_status = healthy_status
         for check in chain.from_iterable(checks.values()):
-            if check.status == warn_status.name:
-                return warn_status
-            elif check.status == fail_status.name:
+            if check.status == fail_status.name:
                 return fail_status
+            elif check.status == warn_status.name:
+                probe_status = warn_status
+
+        return probe_status
+
+
+@dataclass
+class _CachedProbeResult:
+    result: ProbeResult
+    checked_at: float
+
+
+class ProbeCache:
+    """
+    Caches probe results for ``Probe.cache_ttl`` seconds.
+
+    A stale result is still returned, while a single refresh runs in the
+    background, unless it is older than ``max_stale`` seconds. Concurrent
+    callers share the in-flight refresh, so the checks never run more than
+    once at a time.
+    """
+
+    def __init__(
+        self,
+        health_check: HealthCheckService,
+        *,
+        max_stale: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.health_check = health_check
+        self.max_stale = max_stale
+        self.clock = clock
+
+        self._results: dict[str, _CachedProbeResult] = {}
+        self._refreshes: dict[str, asyncio.Task[ProbeResult]] = {}
+
+    async def run_probe(self, probe: Probe) -> ProbeResult:
+        if not probe.cache_ttl:
+            return await self.health_check.run_probe(probe)
+
+        cached = self._results.get(probe.name)
+        if cached is not None:
+            age = self.clock() - cached.checked_at
+            if age < probe.cache_ttl:
+                return cached.result
+
+            if age < probe.cache_ttl + self.max_stale:
+                self.refresh(probe)
+                return cached.result
+
+        return await asyncio.shield(self.refresh(probe))
+
+    def refresh(self, probe: Probe) -> asyncio.Task[ProbeResult]:
+        """
+        Starts a refresh of the probe result unless one is in flight already.
+        """
+        task = self._refreshes.get(probe.name)
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.create_task(self._refresh(probe))
+            self._refreshes[probe.name] = task
+
+        return task
+
+    async def refresh_forever(self, probes: Sequence[Probe]) -> None:
+        """
+        Keeps the results of cached probes fresh, so the callers never wait
+        for the checks.
+        """
+        cache_ttls = [probe.cache_ttl for probe in probes if probe.cache_ttl]
+        if not cache_ttls:
+            return
+
+        probes = [probe for probe in probes if probe.cache_ttl]
+        interval = min(cache_ttls)
+        while True:
+            for probe in probes:
+                try:
+                    await asyncio.shield(self.refresh(probe))
+                except Exception:
+                    logger.exception("unable to refresh probe %s", probe.name)
+
+            await asyncio.sleep(interval)
+
+    async def _refresh(self, probe: Probe) -> ProbeResult:
+        result = await self.health_check.run_probe(probe)
+        self._results[probe.name] = _CachedProbeResult(
+            result=result,
+            checked_at=self.clock(),
+        )
+        return result
+
 
-        return healthy_status
+@lru_cache
+def get_probe_cache() -> ProbeCache:
+    return ProbeCache(
+        HealthCheckService(),
+        max_stale=config.health_check_max_stale,
+    )
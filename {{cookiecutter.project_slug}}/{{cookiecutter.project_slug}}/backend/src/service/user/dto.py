@@ -1,3 +1,4 @@
+from typing import Literal
 import uuid
 
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
@@ -16,3 +17,22 @@ class UserInDto(BaseModel):
 class UserOutDto(OrmBase):
     user_id: uuid.UUID
     email: EmailStr
+
+
+class UserPageOutDto(BaseModel):
+    users: list[UserOutDto]
+    next_cursor: str | None = None
+
+
+class UserImportRowInDto(BaseModel):
+    line: int
+    user_in: UserInDto | None = None
+    # the reason the row is invalid when there is no user_in
+    error: str | None = None
+
+
+class UserImportRowOutDto(BaseModel):
+    line: int
+    status: Literal["created", "conflict", "invalid", "error"]
+    user_id: uuid.UUID | None = None
+    error: str | None = None
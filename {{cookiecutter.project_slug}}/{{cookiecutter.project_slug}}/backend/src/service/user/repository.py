@@ -1,9 +1,15 @@
+from typing import Any, Iterable, Mapping, Sequence
 import uuid
 
-from src.infra.application.exception import BadRequestError, NotFoundError
+from src.infra.application.exception import (
+    AlreadyExistsError,
+    BadRequestError,
+    NotFoundError,
+)
 from src.infra.application.result import Result
 from src.infra.database.models import User
-from src.infra.database.repository import GenericRepository
+from src.infra.database.pagination import Page
+from src.infra.database.repository import BulkCreateResult, GenericRepository
 from src.infra.database.session import AsyncSession
 
 
@@ -43,10 +49,52 @@ class UserRepository(GenericRepository[User]):
         user_id: uuid.UUID,
         email: str,
         password: bytes,
-    ) -> Result[User, BadRequestError]:
-        return await self.create_record(
+    ) -> Result[User, AlreadyExistsError | BadRequestError]:
+        """
+        Creates user unless the email is taken.
+        """
+        return await self.create_record_if_absent(
             session=session,
+            conflict_prop_names=("email",),
             user_id=user_id,
             email=email,
             password=password,
         )
+
+    async def get_users_by_emails(
+        self,
+        *,
+        session: AsyncSession,
+        emails: Iterable[str],
+    ) -> dict[str, User]:
+        return await self.get_records_by(
+            session=session,
+            prop_name="email",
+            values=emails,
+        )
+
+    async def create_users(
+        self,
+        *,
+        session: AsyncSession,
+        users: Sequence[Mapping[str, Any]],
+    ) -> Result[BulkCreateResult[User], BadRequestError]:
+        return await self.create_records(
+            session=session,
+            records=users,
+            key="email",
+        )
+
+    async def get_users_page(
+        self,
+        *,
+        session: AsyncSession,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Result[Page[User], BadRequestError]:
+        return await self.get_records_page(
+            session=session,
+            keyset=("created_at", "id"),
+            limit=limit,
+            cursor=cursor,
+        )
@@ -1,15 +1,32 @@
+from functools import lru_cache
 import logging
-from typing import cast
+from typing import Any, AsyncIterable, AsyncIterator, cast
 import uuid
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import config
+from src.infra.application.exception import (
+    AlreadyExistsError,
+    BadRequestError,
+    ServiceUnavailableError,
+)
 from src.infra.application.result import Result
+from src.infra.cache.backend import create_cache_backend
+from src.infra.cache.service import ServiceCache, cached
 from src.infra.database.models import User
+from src.infra.database.pagination import Page
+from src.infra.database.repository import BulkCreateResult
 from src.infra.database.transactional import transactional
 from src.service.auth.service import AuthService
-from src.service.user.dto import UserInDto, UserOutDto
+from src.service.user.dto import (
+    UserImportRowInDto,
+    UserImportRowOutDto,
+    UserInDto,
+    UserOutDto,
+    UserPageOutDto,
+)
 from src.service.user.exception import EmailTakenError, UserNotFoundError
 from src.service.user.repository import UserRepository
 
@@ -17,6 +34,23 @@ from src.service.user.repository import UserRepository
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def get_user_cache() -> ServiceCache[UserOutDto]:
+    """
+    Returns cache of users keyed by user_id.
+
+    No service method changes an existing user, a method doing so has to
+    delete its entry. Users changed by other means, e.g. by hand in the
+    database, are served stale for up to ``USER_CACHE_TTL`` seconds.
+    """
+    return ServiceCache(
+        create_cache_backend(config),
+        name="user",
+        model=UserOutDto,
+        ttl=config.user_cache_ttl,
+    )
+
+
 class UserService:
     def __init__(
         self,
@@ -26,36 +60,35 @@ class UserService:
         self.user_repo = user_repo
         self.auth_service = auth_service
 
-    @transactional()
     async def create_user(
         self,
         *,
         session: AsyncSession,
         user_in: UserInDto,
-    ) -> Result[UserOutDto, EmailTakenError]:
-        logger.info("check user email is not taken: email=%s", user_in.email)
-        user_or_err = await self.user_repo.get_user_by_email(
-            session=session,
-            email=user_in.email,
-            with_for_update=True,
+    ) -> Result[UserOutDto, EmailTakenError | BadRequestError]:
+        # The password is hashed before the transaction is started, so no
+        # connection or row lock is held while waiting for the hasher.
+        hashed_password = await self.auth_service.hash_password(
+            password=user_in.password,
         )
 
-        match user_or_err:
-            case Result(user_record, None):  # noqa: F841
-                logger.info(
-                    "unable to create a new user: the given email %s is already taken",
-                    user_in.email,
-                )
-                return Result.fail(
-                    EmailTakenError(
-                        "unable to create a new user: the given email is already taken"
-                    )
-                )
-
-        hashed_password = self.auth_service.hash_password(
-            password=user_in.password,
+        return await self._create_user(
+            session=session,
+            user_in=user_in,
+            hashed_password=hashed_password,
         )
 
+    @transactional()
+    async def _create_user(
+        self,
+        *,
+        session: AsyncSession,
+        user_in: UserInDto,
+        hashed_password: bytes,
+    ) -> Result[UserOutDto, EmailTakenError | BadRequestError]:
+        # The email uniqueness is checked by the insert itself, a lookup
+        # beforehand costs a round trip and cannot lock a row which does not
+        # exist yet, so it does not prevent the race anyway.
         logger.info("create a new user: email=%s", user_in.email)
         new_user_or_err = await self.user_repo.create_user(
             session=session,
@@ -75,10 +108,10 @@ class UserService:
                     UserOutDto.model_validate(new_user),
                 )
 
-            case _:
+            case Result(_, AlreadyExistsError()):
                 logger.info(
-                    "unable to create a new user: %s",
-                    str(new_user_or_err.error),
+                    "unable to create a new user: the given email %s is already taken",
+                    user_in.email,
                 )
                 return Result.fail(
                     EmailTakenError(
@@ -86,6 +119,14 @@ class UserService:
                     )
                 )
 
+            case _:
+                logger.info(
+                    "unable to create a new user: %s",
+                    str(new_user_or_err.error),
+                )
+                return Result.fail(cast(BadRequestError, new_user_or_err.error))
+
+    @cached(get_user_cache, key=lambda user_id, **_: str(user_id))
     async def get_user_by_id(
         self,
         *,
@@ -108,3 +149,137 @@ class UserService:
         return Result.fail(
             UserNotFoundError(f"user not found: user_id={user_id}"),
         )
+
+    async def get_users(
+        self,
+        *,
+        session: AsyncSession,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Result[UserPageOutDto, BadRequestError]:
+        logger.info("get users page: limit=%s cursor=%s", limit, cursor)
+        page_or_err = await self.user_repo.get_users_page(
+            session=session,
+            limit=limit,
+            cursor=cursor,
+        )
+
+        match page_or_err:
+            case Result(page, None):
+                page = cast(Page[User], page)
+                return Result.ok(
+                    UserPageOutDto(
+                        users=[UserOutDto.model_validate(u) for u in page.records],
+                        next_cursor=page.next_cursor,
+                    )
+                )
+
+        logger.info("unable to get users page: %s", str(page_or_err.error))
+        return Result.fail(cast(BadRequestError, page_or_err.error))
+
+    async def import_users(
+        self,
+        *,
+        session: AsyncSession,
+        rows: AsyncIterable[UserImportRowInDto],
+        batch_size: int,
+    ) -> AsyncIterator[UserImportRowOutDto]:
+        """
+        Creates users of the rows in batches of ``batch_size`` and yields the
+        result of every row. Every batch is committed on its own, so only one
+        batch is held in memory and an import interrupted halfway keeps the
+        batches done. Rows with taken emails are reported as conflicts.
+        """
+        batch: list[UserImportRowInDto] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                for row_out in await self._import_batch(session=session, rows=batch):
+                    yield row_out
+                batch = []
+
+        if batch:
+            for row_out in await self._import_batch(session=session, rows=batch):
+                yield row_out
+
+    async def _import_batch(
+        self,
+        *,
+        session: AsyncSession,
+        rows: list[UserImportRowInDto],
+    ) -> list[UserImportRowOutDto]:
+        rows_out = [
+            UserImportRowOutDto(line=row.line, status="invalid", error=row.error)
+            for row in rows
+            if row.user_in is None
+        ]
+        users_in = [row.user_in for row in rows if row.user_in is not None]
+        lines = [row.line for row in rows if row.user_in is not None]
+        if not users_in:
+            return rows_out
+
+        logger.info("import users: lines=%s-%s", lines[0], lines[-1])
+        try:
+            hashed_passwords = await self.auth_service.hash_passwords(
+                passwords=[user_in.password for user_in in users_in],
+            )
+        except ServiceUnavailableError as err:
+            return rows_out + [
+                UserImportRowOutDto(line=line, status="error", error=str(err.detail))
+                for line in lines
+            ]
+
+        created_or_err = await self._create_users(
+            session=session,
+            users=[
+                {
+                    "user_id": user_in.user_id,
+                    "email": user_in.email,
+                    "password": hashed_password,
+                }
+                for user_in, hashed_password in zip(users_in, hashed_passwords)
+            ],
+        )
+
+        match created_or_err:
+            case Result(bulk_result, None):
+                conflicts = set(cast(BulkCreateResult, bulk_result).conflicts)
+                rows_out.extend(
+                    UserImportRowOutDto(line=line, status="conflict")
+                    if index in conflicts
+                    else UserImportRowOutDto(
+                        line=line,
+                        status="created",
+                        user_id=user_in.user_id,
+                    )
+                    for index, (line, user_in) in enumerate(zip(lines, users_in))
+                )
+
+            case _:
+                logger.info(
+                    "unable to import users: %s",
+                    str(created_or_err.error),
+                )
+                # the failed statement aborts the transaction, the next batch
+                # needs a new one
+                await session.rollback()
+                rows_out.extend(
+                    UserImportRowOutDto(
+                        line=line,
+                        status="error",
+                        error="unable to create user",
+                    )
+                    for line in lines
+                )
+
+        rows_out.sort(key=lambda row_out: row_out.line)
+        return rows_out
+
+    @transactional()
+    async def _create_users(
+        self,
+        *,
+        session: AsyncSession,
+        users: list[dict[str, Any]],
+    ) -> Result[BulkCreateResult[User], BadRequestError]:
+        return await self.user_repo.create_users(session=session, users=users)
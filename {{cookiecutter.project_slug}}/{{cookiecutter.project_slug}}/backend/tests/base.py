@@ -1,8 +1,48 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
 import os
+from typing import AsyncIterator, Iterator
+import uuid
 
 import alembic.config
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from yarl import URL
 
 from src.config import AppConfig
+from src.infra.cache.backend import CacheBackend
+from src.infra.ratelimit.backend import RateLimitBackend
+
+
+class FakeClock:
+    """
+    Clock returning ``now``, which the tests move by hand.
+    """
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingBackend(CacheBackend, RateLimitBackend):
+    """
+    Cache and rate limiter backend failing every call, as an unreachable
+    storage does.
+    """
+
+    async def get(self, key: str) -> bytes | None:
+        raise ConnectionError()
+
+    async def set(self, key: str, value: bytes, *, ttl: float) -> None:
+        raise ConnectionError()
+
+    async def delete(self, key: str) -> None:
+        raise ConnectionError()
+
+    async def acquire(self, key: str, *, rate: float, burst: int) -> float:
+        raise ConnectionError()
 
 
 def get_test_app_config() -> AppConfig:
@@ -21,6 +61,81 @@ def get_test_alembic_config(test_app_config: AppConfig) -> alembic.config.Config
     return alembic_config
 
 
+async def _execute_on_server(dsn: URL, statement: str) -> None:
+    engine = create_async_engine(
+        str(dsn.with_path("/postgres")),
+        isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
+    )
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text(statement))
+    finally:
+        await engine.dispose()
+
+
+def _get_database_name(dsn: URL) -> str:
+    return dsn.path.lstrip("/")
+
+
+async def create_database(dsn: URL, *, template: str | None = None) -> None:
+    statement = f'create database "{_get_database_name(dsn)}"'
+    if template is not None:
+        statement += f' template "{template}"'
+
+    await _execute_on_server(dsn, statement)
+
+
+async def drop_database(dsn: URL) -> None:
+    await _execute_on_server(
+        dsn,
+        f'drop database if exists "{_get_database_name(dsn)}" with (force)',
+    )
+
+
+def with_pg_dsn(test_app_config: AppConfig, dsn: URL) -> AppConfig:
+    return test_app_config.model_copy(update={"pg_dsn": dsn})
+
+
+@contextmanager
+def temporary_database(test_app_config: AppConfig, suffix: str) -> Iterator[AppConfig]:
+    """
+    Creates an empty database named after the test database with the given
+    suffix and yields its config, the database is dropped on exit. The one
+    left by an interrupted run is dropped first.
+    """
+    test_dsn = test_app_config.pg_dsn
+    assert test_dsn is not None
+
+    dsn = test_dsn.with_path(f"/{_get_database_name(test_dsn)}_{suffix}")
+    asyncio.run(drop_database(dsn))
+    asyncio.run(create_database(dsn))
+    try:
+        yield with_pg_dsn(test_app_config, dsn)
+    finally:
+        asyncio.run(drop_database(dsn))
+
+
+@asynccontextmanager
+async def clone_database(test_app_config: AppConfig) -> AsyncIterator[AppConfig]:
+    """
+    Creates a copy of the migrated test database, using it as a template, and
+    yields the config of the copy. Postgres copies the files of the template,
+    which is much faster than migrating a new database. The template must have
+    no other connections while it is copied.
+    """
+    template_dsn = test_app_config.pg_dsn
+    assert template_dsn is not None
+
+    template = _get_database_name(template_dsn)
+    dsn = template_dsn.with_path(f"/{template}_{uuid.uuid4().hex[:8]}")
+    await create_database(dsn, template=template)
+    try:
+        yield with_pg_dsn(test_app_config, dsn)
+    finally:
+        await drop_database(dsn)
+
+
 class BaseTestCase:
     base_url: str
 
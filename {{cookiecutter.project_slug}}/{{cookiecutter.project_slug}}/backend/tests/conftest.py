@@ -1,18 +1,40 @@
+from typing import Iterator
+
 import alembic.command
 import alembic.config
 from fastapi.testclient import TestClient
+import httpx
 import pytest
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.config import AppConfig
 from src.infra.application.factory import app_factory
-from src.infra.database.session import async_session_factory, get_session
-from tests.base import get_test_app_config, get_test_alembic_config
+from src.infra.database.session import (
+    Database,
+    close_database,
+    get_session,
+    init_database,
+)
+from src.service.auth.throttle import get_login_throttle
+from tests.base import (
+    clone_database,
+    get_test_alembic_config,
+    get_test_app_config,
+    temporary_database,
+)
 
 
 @pytest.fixture(scope="session")
-def test_app_config() -> AppConfig:
-    return get_test_app_config()
+def test_app_config(worker_id: str) -> Iterator[AppConfig]:
+    """
+    Every pytest-xdist worker gets a database of its own, named after the
+    test database with the worker suffix, e.g. ``app_test_gw0``.
+    """
+    if worker_id == "master":
+        yield get_test_app_config()
+        return
+
+    with temporary_database(get_test_app_config(), worker_id) as worker_app_config:
+        yield worker_app_config
 
 
 @pytest.fixture(scope="session")
@@ -20,11 +42,27 @@ def test_alembic_config(test_app_config: AppConfig) -> alembic.config.Config:
     return get_test_alembic_config(test_app_config)
 
 
-@pytest.fixture(autouse=True)
-def auto_prune_database(test_alembic_config: alembic.config.Config):
-    alembic.command.upgrade(test_alembic_config, revision="head")
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "clone_database: run the test in a copy of the test database, so it "
+        "may commit",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_database(test_app_config: AppConfig):
+    """
+    Migrates the test database once per session, the tests are isolated by
+    rolling back their transactions instead.
+
+    Does not depend on ``test_alembic_config``, the migration stairway
+    parametrizes it per revision.
+    """
+    alembic_config = get_test_alembic_config(test_app_config)
+    alembic.command.upgrade(alembic_config, revision="head")
     yield
-    alembic.command.downgrade(test_alembic_config, revision="base")
+    alembic.command.downgrade(alembic_config, revision="base")
 
 
 @pytest.mark.asyncio
@@ -33,12 +71,52 @@ async def test_app(test_app_config):
     return app_factory(test_app_config)
 
 
+@pytest.fixture(autouse=True)
+def login_throttle():
+    """
+    Every test starts with full login buckets, the tests log in from the same
+    client address.
+    """
+    get_login_throttle.cache_clear()
+    yield
+    get_login_throttle.cache_clear()
+
+
 @pytest.fixture
-async def test_session(test_app_config: AppConfig):
-    test_engine = create_async_engine(str(test_app_config.pg_dsn))
-    async_session_factory.configure(bind=test_engine)
+async def test_database(request: pytest.FixtureRequest, test_app_config: AppConfig):
+    """
+    Binds all the sessions of the test, the scoped ones of the app included,
+    to a single connection and runs the test in its transaction, which is
+    rolled back at the end. Every session works in a SAVEPOINT of its own, so
+    ``commit()`` and ``rollback()``, e.g. by ``@transactional()``, keep working
+    and do not end the test transaction.
+
+    The tests marked ``clone_database`` get a copy of the test database
+    instead and may commit for real.
+    """
+    if request.node.get_closest_marker("clone_database"):
+        async with clone_database(test_app_config) as clone_app_config:
+            yield init_database(clone_app_config)
+            await close_database()
+        return
+
+    database = init_database(test_app_config)
+    async with database.engine.connect() as connection:
+        transaction = await connection.begin()
+        database.session_factory.configure(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield database
+        finally:
+            await transaction.rollback()
+    await close_database()
 
-    async with async_session_factory() as session:
+
+@pytest.fixture
+async def test_session(test_database: Database):
+    async with test_database.session_factory() as session:
         try:
             yield session
         finally:
@@ -54,3 +132,18 @@ def client(test_app, test_session):
     test_app.dependency_overrides[get_session] = get_test_session
 
     yield TestClient(test_app)
+
+    test_app.dependency_overrides.pop(get_session)
+
+
+@pytest.fixture
+async def async_client(test_app, test_database: Database):
+    """
+    Runs the app in the test event loop, so the scoped sessions of the routes
+    share the connection and the transaction of the test.
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=test_app),
+        base_url="http://test",
+    ) as client:
+        yield client
@@ -0,0 +1,208 @@
+import asyncio
+import threading
+
+from fastapi import FastAPI
+import httpx
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.application.executor import BoundedExecutor
+from src.infra.database.models import User
+from src.service.auth.password import PasswordHasher, get_password_hasher
+from tests.base import BaseTestCase
+
+
+class TestCreateUser(BaseTestCase):
+    base_url: str = "/api/1/users/"
+
+    async def test_create_ok(self, async_client: httpx.AsyncClient):
+        res = await async_client.post(
+            self.get_url(),
+            json={"email": "user@example.com", "password": "password"},
+        )
+        assert res.status_code == 201
+
+        given_json = res.json()
+        assert given_json["result"]["email"] == "user@example.com"
+        assert given_json["result"]["user_id"]
+
+    async def test_create_email_taken(self, async_client: httpx.AsyncClient):
+        user_in = {"email": "user@example.com", "password": "password"}
+
+        res = await async_client.post(self.get_url(), json=user_in)
+        assert res.status_code == 201
+
+        res = await async_client.post(self.get_url(), json=user_in)
+        assert res.status_code == 400
+
+    async def test_create_password_hasher_saturated(
+        self,
+        async_client: httpx.AsyncClient,
+        test_app: FastAPI,
+    ):
+        executor = BoundedExecutor(
+            name="test",
+            kind="thread",
+            max_workers=1,
+            max_queue_size=0,
+        )
+        test_app.dependency_overrides[get_password_hasher] = lambda: (
+            PasswordHasher(executor)
+        )
+        release = threading.Event()
+        running = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0)
+
+        try:
+            res = await async_client.post(
+                self.get_url(),
+                json={"email": "user@example.com", "password": "password"},
+            )
+            assert res.status_code == 503
+            assert res.headers["Retry-After"]
+        finally:
+            release.set()
+            await running
+            executor.shutdown()
+            test_app.dependency_overrides.pop(get_password_hasher)
+
+
+class TestGetUserMe(BaseTestCase):
+    base_url: str = "/api/1/users/me"
+
+    async def test_get_ok(self, async_client: httpx.AsyncClient):
+        user_in = {"email": "user@example.com", "password": "password"}
+        res = await async_client.post("/api/1/users/", json=user_in)
+        assert res.status_code == 201
+
+        res = await async_client.post("/api/1/auth/token", json=user_in)
+        assert res.status_code == 200
+        access_token = res.json()["result"]["access_token"]
+
+        res = await async_client.get(
+            self.get_url(),
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert res.status_code == 200
+        assert res.json()["result"]["email"] == user_in["email"]
+
+    async def test_get_wrong_password(self, async_client: httpx.AsyncClient):
+        res = await async_client.post(
+            "/api/1/users/",
+            json={"email": "user@example.com", "password": "password"},
+        )
+        assert res.status_code == 201
+
+        res = await async_client.post(
+            "/api/1/auth/token",
+            json={"email": "user@example.com", "password": "wrong password"},
+        )
+        assert res.status_code == 400
+
+    async def test_get_unauthorized(self, async_client: httpx.AsyncClient):
+        res = await async_client.get(
+            self.get_url(),
+            headers={"Authorization": "Bearer invalid"},
+        )
+        assert res.status_code == 401
+
+
+class TestGetUsers(BaseTestCase):
+    base_url: str = "/api/1/users/"
+
+    async def get_access_token(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+        *,
+        is_admin: bool,
+    ) -> str:
+        user_in = {"email": "admin@example.com", "password": "password"}
+        res = await async_client.post(self.get_url(), json=user_in)
+        assert res.status_code == 201
+
+        await test_session.execute(
+            update(User)
+            .where(User.email == user_in["email"])
+            .values(is_admin=is_admin),
+        )
+
+        res = await async_client.post("/api/1/auth/token", json=user_in)
+        assert res.status_code == 200
+        return res.json()["result"]["access_token"]
+
+    async def test_get_pages(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+    ):
+        access_token = await self.get_access_token(
+            async_client,
+            test_session,
+            is_admin=True,
+        )
+        for i in range(4):
+            res = await async_client.post(
+                self.get_url(),
+                json={"email": f"user{i}@example.com", "password": "password"},
+            )
+            assert res.status_code == 201
+
+        emails = []
+        params: dict = {"limit": 2}
+        while True:
+            res = await async_client.get(
+                self.get_url(),
+                params=params,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            assert res.status_code == 200
+
+            given_json = res.json()
+            assert len(given_json["result"]) <= 2
+            emails.extend(user["email"] for user in given_json["result"])
+
+            if given_json["next_cursor"] is None:
+                break
+            params["cursor"] = given_json["next_cursor"]
+
+        assert len(emails) == 5
+        assert set(emails) == {
+            "admin@example.com",
+            *(f"user{i}@example.com" for i in range(4)),
+        }
+
+    async def test_get_invalid_cursor(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+    ):
+        access_token = await self.get_access_token(
+            async_client,
+            test_session,
+            is_admin=True,
+        )
+
+        res = await async_client.get(
+            self.get_url(),
+            params={"cursor": "invalid"},
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert res.status_code == 400
+
+    async def test_get_forbidden(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+    ):
+        access_token = await self.get_access_token(
+            async_client,
+            test_session,
+            is_admin=False,
+        )
+
+        res = await async_client.get(
+            self.get_url(),
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert res.status_code == 403
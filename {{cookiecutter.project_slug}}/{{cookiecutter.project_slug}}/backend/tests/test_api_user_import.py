@@ -0,0 +1,134 @@
+import json
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.rest.v1.user.parser import iter_lines
+from src.infra.database.models import User
+from tests.base import BaseTestCase
+
+
+async def chunked(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+async def test_iter_lines(chunk_size: int):
+    body = b"first\n\nsecond line is long\r\nthird"
+
+    lines = [
+        line
+        async for line in iter_lines(chunked(body, chunk_size), max_line_size=12)
+    ]
+
+    assert lines == [(1, b"first"), (2, b""), (3, None), (4, b"third")]
+
+
+class TestImportUsers(BaseTestCase):
+    base_url: str = "/api/1/users/import"
+
+    async def get_headers(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+        *,
+        is_admin: bool = True,
+    ) -> dict[str, str]:
+        user_in = {"email": "admin@example.com", "password": "password"}
+        res = await async_client.post("/api/1/users/", json=user_in)
+        assert res.status_code == 201
+
+        await test_session.execute(
+            update(User)
+            .where(User.email == user_in["email"])
+            .values(is_admin=is_admin),
+        )
+
+        res = await async_client.post("/api/1/auth/token", json=user_in)
+        access_token = res.json()["result"]["access_token"]
+        return {"Authorization": f"Bearer {access_token}"}
+
+    async def test_import_ndjson(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+    ):
+        headers = await self.get_headers(async_client, test_session)
+        rows = [
+            {"email": "a@example.com", "password": "password"},
+            {"email": "b@example.com", "password": "short"},
+            {"email": "admin@example.com", "password": "password"},
+            {"email": "a@example.com", "password": "password"},
+        ]
+        body = "\n".join(json.dumps(row) for row in rows) + "\n{not json}\n"
+
+        res = await async_client.post(
+            self.get_url(),
+            content=body,
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+        )
+        assert res.status_code == 200
+        assert res.headers["content-type"] == "application/x-ndjson"
+
+        rows_out = [json.loads(line) for line in res.text.splitlines()]
+        assert [(row["line"], row["status"]) for row in rows_out] == [
+            (1, "created"),
+            (2, "invalid"),
+            (3, "conflict"),
+            (4, "conflict"),
+            (5, "invalid"),
+        ]
+        assert rows_out[0]["user_id"]
+        assert "password" in rows_out[1]["error"]
+
+        emails = await test_session.scalars(select(User.email).order_by(User.email))
+        assert list(emails) == ["a@example.com", "admin@example.com"]
+
+    async def test_import_csv(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+    ):
+        headers = await self.get_headers(async_client, test_session)
+        body = "email,password\r\na@example.com,password\r\nb@example.com\r\n"
+
+        res = await async_client.post(
+            self.get_url(),
+            content=body,
+            headers={**headers, "Content-Type": "text/csv; charset=utf-8"},
+        )
+        assert res.status_code == 200
+
+        rows_out = [json.loads(line) for line in res.text.splitlines()]
+        assert [(row["line"], row["status"]) for row in rows_out] == [
+            (2, "created"),
+            (3, "invalid"),
+        ]
+
+    async def test_import_unsupported_media_type(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+    ):
+        headers = await self.get_headers(async_client, test_session)
+
+        res = await async_client.post(self.get_url(), json=[], headers=headers)
+        assert res.status_code == 415
+
+    async def test_import_forbidden(
+        self,
+        async_client: httpx.AsyncClient,
+        test_session: AsyncSession,
+    ):
+        headers = await self.get_headers(async_client, test_session, is_admin=False)
+
+        res = await async_client.post(
+            self.get_url(),
+            content=b"",
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+        )
+        assert res.status_code == 403
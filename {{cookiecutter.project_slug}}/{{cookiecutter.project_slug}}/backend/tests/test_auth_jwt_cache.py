@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+import uuid
+
+import jwt
+
+from src.config import config
+from src.service.auth.service import AuthService, get_jwt_cache
+
+
+def create_token(**claims) -> str:
+    return jwt.encode(claims, key=config.jwt_secret, algorithm=config.jwt_algorithm)
+
+
+async def test_verified_payload_cached():
+    user_id = uuid.uuid4()
+    token = create_token(
+        sub=str(user_id),
+        exp=datetime.utcnow() + timedelta(minutes=1),
+    )
+    stats_before = get_jwt_cache().stats()
+
+    first = await AuthService.check_jwt_token(token=token)
+    second = await AuthService.check_jwt_token(token=token)
+
+    assert first.unwrap().user_id == user_id
+    assert second.unwrap() is first.unwrap()
+
+    stats = get_jwt_cache().stats()
+    assert stats.misses == stats_before.misses + 1
+    assert stats.hits == stats_before.hits + 1
+
+
+async def test_token_without_exp_not_cached():
+    token = create_token(sub=str(uuid.uuid4()))
+    size_before = len(get_jwt_cache())
+
+    assert (await AuthService.check_jwt_token(token=token)).unwrap()
+    assert len(get_jwt_cache()) == size_before
+
+
+async def test_invalid_token_not_cached():
+    token = create_token(
+        sub=str(uuid.uuid4()),
+        exp=datetime.utcnow() + timedelta(minutes=1),
+    )
+    size_before = len(get_jwt_cache())
+
+    result = await AuthService.check_jwt_token(token=token + "x")
+
+    assert result.error
+    assert len(get_jwt_cache()) == size_before
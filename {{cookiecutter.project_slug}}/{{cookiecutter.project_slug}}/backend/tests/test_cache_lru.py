@@ -0,0 +1,40 @@
+from src.infra.cache.lru import LRUCache
+from tests.base import FakeClock
+
+
+def test_get_hit_and_miss():
+    cache: LRUCache[str, int] = LRUCache(max_size=2, clock=FakeClock())
+
+    assert cache.get("a") is None
+    cache.set("a", 1, expires_at=10)
+    assert cache.get("a") == 1
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.hit_ratio == 0.5
+
+
+def test_entry_expired():
+    clock = FakeClock()
+    cache: LRUCache[str, int] = LRUCache(max_size=2, clock=clock)
+
+    cache.set("a", 1, expires_at=10)
+    clock.now = 10
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_evicted():
+    cache: LRUCache[str, int] = LRUCache(max_size=2, clock=FakeClock())
+
+    cache.set("a", 1, expires_at=10)
+    cache.set("b", 2, expires_at=10)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3, expires_at=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
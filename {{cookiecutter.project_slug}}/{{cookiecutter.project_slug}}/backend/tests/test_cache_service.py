@@ -0,0 +1,164 @@
+import asyncio
+
+import httpx
+from prometheus_client import REGISTRY
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.application.exception import NotFoundError
+from src.infra.application.result import Result
+from src.infra.cache.backend import CacheBackend, MemoryCacheBackend, PgCacheBackend
+from src.infra.cache.service import ServiceCache
+from src.infra.database.models import User
+from src.infra.database.session import Database
+from src.service.user.dto import UserOutDto
+from tests.base import FailingBackend
+
+
+USER = UserOutDto(
+    user_id="5b3d4a39-0f3c-4b9c-9a3e-0f0e6d1b7a11",  # type: ignore[arg-type]
+    email="user@example.com",
+)
+
+
+class Loader:
+    def __init__(self, result: Result) -> None:
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> Result:
+        self.calls += 1
+        await self.release.wait()
+        return self.result
+
+
+def make_cache(backend: CacheBackend | None = None) -> ServiceCache[UserOutDto]:
+    return ServiceCache(
+        backend or MemoryCacheBackend(max_size=10),
+        name="test",
+        model=UserOutDto,
+        ttl=60,
+    )
+
+
+def get_requests(result: str) -> float:
+    labels = {"cache": "test", "result": result}
+    return REGISTRY.get_sample_value("cache_requests_total", labels) or 0.0
+
+
+async def test_success_is_cached():
+    cache = make_cache()
+    load = Loader(Result.ok(USER))
+    hits_before = get_requests("hit")
+
+    assert (await cache.get_or_load("a", load)).unwrap() == USER
+    assert (await cache.get_or_load("a", load)).unwrap() == USER
+
+    assert load.calls == 1
+    assert get_requests("hit") == hits_before + 1
+
+
+async def test_failure_is_not_cached():
+    cache = make_cache()
+    load = Loader(Result.fail(NotFoundError()))
+
+    assert (await cache.get_or_load("a", load)).error
+    assert (await cache.get_or_load("a", load)).error
+    assert load.calls == 2
+
+
+async def test_delete_invalidates():
+    cache = make_cache()
+    load = Loader(Result.ok(USER))
+
+    await cache.get_or_load("a", load)
+    await cache.delete("a")
+    await cache.get_or_load("a", load)
+
+    assert load.calls == 2
+
+
+async def test_concurrent_misses_are_coalesced():
+    cache = make_cache()
+    load = Loader(Result.ok(USER))
+    load.release.clear()
+    coalesced_before = get_requests("coalesced")
+
+    calls = [asyncio.create_task(cache.get_or_load("a", load)) for _ in range(10)]
+    await asyncio.sleep(0)
+    load.release.set()
+    results = await asyncio.gather(*calls)
+
+    assert load.calls == 1
+    assert all(result.unwrap() == USER for result in results)
+    assert get_requests("coalesced") == coalesced_before + 9
+
+
+async def test_waiters_load_when_loading_caller_is_cancelled():
+    cache = make_cache()
+    load = Loader(Result.ok(USER))
+    load.release.clear()
+
+    loading = asyncio.create_task(cache.get_or_load("a", load))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(cache.get_or_load("a", load))
+    await asyncio.sleep(0)
+
+    loading.cancel()
+    await asyncio.sleep(0)
+    load.release.set()
+
+    assert (await waiting).unwrap() == USER
+    assert load.calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await loading
+
+
+async def test_backend_errors_are_misses():
+    cache = make_cache(FailingBackend())
+    load = Loader(Result.ok(USER))
+
+    assert (await cache.get_or_load("a", load)).unwrap() == USER
+    await cache.delete("a")
+    assert load.calls == 1
+
+
+@pytest.mark.clone_database
+async def test_pg_backend(test_database: Database):
+    backend = PgCacheBackend(lambda: test_database.engine, purge_every=1)
+
+    await backend.set("a", b"value", ttl=60)
+    assert await backend.get("a") == b"value"
+
+    await backend.set("a", b"new value", ttl=60)
+    assert await backend.get("a") == b"new value"
+
+    await backend.delete("a")
+    assert await backend.get("a") is None
+
+    await backend.set("b", b"value", ttl=-1)
+    assert await backend.get("b") is None
+
+
+async def test_get_user_me_is_cached(
+    async_client: httpx.AsyncClient,
+    test_session: AsyncSession,
+):
+    user_in = {"email": "user@example.com", "password": "password"}
+    res = await async_client.post("/api/1/users/", json=user_in)
+    assert res.status_code == 201
+
+    res = await async_client.post("/api/1/auth/token", json=user_in)
+    headers = {"Authorization": f"Bearer {res.json()['result']['access_token']}"}
+
+    res = await async_client.get("/api/1/users/me", headers=headers)
+    assert res.status_code == 200
+
+    await test_session.execute(delete(User))
+
+    res = await async_client.get("/api/1/users/me", headers=headers)
+    assert res.status_code == 200
+    assert res.json()["result"]["email"] == user_in["email"]
@@ -0,0 +1,78 @@
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from yarl import URL
+
+from src.config import AppConfig
+from src.infra.database.models import User
+from src.infra.database.session import Database, create_engine
+
+
+async def count_users(engine_config: AppConfig) -> int:
+    engine = create_engine(engine_config)
+    try:
+        async with engine.connect() as connection:
+            return await connection.scalar(select(func.count()).select_from(User))
+    finally:
+        await engine.dispose()
+
+
+def make_user(email: str) -> User:
+    return User(user_id=uuid.uuid4(), email=email, password=b"password")
+
+
+async def create_user(async_client: httpx.AsyncClient) -> None:
+    res = await async_client.post(
+        "/api/1/users/",
+        json={"email": "user@example.com", "password": "password"},
+    )
+    assert res.status_code == 201
+
+
+async def test_commit_is_not_visible_outside_test(
+    async_client: httpx.AsyncClient,
+    test_session: AsyncSession,
+    test_app_config: AppConfig,
+):
+    await create_user(async_client)
+
+    assert await test_session.scalar(select(func.count()).select_from(User)) == 1
+    assert await count_users(test_app_config) == 0
+
+
+async def test_rollback_after_commit_keeps_test_transaction(
+    test_database: Database,
+    test_session: AsyncSession,
+):
+    async with test_database.session_factory() as session:
+        session.add(make_user("committed@example.com"))
+        await session.commit()
+
+        session.add(make_user("rolled-back@example.com"))
+        await session.flush()
+        await session.rollback()
+
+    emails = await test_session.scalars(select(User.email))
+    assert list(emails) == ["committed@example.com"]
+
+
+@pytest.mark.clone_database
+async def test_clone_database_commits(
+    async_client: httpx.AsyncClient,
+    test_database: Database,
+    test_app_config: AppConfig,
+):
+    await create_user(async_client)
+
+    clone_app_config = test_app_config.model_copy(
+        update={
+            "pg_dsn": URL(
+                test_database.engine.url.render_as_string(hide_password=False),
+            ),
+        },
+    )
+    assert await count_users(clone_app_config) == 1
+    assert await count_users(test_app_config) == 0
@@ -0,0 +1,27 @@
+from sqlalchemy import text
+
+from src.config import AppConfig
+from src.infra.database.pool import get_pool_stats
+from src.infra.database.session import create_engine
+
+
+async def test_pool_stats(test_app_config: AppConfig):
+    test_engine = create_engine(test_app_config)
+
+    try:
+        async with test_engine.connect() as connection:
+            await connection.execute(text("select true"))
+
+            stats = get_pool_stats(test_engine)
+            assert stats
+            assert stats.size == test_app_config.pg_pool_size
+            assert stats.checked_out == 1
+            assert stats.checkouts == 1
+            assert stats.waiters == 0
+
+        stats = get_pool_stats(test_engine)
+        assert stats
+        assert stats.checked_out == 0
+        assert stats.checked_in == 1
+    finally:
+        await test_engine.dispose()
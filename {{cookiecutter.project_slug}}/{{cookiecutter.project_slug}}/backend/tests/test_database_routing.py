@@ -0,0 +1,111 @@
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from yarl import URL
+
+from src.config import AppConfig
+from src.infra.application.setup.tracing import trace_id
+from src.infra.database.models import User
+from src.infra.database.routing import ReplicaSet, RoutingSession, primary_only
+from src.infra.database.session import create_engine
+
+
+def get_engine(test_app_config: AppConfig, application_name: str, **props):
+    engine_config = test_app_config.model_copy(
+        update={"pg_server_settings": {"application_name": application_name}},
+    )
+    return create_engine(engine_config, **props)
+
+
+@pytest.fixture
+async def replica_set(test_app_config: AppConfig) -> AsyncIterator[ReplicaSet]:
+    replica_set = ReplicaSet(
+        [get_engine(test_app_config, "replica")],
+        retry_interval=30.0,
+        sticky_ttl=5.0,
+    )
+    yield replica_set
+    await replica_set.dispose()
+
+
+@pytest.fixture
+async def session_factory(
+    test_app_config: AppConfig,
+    replica_set: ReplicaSet,
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    primary = get_engine(test_app_config, "primary")
+    yield async_sessionmaker(
+        bind=primary,
+        sync_session_class=RoutingSession,
+        replica_set=replica_set,
+    )
+    await primary.dispose()
+
+
+async def get_bind_name(session: AsyncSession) -> str:
+    query_result = await session.execute(
+        select(func.current_setting("application_name")),
+    )
+    return query_result.scalar_one()
+
+
+async def test_read_goes_to_replica(session_factory):
+    async with session_factory() as session:
+        assert await get_bind_name(session) == "replica"
+
+
+async def test_read_after_select_for_update_goes_to_primary(session_factory):
+    async with session_factory() as session:
+        await session.execute(select(User).with_for_update())
+        assert await get_bind_name(session) == "primary"
+
+
+async def test_read_after_write_goes_to_primary(session_factory):
+    async with session_factory() as session:
+        await session.execute(text("select 1"))
+        assert await get_bind_name(session) == "primary"
+
+
+async def test_read_in_primary_only_scope_goes_to_primary(session_factory):
+    async with session_factory() as session:
+        with primary_only():
+            assert await get_bind_name(session) == "primary"
+
+        assert await get_bind_name(session) == "replica"
+
+
+async def test_trace_sticks_to_primary_after_write(session_factory):
+    reset_token = trace_id.set("trace-1")
+    try:
+        async with session_factory() as session:
+            await session.execute(text("select 1"))
+
+        async with session_factory() as session:
+            assert await get_bind_name(session) == "primary"
+    finally:
+        trace_id.reset(reset_token)
+
+    async with session_factory() as session:
+        assert await get_bind_name(session) == "replica"
+
+
+async def test_unavailable_replica_falls_back_to_primary(
+    test_app_config: AppConfig,
+    session_factory,
+    replica_set: ReplicaSet,
+):
+    broken_replica = get_engine(
+        test_app_config,
+        "broken",
+        dsn=URL(str(test_app_config.pg_dsn)).with_port(1),
+    )
+    replica_set.engines = [broken_replica]
+
+    async with session_factory() as session:
+        assert await get_bind_name(session) == "primary"
+        assert await get_bind_name(session) == "primary"
+
+    assert replica_set.choose() is None
+    await broken_replica.dispose()
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.database.session import (
+    Database,
+    _session_scope,
+    get_database,
+    scoped_session,
+    session_scope,
+)
+
+
+async def test_session_created_on_first_use(test_session: AsyncSession):
+    async with session_scope():
+        assert _session_scope.get().session is None
+
+        result = await scoped_session.execute(text("select 1"))
+        assert result.scalar() == 1
+
+        session = _session_scope.get().session
+        assert session is not None
+        assert scoped_session() is session
+
+    assert _session_scope.get(None) is None
+
+
+async def test_scopes_are_isolated(test_database: Database):
+    async with session_scope():
+        outer_session = scoped_session()
+
+        async with session_scope():
+            assert scoped_session() is not outer_session
+
+        assert scoped_session() is outer_session
+
+
+async def test_no_scope_raises():
+    with pytest.raises(RuntimeError):
+        scoped_session()
+
+
+async def test_database_not_initialized_raises():
+    with pytest.raises(RuntimeError):
+        get_database()
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infra.application.exception import ServiceUnavailableError
+from src.infra.application.executor import BoundedExecutor
+from src.service.auth.password import PasswordHasher
+
+
+async def test_run_ok():
+    executor = BoundedExecutor(
+        name="test",
+        kind="thread",
+        max_workers=2,
+        max_queue_size=2,
+    )
+
+    assert await executor.run(sum, [1, 2, 3]) == 6
+
+    stats = executor.stats()
+    assert stats.completed == 1
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+
+    executor.shutdown()
+
+
+async def test_run_rejected_when_saturated():
+    executor = BoundedExecutor(
+        name="test",
+        kind="thread",
+        max_workers=1,
+        max_queue_size=1,
+    )
+    release = threading.Event()
+
+    running = [
+        asyncio.create_task(executor.run(release.wait)),
+        asyncio.create_task(executor.run(release.wait)),
+    ]
+    await asyncio.sleep(0)
+
+    assert executor.stats().queue_depth == 1
+
+    with pytest.raises(ServiceUnavailableError):
+        await executor.run(release.wait)
+
+    release.set()
+    await asyncio.gather(*running)
+
+    stats = executor.stats()
+    assert stats.completed == 2
+    assert stats.rejected == 1
+
+    executor.shutdown()
+
+
+async def test_run_in_process_pool():
+    executor = BoundedExecutor(
+        name="test",
+        kind="process",
+        max_workers=1,
+        max_queue_size=1,
+    )
+
+    assert await executor.run(sum, [1, 2, 3]) == 6
+    assert executor.stats().completed == 1
+
+    executor.shutdown()
+
+
+async def test_cancelled_call_keeps_slot_until_done():
+    executor = BoundedExecutor(
+        name="test",
+        kind="thread",
+        max_workers=1,
+        max_queue_size=0,
+    )
+    release = threading.Event()
+
+    running = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+
+    assert executor.stats().in_flight == 1
+    with pytest.raises(ServiceUnavailableError):
+        await executor.run(release.wait)
+
+    release.set()
+    while executor.stats().in_flight:
+        await asyncio.sleep(0.01)
+
+    executor.shutdown()
+
+
+async def test_hash_passwords_stops_on_first_rejection():
+    executor = BoundedExecutor(
+        name="test",
+        kind="thread",
+        max_workers=1,
+        max_queue_size=0,
+    )
+    release = threading.Event()
+    running = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceUnavailableError):
+        await PasswordHasher(executor).hash_passwords(passwords=["a", "b", "c"])
+
+    # the passwords left are not submitted once the first one is rejected
+    assert executor.stats().rejected == 1
+
+    release.set()
+    await running
+    executor.shutdown()
+
+
+async def test_hash_passwords():
+    executor = BoundedExecutor(
+        name="test",
+        kind="thread",
+        max_workers=2,
+        max_queue_size=0,
+    )
+    password_hasher = PasswordHasher(executor)
+
+    hashed_passwords = await password_hasher.hash_passwords(passwords=["a", "b"])
+
+    assert [
+        await password_hasher.check_password(
+            password=password,
+            hashed_password=hashed_password,
+        )
+        for password, hashed_password in zip(["a", "b"], hashed_passwords)
+    ] == [True, True]
+    executor.shutdown()
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+from src import gunicorn_conf
+
+
+def test_workers_count():
+    assert gunicorn_conf.workers >= 1
+    assert gunicorn_conf.wsgi_app == "src.main:create_app()"
+
+
+def test_forwarded_allow_ips():
+    assert gunicorn_conf.forwarded_allow_ips == "127.0.0.1"
+
+
+def test_metrics_files_are_removed(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    for name in ("counter_1.db", "gauge_livesum_1.db", "gauge_livesum_2.db"):
+        (tmp_path / name).touch()
+
+    gunicorn_conf.child_exit(server=None, worker=SimpleNamespace(pid=1))
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "counter_1.db",
+        "gauge_livesum_2.db",
+    ]
+
+    gunicorn_conf.on_starting(server=None)
+    assert not list(tmp_path.iterdir())
+
+
+def test_pre_flight_check_before_workers(monkeypatch):
+    calls = []
+
+    async def pre_flight_check() -> None:
+        calls.append(True)
+
+    monkeypatch.setattr(gunicorn_conf, "pre_flight_check", pre_flight_check)
+
+    gunicorn_conf.when_ready(server=None)
+    assert calls == [True]
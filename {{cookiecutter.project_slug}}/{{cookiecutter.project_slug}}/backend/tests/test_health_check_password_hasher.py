@@ -0,0 +1,50 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infra.application.exception import ServiceUnavailableError
+from src.service.auth.password import get_password_hasher
+from src.service.health_check.checks.password_hasher import PasswordHasherCheck
+
+
+async def test_check_warns_on_rejected_calls():
+    executor = get_password_hasher().executor
+    check = PasswordHasherCheck(
+        component_id="password_hasher:rejected",
+        measurement="rejected",
+    )
+
+    check_result = await check()
+    assert check_result.status == "pass"
+
+    release = threading.Event()
+    running = [
+        asyncio.create_task(executor.run(release.wait))
+        for _ in range(executor.max_workers + executor.max_queue_size)
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceUnavailableError):
+        await executor.run(release.wait)
+
+    release.set()
+    await asyncio.gather(*running)
+
+    check_result = await check()
+    assert check_result.status == "warn"
+    assert check_result.observed_value == executor.stats().rejected
+
+    check_result = await check()
+    assert check_result.status == "pass"
+
+
+async def test_check_reports_wait_time():
+    check = PasswordHasherCheck(
+        component_id="password_hasher:waitTime",
+        measurement="waitTime",
+    )
+
+    check_result = await check()
+    assert check_result.observed_value >= 0
+    assert check_result.observed_unit == "ms"
@@ -0,0 +1,106 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from src.service.health_check.dto import CheckResult
+from src.service.health_check.service import (
+    Check,
+    HealthCheckService,
+    Probe,
+    ProbeCache,
+)
+from tests.base import FakeClock
+
+
+@dataclass
+class CountingCheck(Check):
+    calls: int = 0
+
+    async def __call__(self) -> CheckResult:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return CheckResult(
+            component_id=self.component_id,
+            component_type=self.component_type,
+            observed_value=self.calls,
+            status="pass",
+        )
+
+
+@pytest.fixture
+def check() -> CountingCheck:
+    return CountingCheck(component_id="counter")
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def probe_cache(clock: FakeClock) -> ProbeCache:
+    return ProbeCache(HealthCheckService(), max_stale=10.0, clock=clock)
+
+
+def get_calls(probe_result) -> int:
+    return probe_result.checks["counter"][0].observed_value
+
+
+async def test_fresh_result_is_cached(probe_cache, check, clock):
+    probe = Probe(name="ready", checks=[check], cache_ttl=1.0)
+
+    assert get_calls(await probe_cache.run_probe(probe)) == 1
+    clock.now = 0.5
+    assert get_calls(await probe_cache.run_probe(probe)) == 1
+    assert check.calls == 1
+
+
+async def test_concurrent_callers_share_one_check(probe_cache, check):
+    probe = Probe(name="ready", checks=[check], cache_ttl=1.0)
+
+    results = await asyncio.gather(*(probe_cache.run_probe(probe) for _ in range(10)))
+
+    assert {get_calls(result) for result in results} == {1}
+    assert check.calls == 1
+
+
+async def test_stale_result_is_returned_while_refreshed(probe_cache, check, clock):
+    probe = Probe(name="ready", checks=[check], cache_ttl=1.0)
+    await probe_cache.run_probe(probe)
+
+    clock.now = 2.0
+    assert get_calls(await probe_cache.run_probe(probe)) == 1
+    assert get_calls(await probe_cache.run_probe(probe)) == 1
+
+    await probe_cache.refresh(probe)
+    assert check.calls == 2
+    assert get_calls(await probe_cache.run_probe(probe)) == 2
+
+
+async def test_too_stale_result_is_not_returned(probe_cache, check, clock):
+    probe = Probe(name="ready", checks=[check], cache_ttl=1.0)
+    await probe_cache.run_probe(probe)
+
+    clock.now = 20.0
+    assert get_calls(await probe_cache.run_probe(probe)) == 2
+
+
+async def test_probe_without_ttl_is_not_cached(probe_cache, check):
+    probe = Probe(name="live", checks=[check])
+
+    await probe_cache.run_probe(probe)
+    await probe_cache.run_probe(probe)
+    assert check.calls == 2
+
+
+async def test_refresh_forever(probe_cache, check):
+    probe = Probe(name="ready", checks=[check], cache_ttl=0.01)
+
+    refresher = asyncio.create_task(probe_cache.refresh_forever([probe]))
+    await asyncio.sleep(0.1)
+    refresher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await refresher
+
+    assert check.calls > 1
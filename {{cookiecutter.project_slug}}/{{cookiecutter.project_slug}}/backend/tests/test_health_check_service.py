@@ -0,0 +1,66 @@
+import asyncio
+from dataclasses import dataclass
+
+from src.service.health_check.checks.pg import PgCheck
+from src.service.health_check.dto import CheckResult
+from src.service.health_check.service import Check, HealthCheckService, Probe
+
+
+@dataclass
+class StaticCheck(Check):
+    status: str = "pass"
+    delay: float = 0.0
+
+    async def __call__(self) -> CheckResult:
+        await asyncio.sleep(self.delay)
+        return CheckResult(
+            component_id=self.component_id,
+            component_type=self.component_type,
+            status=self.status,
+        )
+
+
+async def test_timed_out_check_fails():
+    probe = Probe(
+        name="ready",
+        checks=[StaticCheck(component_id="slow", delay=1.0, timeout=0.01)],
+    )
+
+    probe_result = await HealthCheckService().run_probe(probe)
+
+    assert probe_result.status.code == 503
+    assert probe_result.checks["slow"][0].status == "fail"
+    assert probe_result.checks["slow"][0].output
+
+
+async def test_fail_takes_precedence_over_warn():
+    probe = Probe(
+        name="ready",
+        checks=[
+            StaticCheck(component_id="warn", status="warn"),
+            StaticCheck(component_id="fail", status="fail"),
+        ],
+    )
+
+    probe_result = await HealthCheckService().run_probe(probe)
+
+    assert probe_result.status.name == "fail"
+
+
+async def test_pg_check_reports_response_time(test_session):
+    check_result = await PgCheck(component_id="pg:responseTime")()
+    assert check_result.status != "fail"
+    assert check_result.observed_value >= 0
+    assert check_result.observed_unit == "ms"
+
+    check_result = await PgCheck(
+        component_id="pg:responseTime",
+        warn_response_time=0.0,
+    )()
+    assert check_result.status == "warn"
+
+    check_result = await PgCheck(
+        component_id="pg:responseTime",
+        fail_response_time=0.0,
+    )()
+    assert check_result.status == "fail"
@@ -0,0 +1,151 @@
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+
+from src.infra.application.setup.logging import (
+    JsonFormatter,
+    LogPipeline,
+    LogQueue,
+    SamplingFilter,
+)
+from src.infra.application.setup.tracing import trace_id
+
+
+def make_record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+def test_queue_drops_oldest():
+    log_queue = LogQueue(max_size=2, overflow_policy="drop_oldest")
+
+    for msg in ("a", "b", "c"):
+        log_queue.put_nowait(make_record(msg))
+
+    assert [record.msg for record in log_queue.drain()] == ["b", "c"]
+    assert log_queue.stats().dropped == 1
+
+
+def test_queue_drops_debug():
+    log_queue = LogQueue(max_size=1, overflow_policy="drop_debug")
+    log_queue.put_nowait(make_record("a"))
+
+    log_queue.put_nowait(make_record("b", logging.DEBUG))
+    assert log_queue.stats().dropped == 1
+
+    threading.Timer(0.05, log_queue.drain).start()
+    log_queue.put_nowait(make_record("c", logging.WARNING))
+
+    assert [record.msg for record in log_queue.drain()] == ["c"]
+    assert log_queue.stats().dropped == 1
+
+
+def test_queue_blocks_until_drained():
+    log_queue = LogQueue(max_size=1, overflow_policy="block")
+    log_queue.put_nowait(make_record("a"))
+
+    threading.Timer(0.05, log_queue.drain).start()
+    started_at = time.monotonic()
+    log_queue.put_nowait(make_record("b"))
+
+    assert time.monotonic() - started_at >= 0.04
+    assert [record.msg for record in log_queue.drain()] == ["b"]
+    assert log_queue.stats().dropped == 0
+
+
+def test_pipeline_writes_records_with_trace_id():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(trace_id)s %(message)s"))
+    pipeline = LogPipeline(
+        handler,
+        queue=LogQueue(max_size=16),
+        flush_interval=10.0,
+    )
+
+    logger = logging.getLogger("test_pipeline")
+    logger.propagate = False
+    logger.addHandler(pipeline.queue_handler)
+    pipeline.start()
+    try:
+        reset_token = trace_id.set("trace-1")
+        logger.warning("hello %s", "world")
+        trace_id.reset(reset_token)
+        logger.warning("bye")
+    finally:
+        pipeline.stop()
+        logger.removeHandler(pipeline.queue_handler)
+
+    assert stream.getvalue() == "trace-1 hello world\n- bye\n"
+
+
+def test_pipeline_restarts_writer_after_fork(tmp_path):
+    log_path = tmp_path / "log"
+    with open(log_path, "w") as stream:
+        pipeline = LogPipeline(
+            logging.StreamHandler(stream),
+            queue=LogQueue(max_size=16),
+            flush_interval=0.01,
+        )
+
+        logger = logging.getLogger("test_pipeline_fork")
+        logger.propagate = False
+        logger.addHandler(pipeline.queue_handler)
+        pipeline.start()
+        try:
+            if (pid := os.fork()) == 0:
+                logger.warning("child")
+                time.sleep(0.2)
+                os._exit(0)
+
+            _, wait_status = os.waitpid(pid, 0)
+        finally:
+            pipeline.stop()
+            logger.removeHandler(pipeline.queue_handler)
+
+    assert os.waitstatus_to_exitcode(wait_status) == 0
+    assert log_path.read_text() == "child\n"
+
+
+def test_json_formatter():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 0, "hello %s", ("world",), sys.exc_info()
+        )
+    record.trace_id = "trace-1"
+    record.user_id = uuid.UUID(int=1)
+
+    log_entry = json.loads(JsonFormatter().format(record))
+
+    assert log_entry["level"] == "ERROR"
+    assert log_entry["logger"] == "test"
+    assert log_entry["message"] == "hello world"
+    assert log_entry["trace_id"] == "trace-1"
+    assert log_entry["user_id"] == str(uuid.UUID(int=1))
+    assert "ValueError: boom" in log_entry["exc_info"]
+    assert log_entry["time"]
+
+
+def test_sampling_filter():
+    sampling_filter = SamplingFilter(
+        {"src.service": 0.0, "src.service.user:INFO": 0.5, "src.api": 1.0},
+        sample=lambda: 0.25,
+    )
+
+    def passes(name: str, level: int) -> bool:
+        return sampling_filter.filter(
+            logging.LogRecord(name, level, __file__, 0, "", None, None),
+        )
+
+    assert not passes("src.service.auth", logging.INFO)
+    assert not passes("src.service.user.service", logging.DEBUG)
+    assert passes("src.service.user.service", logging.INFO)
+    assert passes("src.service.auth", logging.WARNING)
+    assert passes("src.api.rest", logging.INFO)
+    assert passes("src.infra", logging.DEBUG)
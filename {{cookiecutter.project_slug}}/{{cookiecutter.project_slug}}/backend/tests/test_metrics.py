@@ -0,0 +1,127 @@
+import logging
+import subprocess
+import sys
+
+import httpx
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from src.config import AppConfig
+from src.infra.application.setup.logging import LogPipeline, LogQueue
+from src.infra.application.setup.metrics import MetricsSampler
+from src.infra.database.session import (
+    Database,
+    create_engine,
+    scoped_session,
+    session_scope,
+)
+from src.infra.metrics import render_metrics
+
+
+def get_sample_value(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+async def test_requests_are_counted_by_route_template(async_client: httpx.AsyncClient):
+    live_labels = {"method": "GET", "route": "/api/0/health/live", "status": "200"}
+    unmatched_labels = {"method": "GET", "route": "<unmatched>", "status": "404"}
+
+    requests_before = get_sample_value("http_requests_total", **live_labels)
+    unmatched_before = get_sample_value("http_requests_total", **unmatched_labels)
+
+    assert (await async_client.get("/api/0/health/live")).status_code == 200
+    assert (await async_client.get("/api/0/health/missing")).status_code == 404
+
+    assert get_sample_value("http_requests_total", **live_labels) == (
+        requests_before + 1
+    )
+    assert get_sample_value("http_request_duration_seconds_count", **live_labels)
+    assert get_sample_value("http_requests_total", **unmatched_labels) == (
+        unmatched_before + 1
+    )
+
+
+async def test_get_metrics(async_client: httpx.AsyncClient):
+    await async_client.get("/api/0/health/live")
+
+    res = await async_client.get("/api/0/metrics")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/0/health/live"' in res.text
+    assert "db_session_lifetime_seconds_count" in res.text
+
+
+async def test_session_lifetime_is_observed(test_database: Database):
+    observed_before = get_sample_value("db_session_lifetime_seconds_count")
+
+    async with session_scope():
+        pass
+    assert get_sample_value("db_session_lifetime_seconds_count") == observed_before
+
+    async with session_scope():
+        scoped_session()
+    assert get_sample_value("db_session_lifetime_seconds_count") == (
+        observed_before + 1
+    )
+
+
+async def test_sampler(test_app_config: AppConfig, monkeypatch):
+    engine = create_engine(test_app_config)
+    log_queue = LogQueue(max_size=1)
+    log_pipeline = LogPipeline(
+        logging.StreamHandler(),
+        queue=log_queue,
+        flush_interval=1.0,
+    )
+    monkeypatch.setattr(
+        "src.infra.application.setup.logging._log_pipeline",
+        log_pipeline,
+    )
+    sampler = MetricsSampler({"test": engine}, interval=1.0)
+    dropped_before = get_sample_value("log_records_dropped_total")
+
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            for _ in range(3):
+                log_queue.put_nowait(logging.makeLogRecord({"msg": "message"}))
+
+            sampler.sample()
+            assert get_sample_value(
+                "db_pool_connections",
+                engine="test",
+                state="checked_out",
+            ) == 1
+            assert get_sample_value("log_queue_size") == 1
+            assert get_sample_value("log_records_dropped_total") == (
+                dropped_before + 2
+            )
+
+        sampler.sample()
+        assert get_sample_value(
+            "db_pool_connections",
+            engine="test",
+            state="checked_out",
+        ) == 0
+        assert get_sample_value("log_records_dropped_total") == dropped_before + 2
+    finally:
+        await engine.dispose()
+
+
+def test_metrics_are_aggregated_across_processes(tmp_path, monkeypatch):
+    increment = (
+        "from src.infra import metrics\n"
+        "metrics.http_requests_total.labels('GET', '/workers', '200').inc()\n"
+    )
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, "-c", increment],
+            env={"PROMETHEUS_MULTIPROC_DIR": str(tmp_path)},
+            check=True,
+        )
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    assert (
+        b'http_requests_total{method="GET",route="/workers",status="200"} 2.0'
+        in render_metrics()
+    )
@@ -4,14 +4,21 @@ methods, typos and many other errors.
 
 Does not require any maintenance: you just add it once to check the most of
 generic typos and mistakes in migrations forever.
+
+Every revision is a separate test, so the stairway is spread over the
+pytest-xdist workers. A worker walks the revisions in a database of its own
+and gets the ones it runs in any order.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterator
 
 import alembic.command
 import alembic.config
 from alembic.script import ScriptDirectory, Script
+import pytest
 
-from tests.base import get_test_alembic_config, get_test_app_config
+from src.config import AppConfig
+from tests.base import get_test_alembic_config, get_test_app_config, temporary_database
 
 
 _previous_revision_ident: str = "-1"
@@ -76,37 +83,65 @@ def _linearize_down_alembic_revisions(
     return return_value
 
 
-def pytest_generate_tests(metafunc):
-    test_app_config = get_test_app_config()
-    test_alembic_config = get_test_alembic_config(test_app_config)
-
-    alembic_revisions = get_alembic_revisions_from_config(
-        alembic_config=test_alembic_config
+def get_alembic_revisions() -> list[Revision]:
+    return get_alembic_revisions_from_config(
+        alembic_config=get_test_alembic_config(get_test_app_config()),
     )
-    argvalues = [
-        (
-            test_alembic_config,
-            revision,
+
+
+@dataclass
+class Stairway:
+    alembic_config: alembic.config.Config
+    revisions: list[Revision]
+    current: str = _previous_revision_ident
+    _order: dict[str, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._order = {
+            _previous_revision_ident: -1,
+            **{revision.revision: i for i, revision in enumerate(self.revisions)},
+        }
+
+    def step(self, revision: Revision) -> None:
+        """
+        Upgrades to the revision, downgrades to the previous one and upgrades
+        again. If the database is past the revision, it is downgraded to the
+        previous one first.
+        """
+        if self._order[self.current] > self._order[revision.revision]:
+            alembic.command.downgrade(
+                self.alembic_config,
+                (
+                    "base"
+                    if revision.down_revision == _previous_revision_ident
+                    else revision.down_revision
+                ),
+            )
+
+        alembic.command.upgrade(self.alembic_config, revision.revision)
+        alembic.command.downgrade(self.alembic_config, revision.down_revision)
+        alembic.command.upgrade(self.alembic_config, revision.revision)
+        self.current = revision.revision
+
+
+@pytest.fixture(scope="session")
+def stairway(test_app_config: AppConfig) -> Iterator[Stairway]:
+    with temporary_database(test_app_config, "stairway") as stairway_app_config:
+        yield Stairway(
+            alembic_config=get_test_alembic_config(stairway_app_config),
+            revisions=get_alembic_revisions(),
         )
-        for revision in alembic_revisions
-    ]
+
+
+def pytest_generate_tests(metafunc):
+    alembic_revisions = get_alembic_revisions()
     idlist = [
         f"{revision.revision}: {revision.docu.lower()}"
         for revision in alembic_revisions
     ]
 
-    metafunc.parametrize(
-        ["test_alembic_config", "revision"],
-        argvalues,
-        ids=idlist,
-        scope="session",
-    )
+    metafunc.parametrize("revision", alembic_revisions, ids=idlist)
 
 
-def test_migration_stairway(
-    test_alembic_config: alembic.config.Config,
-    revision: Revision,
-):
-    alembic.command.upgrade(test_alembic_config, revision.revision)
-    alembic.command.downgrade(test_alembic_config, revision.down_revision)
-    alembic.command.upgrade(test_alembic_config, revision.revision)
+def test_migration_stairway(stairway: Stairway, revision: Revision):
+    stairway.step(revision)
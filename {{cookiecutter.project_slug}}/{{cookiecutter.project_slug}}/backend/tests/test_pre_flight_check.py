@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+from yarl import URL
+
+from src.config import AppConfig
+from src.infra.application.pre_flight_check import (
+    Dependency,
+    wait_for_dependency,
+    wait_for_deps,
+)
+from src.infra.database.ping import is_retryable_error, ping
+from src.infra.database.session import create_engine
+
+
+class FlakyPing:
+    def __init__(self, failures: int, exc: Exception | None = None) -> None:
+        self.failures = failures
+        self.exc = exc or ConnectionRefusedError()
+        self.calls = 0
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exc
+
+
+class NonRetryableError(Exception):
+    sqlstate = "28P01"
+
+
+@pytest.fixture
+def pre_flight_config(test_app_config: AppConfig) -> AppConfig:
+    return test_app_config.model_copy(
+        update={
+            "pre_flight_timeout": 1.0,
+            "pre_flight_initial_wait": 0.001,
+            "pre_flight_max_wait": 0.01,
+        },
+    )
+
+
+async def test_retries_until_ready(pre_flight_config: AppConfig):
+    flaky_ping = FlakyPing(failures=3)
+
+    await wait_for_dependency(Dependency("flaky", flaky_ping), pre_flight_config)
+
+    assert flaky_ping.calls == 4
+
+
+async def test_gives_up_after_timeout(pre_flight_config: AppConfig):
+    flaky_ping = FlakyPing(failures=1_000_000)
+
+    started_at = time.monotonic()
+    with pytest.raises(ConnectionRefusedError):
+        await wait_for_dependency(Dependency("down", flaky_ping), pre_flight_config)
+
+    assert 1.0 <= time.monotonic() - started_at < 2.0
+
+
+async def test_non_retryable_error_fails_at_once(pre_flight_config: AppConfig):
+    flaky_ping = FlakyPing(failures=1, exc=NonRetryableError())
+    dependency = Dependency("auth", flaky_ping, is_retryable=is_retryable_error)
+
+    with pytest.raises(NonRetryableError):
+        await wait_for_dependency(dependency, pre_flight_config)
+
+    assert flaky_ping.calls == 1
+
+
+async def test_dependencies_are_checked_in_parallel(pre_flight_config: AppConfig):
+    slow_ping = FlakyPing(failures=0)
+    down_ping = FlakyPing(failures=1_000_000)
+
+    async def ping_slowly() -> None:
+        await asyncio.sleep(0.2)
+        await slow_ping()
+
+    started_at = time.monotonic()
+    await wait_for_deps(
+        [Dependency("slow", ping_slowly), Dependency("slow too", ping_slowly)],
+        pre_flight_config,
+    )
+    assert time.monotonic() - started_at < 0.4
+
+    auth_ping = FlakyPing(failures=1, exc=NonRetryableError())
+    with pytest.raises(ExceptionGroup):
+        await wait_for_deps(
+            [
+                Dependency("down", down_ping),
+                Dependency("auth", auth_ping, is_retryable=is_retryable_error),
+            ],
+            pre_flight_config,
+        )
+    # the failed dependency cancels waiting for the other one
+    assert down_ping.calls < 10
+
+
+async def test_unknown_database_is_not_retryable(test_app_config: AppConfig):
+    dsn = URL(str(test_app_config.pg_dsn)).with_path("/unknown_database")
+    engine = create_engine(test_app_config, dsn)
+
+    try:
+        with pytest.raises(Exception) as exc_info:
+            await ping(engine)
+    finally:
+        await engine.dispose()
+
+    assert not is_retryable_error(exc_info.value)
@@ -0,0 +1,164 @@
+import httpx
+from prometheus_client import REGISTRY
+import pytest
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from src.infra.database.session import Database
+from src.infra.ratelimit.backend import MemoryRateLimitBackend, PgRateLimitBackend
+from src.infra.ratelimit.limiter import RateLimiter
+from src.service.auth.throttle import LoginThrottle, get_login_throttle
+from tests.base import FailingBackend, FakeClock
+
+
+USER_IN = {"email": "user@example.com", "password": "password"}
+
+
+def get_rejected(limiter: str) -> float:
+    labels = {"limiter": limiter}
+    return REGISTRY.get_sample_value("rate_limit_rejected_total", labels) or 0.0
+
+
+async def test_memory_backend_token_bucket():
+    clock = FakeClock(now=1000.0)
+    backend = MemoryRateLimitBackend(max_size=10, clock=clock)
+
+    assert [await backend.acquire("a", rate=0.5, burst=3) for _ in range(3)] == [
+        0.0,
+        0.0,
+        0.0,
+    ]
+    assert await backend.acquire("a", rate=0.5, burst=3) == pytest.approx(2.0)
+    assert await backend.acquire("b", rate=0.5, burst=3) == 0.0
+
+    clock.now += 1
+    assert await backend.acquire("a", rate=0.5, burst=3) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert await backend.acquire("a", rate=0.5, burst=3) == 0.0
+    assert await backend.acquire("a", rate=0.5, burst=3) == pytest.approx(2.0)
+
+    # refills up to the burst only
+    clock.now += 3600
+    for _ in range(3):
+        assert await backend.acquire("a", rate=0.5, burst=3) == 0.0
+    assert await backend.acquire("a", rate=0.5, burst=3) == pytest.approx(2.0)
+
+
+async def test_limiter_counts_rejected():
+    limiter = RateLimiter(
+        MemoryRateLimitBackend(max_size=10),
+        name="test",
+        rate=0.001,
+        burst=1,
+    )
+    rejected_before = get_rejected("test")
+
+    assert await limiter.acquire("a") == 0.0
+    assert await limiter.acquire("a") > 0
+    assert get_rejected("test") == rejected_before + 1
+
+
+async def test_limiter_disabled():
+    limiter = RateLimiter(FailingBackend(), name="test", rate=0, burst=1)
+
+    assert await limiter.acquire("a") == 0.0
+
+
+async def test_limiter_backend_errors_allow():
+    limiter = RateLimiter(FailingBackend(), name="test", rate=1, burst=1)
+
+    assert await limiter.acquire("a") == 0.0
+
+
+@pytest.mark.clone_database
+async def test_pg_backend(test_database: Database):
+    backend = PgRateLimitBackend(lambda: test_database.engine, purge_every=1)
+
+    assert await backend.acquire("a", rate=0.001, burst=2) == 0.0
+    assert await backend.acquire("a", rate=0.001, burst=2) == 0.0
+    assert await backend.acquire("a", rate=0.001, burst=2) == pytest.approx(
+        1000.0,
+        rel=0.01,
+    )
+    assert await backend.acquire("b", rate=0.001, burst=2) == 0.0
+
+    # refilled by the database clock
+    assert await backend.acquire("c", rate=1000, burst=1) == 0.0
+    assert await backend.acquire("c", rate=1000, burst=1) < 0.002
+
+
+class TestLoginThrottle:
+    @pytest.fixture
+    def throttle(self, test_app):
+        throttle = LoginThrottle(
+            MemoryRateLimitBackend(max_size=10),
+            ip_rate=0.001,
+            ip_burst=3,
+            email_rate=0.001,
+            email_burst=2,
+        )
+        test_app.dependency_overrides[get_login_throttle] = lambda: throttle
+        yield throttle
+        test_app.dependency_overrides.pop(get_login_throttle)
+
+    async def test_email_throttled(
+        self,
+        async_client: httpx.AsyncClient,
+        throttle: LoginThrottle,
+    ):
+        res = await async_client.post("/api/1/users/", json=USER_IN)
+        assert res.status_code == 201
+
+        for _ in range(2):
+            res = await async_client.post("/api/1/auth/token", json=USER_IN)
+            assert res.status_code == 200
+
+        res = await async_client.post("/api/1/auth/token", json=USER_IN)
+        assert res.status_code == 429
+        assert 0 < int(res.headers["Retry-After"]) <= 1000
+
+        form = {"username": "USER@example.com", "password": "password"}
+        res = await async_client.post("/api/1/auth/login", data=form)
+        assert res.status_code == 429
+
+    async def test_ip_throttled(
+        self,
+        async_client: httpx.AsyncClient,
+        throttle: LoginThrottle,
+    ):
+        for index in range(3):
+            user_in = {"email": f"user{index}@example.com", "password": "password"}
+            res = await async_client.post("/api/1/auth/token", json=user_in)
+            assert res.status_code == 400
+
+        user_in = {"email": "other@example.com", "password": "password"}
+        res = await async_client.post("/api/1/auth/token", json=user_in)
+        assert res.status_code == 429
+        assert "Retry-After" in res.headers
+
+        # rejected by the ip bucket, the email bucket is left full
+        assert await throttle.email_limiter.acquire("other@example.com") == 0.0
+
+    async def test_forwarded_client_ip(
+        self,
+        test_app,
+        test_database: Database,
+        throttle: LoginThrottle,
+    ):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(
+                app=ProxyHeadersMiddleware(test_app, trusted_hosts=["127.0.0.1"]),
+            ),
+            base_url="http://test",
+        ) as client:
+            for client_ip in ("10.0.0.1", "10.0.0.2"):
+                for index in range(3):
+                    res = await client.post(
+                        "/api/1/auth/token",
+                        json={
+                            "email": f"user{index}@{client_ip}.example.com",
+                            "password": "password",
+                        },
+                        headers={"X-Forwarded-For": client_ip},
+                    )
+                    assert res.status_code == 400
@@ -0,0 +1,67 @@
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.service.user.repository import UserRepository
+
+
+def make_users(*emails: str) -> list[dict]:
+    return [
+        {"user_id": uuid.uuid4(), "email": email, "password": b"password"}
+        for email in emails
+    ]
+
+
+async def test_create_records_reports_conflicts(test_session: AsyncSession):
+    user_repo = UserRepository()
+
+    created = await user_repo.create_users(
+        session=test_session,
+        users=make_users("a@example.com"),
+    )
+    assert len(created.unwrap().created) == 1
+
+    created = await user_repo.create_users(
+        session=test_session,
+        users=make_users("a@example.com", "b@example.com", "b@example.com"),
+    )
+
+    bulk_result = created.unwrap()
+    assert [user.email for user in bulk_result.created] == ["b@example.com"]
+    assert bulk_result.conflicts == [0, 2]
+
+
+async def test_create_records_via_copy(test_session: AsyncSession):
+    user_repo = UserRepository()
+    users = make_users("a@example.com", "b@example.com")
+
+    await user_repo.create_users(session=test_session, users=users[:1])
+
+    created = await user_repo.create_records(
+        session=test_session,
+        records=users,
+        key="email",
+        copy_threshold=1,
+    )
+
+    bulk_result = created.unwrap()
+    assert [user.email for user in bulk_result.created] == ["b@example.com"]
+    assert bulk_result.conflicts == [0]
+    assert bulk_result.created[0].id
+    assert bulk_result.created[0].created_at
+
+
+async def test_get_records_by(test_session: AsyncSession):
+    user_repo = UserRepository()
+    await user_repo.create_users(
+        session=test_session,
+        users=make_users("a@example.com", "b@example.com"),
+    )
+
+    users_found = await user_repo.get_users_by_emails(
+        session=test_session,
+        emails=["a@example.com", "c@example.com"],
+    )
+
+    assert list(users_found) == ["a@example.com"]
+    assert await user_repo.get_users_by_emails(session=test_session, emails=[]) == {}
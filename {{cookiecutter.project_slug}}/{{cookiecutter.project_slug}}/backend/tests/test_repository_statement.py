@@ -0,0 +1,85 @@
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.application.exception import AlreadyExistsError, BadRequestError
+from src.infra.database.models import User
+from src.infra.database.repository import _get_insert_statement, _get_select_statement
+from src.service.user.repository import UserRepository
+
+
+def test_statements_are_cached():
+    assert _get_select_statement(User, ("email",), (), False) is (
+        _get_select_statement(User, ("email",), (), False)
+    )
+    assert _get_select_statement(User, ("email",), (), False) is not (
+        _get_select_statement(User, ("email",), (), True)
+    )
+    assert _get_insert_statement(User, ("email", "user_id")) is (
+        _get_insert_statement(User, ("email", "user_id"))
+    )
+    assert _get_insert_statement(User, ("email", "user_id"), ("email",)) is (
+        _get_insert_statement(User, ("email", "user_id"), ("email",))
+    )
+
+
+async def test_get_record_with_cached_statement(test_session: AsyncSession):
+    user_repo = UserRepository()
+    user_ids = {"a@example.com": uuid.uuid4(), "b@example.com": uuid.uuid4()}
+
+    for email, user_id in user_ids.items():
+        created = await user_repo.create_record(
+            session=test_session,
+            user_id=user_id,
+            email=email,
+            password=b"password",
+        )
+        assert created.unwrap().email == email
+
+    for email in ("a@example.com", "b@example.com"):
+        user_found = await user_repo.get_user_by_email(
+            session=test_session,
+            email=email,
+        )
+        assert user_found.unwrap().email == email
+
+    user_found = await user_repo.get_record(
+        session=test_session,
+        user_id=user_ids["b@example.com"],
+        email="b@example.com",
+    )
+    assert user_found.unwrap().user_id == user_ids["b@example.com"]
+
+    user_found = await user_repo.get_record(session=test_session, email=None)
+    assert user_found.error
+
+
+async def test_create_record_if_absent(test_session: AsyncSession):
+    user_repo = UserRepository()
+    user_id = uuid.uuid4()
+
+    created = await user_repo.create_user(
+        session=test_session,
+        user_id=user_id,
+        email="a@example.com",
+        password=b"password",
+    )
+    assert created.unwrap().user_id == user_id
+
+    created = await user_repo.create_user(
+        session=test_session,
+        user_id=uuid.uuid4(),
+        email="a@example.com",
+        password=b"password",
+    )
+    assert isinstance(created.error, AlreadyExistsError)
+
+    # conflicts on other constraints are not skipped
+    created = await user_repo.create_user(
+        session=test_session,
+        user_id=user_id,
+        email="b@example.com",
+        password=b"password",
+    )
+    assert isinstance(created.error, BadRequestError)
+    assert not isinstance(created.error, AlreadyExistsError)
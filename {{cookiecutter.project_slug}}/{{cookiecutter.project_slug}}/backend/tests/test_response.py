@@ -0,0 +1,29 @@
+import json
+import uuid
+
+from fastapi import FastAPI
+
+from src.infra.application.response import ModelResponse, Response
+from src.service.user.dto import UserOutDto
+
+
+def test_model_response_renders_model():
+    user = UserOutDto(user_id=uuid.uuid4(), email="user@example.com")
+
+    response = ModelResponse(Response(result=user), status_code=201)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == {
+        "result": {"user_id": str(user.user_id), "email": "user@example.com"},
+    }
+
+
+def test_model_response_renders_plain_content():
+    response = ModelResponse({"status": "pass"})
+
+    assert json.loads(response.body) == {"status": "pass"}
+
+
+def test_default_response_class_is_configured(test_app: FastAPI):
+    assert test_app.router.default_response_class.__name__ == "ORJSONResponse"
@@ -0,0 +1,71 @@
+import asyncio
+from typing import AsyncIterator, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.application.result import Result
+from src.infra.database.session import Database, scoped_session, session_scope
+from src.service.auth.password import get_password_hasher
+from src.service.auth.service import AuthService
+from src.service.user.dto import UserImportRowInDto, UserInDto
+from src.service.user.exception import EmailTakenError
+from src.service.user.repository import UserRepository
+from src.service.user.service import UserService
+
+
+def get_user_service() -> UserService:
+    return UserService(
+        user_repo=UserRepository(),
+        auth_service=AuthService(
+            user_repo=UserRepository(),
+            password_hasher=get_password_hasher(),
+        ),
+    )
+
+
+@pytest.mark.clone_database
+async def test_concurrent_create_same_email(test_database: Database):
+    user_service = get_user_service()
+
+    async def create_user() -> Result:
+        async with session_scope():
+            return await user_service.create_user(
+                session=cast(AsyncSession, scoped_session),
+                user_in=UserInDto(email="user@example.com", password="password"),
+            )
+
+    results = await asyncio.gather(create_user(), create_user())
+
+    assert sorted(result.error is None for result in results) == [False, True]
+    assert any(isinstance(result.error, EmailTakenError) for result in results)
+
+
+async def test_import_users_in_batches(test_database: Database):
+    emails = ["a@example.com", "b@example.com", "a@example.com", "c@example.com"]
+
+    async def rows() -> AsyncIterator[UserImportRowInDto]:
+        for line, email in enumerate(emails, start=1):
+            yield UserImportRowInDto(
+                line=line,
+                user_in=UserInDto(email=email, password="password"),
+            )
+        yield UserImportRowInDto(line=len(emails) + 1, error="invalid row")
+
+    async with session_scope():
+        rows_out = [
+            row_out
+            async for row_out in get_user_service().import_users(
+                session=cast(AsyncSession, scoped_session),
+                rows=rows(),
+                batch_size=2,
+            )
+        ]
+
+    assert [(row_out.line, row_out.status) for row_out in rows_out] == [
+        (1, "created"),
+        (2, "created"),
+        (3, "conflict"),
+        (4, "created"),
+        (5, "invalid"),
+    ]
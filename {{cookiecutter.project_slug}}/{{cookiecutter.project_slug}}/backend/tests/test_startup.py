@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+
+
+# CPU time rather than wall time, so parallel test workers do not make it
+# flaky; generous enough for a slow CI runner, the app takes ~1.5 s on one
+TIME_TO_FIRST_REQUEST_BUDGET = 5.0
+
+RESULT_PREFIX = "startup: "
+
+# modules which must not be imported by creating the app, they are imported
+# on startup or when enabled
+LAZY_MODULES = ("asyncpg", "sentry_sdk", "tenacity", "uvicorn")
+
+FIRST_REQUEST = """
+import time
+
+started_at = time.process_time()
+
+import asyncio
+import json
+import sys
+
+import httpx
+
+from src.main import create_app
+
+
+async def main():
+    app = create_app()
+    imported_modules = sorted(sys.modules)
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/api/0/health/live")
+            response.raise_for_status()
+
+    return imported_modules
+
+
+imported_modules = asyncio.run(main())
+result = {
+    "cpu_time": time.process_time() - started_at,
+    "imported_modules": imported_modules,
+}
+print("startup: " + json.dumps(result))
+"""
+
+
+def run_first_request() -> dict:
+    process = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST],
+        env={**os.environ, "DEBUG": "false", "SENTRY_DSN": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in process.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line.removeprefix(RESULT_PREFIX))
+
+    raise AssertionError(f"no result in the output: {process.stdout}")
+
+
+def test_startup():
+    result = run_first_request()
+
+    assert result["cpu_time"] < TIME_TO_FIRST_REQUEST_BUDGET
+    assert not set(LAZY_MODULES) & set(result["imported_modules"])
@@ -0,0 +1,29 @@
+from fastapi.testclient import TestClient
+
+from src.config import AppConfig
+from tests.base import BaseTestCase
+
+
+class TestTracingMiddleware(BaseTestCase):
+    base_url: str = "/api/0/health/live"
+
+    async def test_trace_id_generated(
+        self,
+        client: TestClient,
+        test_app_config: AppConfig,
+    ):
+        res = client.get(self.get_url())
+        assert res.status_code == 200
+        assert res.headers[test_app_config.trace_header_name]
+
+    async def test_trace_id_propagated(
+        self,
+        client: TestClient,
+        test_app_config: AppConfig,
+    ):
+        res = client.get(
+            self.get_url(),
+            headers={test_app_config.trace_header_name: "given-trace-id"},
+        )
+        assert res.status_code == 200
+        assert res.headers[test_app_config.trace_header_name] == "given-trace-id"